@@ -0,0 +1,28 @@
+"""_0004_Add timestamps on todo table
+
+Revision ID: 5e0c3b9a7d21
+Revises: 73b87d218b69
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e0c3b9a7d21"
+down_revision = "73b87d218b69"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # NOTE: Existing rows are stamped with the migration time, the model provides the value afterwards
+    for column in ("created_at", "updated_at"):
+        op.add_column("todo", sa.Column(column, sa.DateTime(), nullable=False, server_default=sa.func.now()))
+        op.alter_column("todo", column, server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column("todo", "updated_at")
+    op.drop_column("todo", "created_at")
@@ -0,0 +1,59 @@
+"""_0005_Add search on todo table
+
+Revision ID: 9c41d2e8f6a3
+Revises: 5e0c3b9a7d21
+Create Date: 2026-10-18 15:47:09.532817
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9c41d2e8f6a3"
+down_revision = "5e0c3b9a7d21"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "todo",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_todo_search_vector", "todo", ["search_vector"], unique=False, postgresql_using="gin")
+    op.create_index(
+        "ix_todo_title_trgm",
+        "todo",
+        ["title"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_todo_description_trgm",
+        "todo",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_todo_description_trgm", table_name="todo")
+    op.drop_index("ix_todo_title_trgm", table_name="todo")
+    op.drop_index("ix_todo_search_vector", table_name="todo")
+    op.drop_column("todo", "search_vector")
+    # NOTE: `pg_trgm` is left installed, other tables may rely on it
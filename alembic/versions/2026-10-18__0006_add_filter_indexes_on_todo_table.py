@@ -0,0 +1,68 @@
+"""_0006_Add filter indexes on todo table
+
+Revision ID: 9b5911aad884
+Revises: 9c41d2e8f6a3
+Create Date: 2026-10-18 18:17:40.061780
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b5911aad884"
+down_revision = "9c41d2e8f6a3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_todo_lower_title",
+        "todo",
+        [sa.text("lower(title)")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_todo_priority",
+        "todo",
+        ["priority"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_todo_owner_id_lower_title",
+        "todo",
+        ["owner_id", sa.text("lower(title)")],
+        unique=False,
+        postgresql_where=sa.text("owner_id IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_todo_owner_id_priority",
+        "todo",
+        ["owner_id", "priority"],
+        unique=False,
+        postgresql_where=sa.text("owner_id IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_todo_owner_id_complete",
+        "todo",
+        ["owner_id", "complete"],
+        unique=False,
+        postgresql_where=sa.text("owner_id IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_todo_owner_id_id",
+        "todo",
+        ["owner_id", "id"],
+        unique=False,
+        postgresql_where=sa.text("owner_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_todo_owner_id_id", table_name="todo")
+    op.drop_index("ix_todo_owner_id_complete", table_name="todo")
+    op.drop_index("ix_todo_owner_id_priority", table_name="todo")
+    op.drop_index("ix_todo_owner_id_lower_title", table_name="todo")
+    op.drop_index("ix_todo_priority", table_name="todo")
+    op.drop_index("ix_todo_lower_title", table_name="todo")
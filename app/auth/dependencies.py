@@ -1,18 +1,18 @@
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_database
+from app.database import get_async_database
 from app.users.models import User
-from app.users.repository import UserRepository
+from app.users.repository import AsyncUserRepository
 from utils.exceptions.client import NotFoundException
 
 
-def valid_user_credentials(
-    form_data: OAuth2PasswordRequestForm = Depends(), session: Session = Depends(get_database)
+async def valid_user_credentials(
+    form_data: OAuth2PasswordRequestForm = Depends(), session: AsyncSession = Depends(get_async_database)
 ) -> User:
-    repository = UserRepository(session=session)
-    user = repository.authenticate(form_data.username, form_data.password)
+    repository = AsyncUserRepository(session=session)
+    user = await repository.authenticate(form_data.username, form_data.password)
 
     if not user:
         raise NotFoundException(detail="Invalid user credential")
@@ -3,17 +3,24 @@ from typing import Any, Optional
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 
 from app.settings import settings
 from app.users.models import User
-from utils.crypt import get_bcrypt_context
+from utils.cache import TTLCache
 from utils.exceptions.client import ForbiddenException, NotFoundException
+from utils.tokens import InvalidTokenError, TokenDecoder, get_jwt_backend
 
-bcrypt_context = get_bcrypt_context(schemes=["bcrypt"], deprecated="auto")
+oauth_bearer = OAuth2PasswordBearer(tokenUrl="token")
 
+jwt_backend = get_jwt_backend(settings.JWT_BACKEND)
 
-oauth_bearer = OAuth2PasswordBearer(tokenUrl="token")
+token_cache: Optional[TTLCache[dict[str, Any]]] = None
+if settings.JWT_CACHE_MAXSIZE:
+    token_cache = TTLCache(maxsize=settings.JWT_CACHE_MAXSIZE, ttl=settings.JWT_CACHE_TTL)
+
+token_decoder = TokenDecoder(
+    key=settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM], backend=jwt_backend, cache=token_cache
+)
 
 
 def create_access_token(username: str, user_id: int, expires_delta: Optional[timedelta] = None) -> str:
@@ -25,16 +32,16 @@ def create_access_token(username: str, user_id: int, expires_delta: Optional[tim
         expire = now + expires_delta
 
     encode.update({"exp": expire})
-    return jwt.encode(encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return jwt_backend.encode(encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
 def get_authenticated_user(token: str = Depends(oauth_bearer)) -> User:
     try:
-        payload: dict[str, Any] = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        payload: dict[str, Any] = token_decoder.decode(token)
         username = payload.get("sub")
         user_id = payload.get("id")
         if username is None or user_id is None:
             raise NotFoundException(detail="User not found")
         return {"username": username, "id": user_id}
-    except JWTError as exc:
+    except InvalidTokenError as exc:
         raise ForbiddenException(detail="Could not validate credentials") from exc
@@ -1,11 +1,16 @@
 from .base import Base
-from .core import engine, session_maker
-from .dependencies import apply_session, get_database
+from .core import async_engine, async_pool_metrics, async_session_maker, engine, pool_metrics, session_maker
+from .dependencies import apply_session, get_async_database, get_database
 
 __all__ = [
     "Base",
     "engine",
     "session_maker",
+    "pool_metrics",
+    "async_engine",
+    "async_session_maker",
+    "async_pool_metrics",
     "get_database",
+    "get_async_database",
     "apply_session",
 ]
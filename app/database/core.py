@@ -1,61 +1,82 @@
+from typing import Optional
+
 from sqlalchemy import Engine, create_engine
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.settings import settings
+from utils.database.instrumentation import instrument_queries
+from utils.database.metrics import PoolMetrics
+from utils.database.routing import ReplicaPicker, RoutingSession
 
 
 def get_engine() -> Engine:
-    return create_engine(
-        settings.get_database_url(),
-        pool_pre_ping=True,
-        # pool_size=settings.pool_size,
-        # max_overflow=settings.max_overflow
-    )
+    url = settings.get_database_url()
+    return create_engine(url, **settings.get_engine_options(url))
+
 
+def get_replica_picker(engines: list[Engine]) -> Optional[ReplicaPicker]:
+    if not engines:
+        return None
+    return ReplicaPicker(engines, cooldown=settings.DATABASE.replica_cooldown)
 
-def get_session_maker(engine: Engine) -> sessionmaker[Session]:
+
+def get_session_maker(engine: Engine, replicas: Optional[ReplicaPicker] = None) -> sessionmaker[Session]:
+    # NOTE: Plain reads go to the replicas, if any, see `RoutingSession`
     return sessionmaker(
+        class_=RoutingSession,
         autocommit=False,
         autoflush=False,
         bind=engine,
+        replicas=replicas,
     )
 
 
-engine = get_engine()
-session_maker = get_session_maker(engine)
-
-
-__all__ = [
-    "engine",
-    "session_maker",
-]
+def get_async_engine() -> AsyncEngine:
+    url = settings.get_async_database_url()
+    return create_async_engine(url, **settings.get_engine_options(url))
 
 
-# def get_async_engine(settings):
-#     return create_async_engine(
-#         settings.get_database_url(),
-#         # pool_pre_ping=True,
-#         # pool_size=settings.pool_size,
-#         # max_overflow=settings.max_overflow
-#     )
+def get_async_session_maker(
+    async_engine: AsyncEngine, replicas: Optional[ReplicaPicker] = None
+) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        sync_session_class=RoutingSession,
+        replicas=replicas,
+        autoflush=False,
+        bind=async_engine,
+        # NOTE: Attributes cannot be lazy loaded (implicit IO) after commit within an async session
+        expire_on_commit=False,
+    )
 
 
-# def get_async_session_maker(async_engine):
-#     return async_sessionmaker(
-#         autocommit=False,
-#         autoflush=False,
-#         bind=async_engine,
-#     )
+engine = get_engine()
+replica_engines = [
+    create_engine(url, **settings.get_engine_options(url)) for url in settings.get_replica_urls()
+]
+replica_picker = get_replica_picker(replica_engines)
+session_maker = get_session_maker(engine, replica_picker)
+pool_metrics = PoolMetrics(engine)
 
+async_engine = get_async_engine()
+async_replica_engines = [
+    create_async_engine(url, **settings.get_engine_options(url)) for url in settings.get_async_replica_urls()
+]
+async_replica_picker = get_replica_picker([replica.sync_engine for replica in async_replica_engines])
+async_session_maker = get_async_session_maker(async_engine, async_replica_picker)
+async_pool_metrics = PoolMetrics(async_engine)
 
-# async_engine = get_async_engine(settings)
-# async_session_maker = get_async_session_maker(async_engine)
+for instrumented_engine in [engine, *replica_engines, async_engine, *async_replica_engines]:
+    instrument_queries(instrumented_engine)
 
 
-# def get_async_database():
-#     try:
-#         db = async_session_maker()
-#         yield db
-#     finally:
-#         db.close()
+__all__ = [
+    "engine",
+    "session_maker",
+    "pool_metrics",
+    "replica_picker",
+    "async_engine",
+    "async_session_maker",
+    "async_pool_metrics",
+    "async_replica_picker",
+]
@@ -1,10 +1,11 @@
 """Fastapi dependencies to interact with database."""
-from typing import Callable, Generator, Type, TypeVar
+from typing import AsyncGenerator, Callable, Generator, Type, TypeVar
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .core import session_maker
+from .core import async_session_maker, session_maker
 
 T = TypeVar("T")
 
@@ -17,6 +18,14 @@ def get_database() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_database() -> AsyncGenerator[AsyncSession, None]:
+    try:
+        db = async_session_maker()
+        yield db
+    finally:
+        await db.close()
+
+
 def apply_session(target: Type[T]) -> Callable[[Session], T]:
     def _apply_session(session: Session = Depends(get_database)) -> T:
         return target(session=session)
@@ -0,0 +1,17 @@
+from typing import Any
+
+from fastapi import APIRouter
+
+from .core import async_pool_metrics, async_replica_picker, pool_metrics, replica_picker
+
+router = APIRouter(prefix="/database", tags=["database"])
+
+
+@router.get("/pool")
+async def retrieve_pool_metrics() -> Any:
+    return {
+        "sync": pool_metrics.get_stats(),
+        "async": async_pool_metrics.get_stats(),
+        "replicas": replica_picker.get_stats() if replica_picker else [],
+        "async_replicas": async_replica_picker.get_stats() if async_replica_picker else [],
+    }
@@ -2,15 +2,38 @@ from fastapi import FastAPI
 
 from app.auth.router import router as auth_router
 from app.database import Base, engine
+from app.database.router import router as database_router
 from app.settings import settings
 from app.todo.router import router as todo_router
-from utils.middleware import SQLAlchemyExceptionHandlerMiddleware
+from app.todo.router import router_auth as todo_auth_router
+from utils.exceptions.handlers import exception_handlers
+from utils.middleware import (
+    CompressionMiddleware,
+    QueryInstrumentationMiddleware,
+    SQLAlchemyExceptionHandlerMiddleware,
+)
+from utils.responses import ORJSONResponse
 
-app = FastAPI(debug=settings.DEBUG)
+app = FastAPI(
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
+    exception_handlers=exception_handlers,
+)
 
 # Base.metadata.create_all(bind=engine)
 
 app.add_middleware(SQLAlchemyExceptionHandlerMiddleware, debug=settings.DEBUG)
+app.add_middleware(QueryInstrumentationMiddleware, query_budget=settings.QUERY_BUDGET)
+# NOTE: Added last, hence outermost, so error responses are compressed too
+app.add_middleware(
+    CompressionMiddleware,
+    encodings=settings.COMPRESSION_ENCODINGS,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    content_types=settings.COMPRESSION_CONTENT_TYPES,
+    levels=settings.COMPRESSION_LEVELS,
+)
 
 app.include_router(auth_router)
+app.include_router(database_router)
 app.include_router(todo_router)
+app.include_router(todo_auth_router)
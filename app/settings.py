@@ -5,6 +5,7 @@ from pydantic import Extra
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from utils.database.schemas import DatabaseSettingsMixin
+from utils.middleware import COMPRESSIBLE_CONTENT_TYPES
 
 
 class Settings(BaseSettings, DatabaseSettingsMixin):
@@ -19,11 +20,41 @@ class Settings(BaseSettings, DatabaseSettingsMixin):
     SECRET_KEY: str = "lhgGHo7t8O7Ff68OF688o68O6F6fF68O"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    # One of `utils.tokens.JWT_BACKENDS`, e.g., `pyjwt` (requires PyJWT) for faster verifications
+    JWT_BACKEND: str = "jose"
+    # Verified tokens cache, bounded by the tokens expiry. Disabled when its size is 0
+    JWT_CACHE_MAXSIZE: int = 4096
+    JWT_CACHE_TTL: float = 300
+
+    # Changing the rounds rehashes the stored passwords on their next login
+    BCRYPT_ROUNDS: int = 12
+    # Threads hashing passwords and calls allowed to wait for them before answering 503
+    BCRYPT_MAX_WORKERS: int = 4
+    BCRYPT_MAX_QUEUE: int = 64
+    # Seconds unknown usernames are remembered, sparing the DB during credential stuffing. Disabled when 0
+    UNKNOWN_USERS_CACHE_TTL: float = 0
+
+    # Reads of services (by id and listings), invalidated on writes. Disabled when its size is 0
+    SERVICE_CACHE_MAXSIZE: int = 0
+    SERVICE_CACHE_TTL: float = 60
+
+    # Response encodings by order of preference among `utils.compression.CODECS`, e.g., `["br", "gzip"]`
+    # (`br` and `zstd` require their extras). Disabled when empty
+    COMPRESSION_ENCODINGS: list[str] = ["gzip"]
+    # Complete bodies below this size (bytes) are sent as is, streaming ones are always compressed
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    # `fnmatch` patterns of the content types to compress
+    COMPRESSION_CONTENT_TYPES: list[str] = list(COMPRESSIBLE_CONTENT_TYPES)
+    # Compression level by encoding, e.g., `{"gzip": 5}`, otherwise the codecs defaults
+    COMPRESSION_LEVELS: dict[str, int] = {}
 
     ALLOWED_HOSTS: list = []
 
     TIME_ZONE: str = "UTC"
 
+    # Maximum number of SQL statements a request may execute, e.g., `QUERY_BUDGET=10` when testing
+    QUERY_BUDGET: Optional[int] = None
+
     model_config = SettingsConfigDict(
         # Configuration for BaseSettings.
         case_sensitive=False,
@@ -1,14 +1,22 @@
-from typing import Optional
+from typing import Callable, Optional
 
 from fastapi import Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_database
-from utils.pagination import LimitOffsetPagination, LimitOffsetSchema
+from app.auth.security import get_authenticated_user
+from app.database import get_async_database, get_database
+from utils.pagination import (
+    CountStrategy,
+    CursorPagination,
+    CursorSchema,
+    LimitOffsetPagination,
+    LimitOffsetSchema,
+)
 
-from .filters import TodoFilterManager, TodoFilterSchema
-from .repository import TodoRepository
-from .services import TodoService
+from .filters import TodoFieldsManager, TodoFilterManager, TodoFilterSchema, TodoOwnerFilterSchema
+from .repository import AsyncTodoOwnerRepository, AsyncTodoRepository, TodoRepository
+from .services import AsyncTodoOwnerService, AsyncTodoService, TodoService, todo_cache
 
 
 def get_todo_repository(session: Session = Depends(get_database)) -> TodoRepository:
@@ -16,7 +24,29 @@ def get_todo_repository(session: Session = Depends(get_database)) -> TodoReposit
 
 
 def get_todo_service(repository: TodoRepository = Depends(get_todo_repository)) -> TodoService:
-    return TodoService(repository=repository)
+    return TodoService(repository=repository, cache=todo_cache)
+
+
+def get_async_todo_repository(session: AsyncSession = Depends(get_async_database)) -> AsyncTodoRepository:
+    return AsyncTodoRepository(session=session)
+
+
+def get_async_todo_service(
+    repository: AsyncTodoRepository = Depends(get_async_todo_repository),
+) -> AsyncTodoService:
+    return AsyncTodoService(repository=repository, cache=todo_cache)
+
+
+def get_async_todo_owner_repository(
+    user: dict = Depends(get_authenticated_user), session: AsyncSession = Depends(get_async_database)
+) -> AsyncTodoOwnerRepository:
+    return AsyncTodoOwnerRepository(session=session, owner_id=user["id"])
+
+
+def get_async_todo_owner_service(
+    repository: AsyncTodoOwnerRepository = Depends(get_async_todo_owner_repository),
+) -> AsyncTodoOwnerService:
+    return AsyncTodoOwnerService(repository=repository, cache=todo_cache)
 
 
 def get_todo_filter_manager(
@@ -27,6 +57,32 @@ def get_todo_filter_manager(
     return TodoFilterManager(filters=filters, ordering=ordering)
 
 
+def get_todo_owner_filter_manager(
+    filters: TodoOwnerFilterSchema = Depends(),
+    ordering: Optional[list[str]] = Query(None),
+) -> TodoFilterManager:
+    return TodoFilterManager(filters=filters, ordering=ordering)
+
+
+def get_todo_fields_manager(
+    fields: Optional[str] = Query(None, description="Comma separated fields to return, e.g. `id,title`"),
+) -> TodoFieldsManager:
+    return TodoFieldsManager(fields=[field.strip() for field in fields.split(",")] if fields else None)
+
+
 # TODO: This one might be "global" for project due its (possible) immutability across domains nature
-def get_pagination(pagination: LimitOffsetSchema = Depends()) -> LimitOffsetPagination:
-    return LimitOffsetPagination(pagination)
+def get_pagination(
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+) -> Callable[[LimitOffsetSchema], LimitOffsetPagination]:
+    def _get_pagination(pagination: LimitOffsetSchema = Depends()) -> LimitOffsetPagination:
+        return LimitOffsetPagination(pagination, count_strategy=count_strategy)
+
+    return _get_pagination
+
+
+def get_cursor_pagination(
+    pagination: CursorSchema = Depends(),
+    filter_manager: TodoFilterManager = Depends(get_todo_filter_manager),
+) -> CursorPagination:
+    # NOTE: Pages are sought through the ordering validated by the filter manager
+    return CursorPagination(pagination, model=filter_manager.model, ordering=filter_manager.ordering)
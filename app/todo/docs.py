@@ -9,6 +9,15 @@ class ListTodoDocs(FastAPIRouteParameters):
     status_code: int = 200
 
 
+class CursorListTodoDocs(FastAPIRouteParameters):
+    status_code: int = 200
+    summary: str = "List Todos by cursor"
+    description: str = (
+        "Keyset paginated listing: follow the `next`/`previous` cursors through the `c` parameter, "
+        "keeping the same `ordering`."
+    )
+
+
 class CreateTodoDocs(FastAPIRouteParameters):
     status_code: int = 201
 
@@ -21,8 +30,34 @@ class DestroyTodoDocs(FastAPIRouteParameters):
     status_code: int = 204
 
 
+class BulkCreateTodoDocs(FastAPIRouteParameters):
+    status_code: int = 201
+    summary: str = "Create Todos in bulk"
+
+
+class BulkUpdateTodoDocs(FastAPIRouteParameters):
+    status_code: int = 200
+    summary: str = "Update Todos in bulk"
+
+
+class BulkDestroyTodoDocs(FastAPIRouteParameters):
+    status_code: int = 200
+    summary: str = "Delete Todos in bulk"
+
+
+class ExportTodoDocs(FastAPIRouteParameters):
+    status_code: int = 200
+    summary: str = "Export Todos as NDJSON or CSV"
+    description: str = "Streams every Todo matching the filters, regardless of the pagination limits."
+
+
 retrieve_todo_docs = RetrieveTodoDocs().model_dump()
 list_todo_docs = ListTodoDocs().model_dump()
+cursor_list_todo_docs = CursorListTodoDocs().model_dump()
 create_todo_docs = CreateTodoDocs().model_dump()
 update_todo_docs = UpdateTodoDocs().model_dump()
 destroy_todo_docs = DestroyTodoDocs().model_dump()
+bulk_create_todo_docs = BulkCreateTodoDocs().model_dump()
+bulk_update_todo_docs = BulkUpdateTodoDocs().model_dump()
+bulk_destroy_todo_docs = BulkDestroyTodoDocs().model_dump()
+export_todo_docs = ExportTodoDocs().model_dump()
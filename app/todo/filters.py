@@ -2,7 +2,7 @@ from typing import Annotated, Optional
 
 from fastapi import Query
 
-from utils.filters import BaseFilterManager, FilterSchema
+from utils.filters import BaseFieldsManager, BaseFilterManager, FilterSchema
 
 from .models import Todo
 
@@ -17,6 +17,7 @@ class TodoFilterSchema(FilterSchema, extra="forbid"):
     complete__eq: Optional[bool] = Query(None)
     description__contains: Annotated[str | None, Query(None)]
     description__icontains: Optional[str] = Query(None)
+    q: Optional[str] = Query(None, description="Full text search on title and description, e.g. `milk -oat`")
 
     # Annotated[str | None, Query(None)]
     # title__in: list[str] = Query(None)  # TODO: But then, how to gather the elements to get the Query?
@@ -26,9 +27,25 @@ class TodoFilterSchema(FilterSchema, extra="forbid"):
     # ordering: List[int] = Query(None)
     # ordering: Annotated[list[str] | None, Query()] = None
 
-    # class Meta:
-    #     model = Todo
+    class Meta:
+        model = Todo
+        ordering_fields = ["id", "priority"]
+
+
+class TodoOwnerFilterSchema(TodoFilterSchema, extra="forbid"):
+    """Filters of the todos of the authenticated user (`/todo/auth` routes)."""
+
+    class Meta:
+        model = Todo
+        ordering_fields = ["id", "priority"]
+        scope_fields = ["owner_id"]
 
 
 class TodoFilterManager(BaseFilterManager):
     model = Todo
+    search_field = "search_vector"
+    search_fallback_fields = ("title", "description")
+
+
+class TodoFieldsManager(BaseFieldsManager):
+    model = Todo
@@ -1,20 +1,63 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, Text, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from utils.database.mixins import TimestampMixin
+from utils.database.models import PostgreSQLComputed
 
 if TYPE_CHECKING:
     from app.users.models import User  # noqa: F401
 
 
-class Todo(Base):
+OWNED = text("owner_id IS NOT NULL")
+
+
+class Todo(Base, TimestampMixin):
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    title = Mapped[str]
-    description = Mapped[str]
-    priority = Mapped[int]
+    title: Mapped[str]
+    description: Mapped[Optional[str]]
+    priority: Mapped[int]
     complete: Mapped[bool] = mapped_column(default=False)
 
-    owner_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
+    owner_id: Mapped[Optional[int]] = mapped_column(ForeignKey("user.id"))
     owner: Mapped["User"] = relationship(back_populates="todos")
+
+    # NOTE: Kept up to date by PostgreSQL, title matches weighting more than description ones.
+    #       Deferred, as it is only meant to be searched (`TodoFilterManager.search_field`).
+    #       Left empty on SQLite, whose searches fall back to `ILIKE` on the title and description
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        PostgreSQLComputed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
+    # NOTE: Filter indexes as suggested by `python -m utils.filters.advisor app.todo.filters`
+    __table_args__ = (
+        Index("ix_todo_lower_title", text("lower(title)")),
+        Index("ix_todo_priority", "priority"),
+        Index("ix_todo_owner_id_lower_title", "owner_id", text("lower(title)"), postgresql_where=OWNED),
+        Index("ix_todo_owner_id_priority", "owner_id", "priority", postgresql_where=OWNED),
+        Index("ix_todo_owner_id_complete", "owner_id", "complete", postgresql_where=OWNED),
+        Index("ix_todo_owner_id_id", "owner_id", "id", postgresql_where=OWNED),
+        Index("ix_todo_search_vector", "search_vector", postgresql_using="gin"),
+        # NOTE: Trigram indexes serve `ILIKE` patterns, e.g. `icontains` and the `q` substring fallback
+        Index(
+            "ix_todo_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_todo_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
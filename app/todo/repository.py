@@ -1,3 +1,4 @@
+from utils.database.async_repository import AsyncBaseRepository, AsyncOwnerScopedRepository
 from utils.database.repository import BaseRepository
 
 from .models import Todo
@@ -5,3 +6,16 @@ from .models import Todo
 
 class TodoRepository(BaseRepository[Todo]):
     model = Todo
+    use_returning = True
+
+
+class AsyncTodoRepository(AsyncBaseRepository[Todo]):
+    model = Todo
+    use_returning = True
+
+
+class AsyncTodoOwnerRepository(AsyncOwnerScopedRepository[Todo]):
+    """Todos of a single owner, i.e. the authenticated user (`/todo/auth` routes)."""
+
+    model = Todo
+    use_returning = True
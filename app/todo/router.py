@@ -1,139 +1,236 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, Query, Request, Response
+
+from utils.conditional import NotModifiedResponse, get_validators, is_conditional, is_not_modified
+from utils.pagination import CountStrategy, CursorPagination, LimitOffsetPagination
+from utils.responses import CSVStreamingResponse, NDJSONStreamingResponse, RowsJSONResponse
+
+from .dependencies import (
+    get_async_todo_owner_service,
+    get_async_todo_service,
+    get_cursor_pagination,
+    get_pagination,
+    get_todo_fields_manager,
+    get_todo_filter_manager,
+    get_todo_owner_filter_manager,
+)
+from .docs import (
+    bulk_create_todo_docs,
+    bulk_destroy_todo_docs,
+    bulk_update_todo_docs,
+    create_todo_docs,
+    cursor_list_todo_docs,
+    destroy_todo_docs,
+    export_todo_docs,
+    list_todo_docs,
+    retrieve_todo_docs,
+    update_todo_docs,
+)
+from .filters import TodoFieldsManager, TodoFilterManager
+from .schemas import (
+    MAX_BULK_SIZE,
+    BulkResultSchema,
+    BulkStatus,
+    ExportFormat,
+    TodoBulkUpdateSchema,
+    TodoReadSchema,
+    TodoSchema,
+)
+from .services import AsyncTodoOwnerService, AsyncTodoService
 
-from app.auth.security import get_authenticated_user
-from app.database import get_database
-from utils.exceptions.client import NotFoundException, UnauthorizedException
-from utils.pagination import LimitOffsetPagination
+router_auth = APIRouter(prefix="/todo/auth", tags=["todo"])
 
-from .dependencies import get_pagination, get_todo_filter_manager, get_todo_service
-from .docs import create_todo_docs, destroy_todo_docs, list_todo_docs, retrieve_todo_docs, update_todo_docs
-from .filters import TodoFilterManager, TodoFilterSchema
-from .models import Todo as TodoModel
-from .schemas import TodoSchema
-from .services import TodoService
 
-router_auth = APIRouter(prefix="/todo/auth", tags=["todo"])
+TodoOwnerServiceAnnotation = Annotated[AsyncTodoOwnerService, Depends(get_async_todo_owner_service)]
 
 
-@router_auth.get("/")
+@router_auth.get("/", **list_todo_docs)
 async def list_todo_by_user(
-    user: dict = Depends(get_authenticated_user), db: Session = Depends(get_database)
+    service: TodoOwnerServiceAnnotation,
+    filter_manager: TodoFilterManager = Depends(get_todo_owner_filter_manager),
+    pagination_manager: LimitOffsetPagination = Depends(get_pagination(CountStrategy.SKIP)),
+    fields_manager: TodoFieldsManager = Depends(get_todo_fields_manager),
 ):
-    if user is None:
-        raise UnauthorizedException
-    return db.query(TodoModel).filter(TodoModel.owner_id == user.get("id")).all()
+    rows = await service.list_mappings(
+        filter_manager=filter_manager, pagination_manager=pagination_manager, fields_manager=fields_manager
+    )
+    return RowsJSONResponse(rows)
 
 
-@router_auth.get("/{todo_id}")
+@router_auth.get(
+    "/{todo_id}", response_model=TodoReadSchema, response_model_exclude_unset=True, **retrieve_todo_docs
+)
 async def retrieve_todo_by_user(
-    todo_id: int, user: dict = Depends(get_authenticated_user), db: Session = Depends(get_database)
+    todo_id: int,
+    service: TodoOwnerServiceAnnotation,
+    fields_manager: TodoFieldsManager = Depends(get_todo_fields_manager),
 ):
-    if user is None:
-        raise UnauthorizedException
+    return await service.get_by_id(id=todo_id, fields_manager=fields_manager)
 
-    todo_model = (
-        db.query(TodoModel).filter(TodoModel.owner_id == user.get("id"), TodoModel.id == todo_id).first()
-    )
-    if todo_model is None:
-        raise NotFoundException
 
-    return todo_model
+@router_auth.post("/", response_model=TodoReadSchema, **create_todo_docs)
+async def create_todo_by_user(payload: TodoSchema, service: TodoOwnerServiceAnnotation):
+    return await service.create(entity=payload.model_dump())
 
 
-@router_auth.post("/", status_code=201)
-async def create_todo_by_user(
-    todo: TodoSchema, user: dict = Depends(get_authenticated_user), db: Session = Depends(get_database)
-):
-    if user is None:
-        raise UnauthorizedException
+# NOTE: A single `UPDATE/DELETE ... WHERE id AND owner_id RETURNING`, todos of others are not found
+@router_auth.put("/{id}", response_model=TodoReadSchema, **update_todo_docs)
+async def update_todo_by_user(id: int, payload: TodoSchema, service: TodoOwnerServiceAnnotation):
+    return await service.update(id=id, entity=payload.model_dump(exclude_unset=True))
 
-    todo_model = TodoModel(**todo.model_dump())
-    todo_model.owner_id = user.get("id")
-    db.add(todo_model)
-    db.commit()
-    return todo_model
 
+@router_auth.delete("/{id}", **destroy_todo_docs)
+async def destroy_todo_by_user(id: int, service: TodoOwnerServiceAnnotation):
+    return await service.destroy(id=id)
 
-@router_auth.put("/{id}")
-async def update_todo_by_user(
-    id: int,
-    todo: TodoSchema,
-    user: dict = Depends(get_authenticated_user),
-    db: Session = Depends(get_database),
-):
-    if user is None:
-        raise UnauthorizedException
 
-    todo_model = db.query(TodoModel).filter(TodoModel.owner_id == user.get("id"), TodoModel.id == id).first()
-    if not todo_model:
-        raise NotFoundException
+##############################################################################################################
+##############################################################################################################
+##############################################################################################################
+##############################################################################################################
+
+router = APIRouter(prefix="/todo", tags=["todo"])
+
+
+TodoServiceAnnotation = Annotated[AsyncTodoService, Depends(get_async_todo_service)]
 
-    todo_data = todo.model_dump(exclude_unset=True)
-    for key, value in todo_data.items():
-        setattr(todo_model, key, value)
+# Columns the `ETag` and `Last-Modified` validators of todos are computed from
+VERSION_FIELDS = ["id", "updated_at"]
 
-    db.add(todo_model)
-    db.commit()
-    return todo_model
+
+def get_versioned_fields_manager(fields_manager: TodoFieldsManager) -> TodoFieldsManager:
+    """The requested sparse fieldset along with `VERSION_FIELDS` (the primary key is always loaded)."""
+    if not fields_manager.fields or "updated_at" in fields_manager.fields:
+        return fields_manager
+    return TodoFieldsManager(fields=[*fields_manager.fields, "updated_at"])
+
+
+# NOTE: Batch routes must be declared before `/{id}` ones, otherwise "bulk" would be taken as an ID
+@router.post("/bulk", response_model=list[BulkResultSchema], **bulk_create_todo_docs)
+async def bulk_create_todo(
+    payload: Annotated[list[TodoSchema], Body(min_length=1, max_length=MAX_BULK_SIZE)],
+    service: TodoServiceAnnotation,
+):
+    todos = await service.bulk_create(entities=[item.model_dump() for item in payload])
+    return [{"id": todo.id, "status": BulkStatus.CREATED} for todo in todos]
 
 
-@router_auth.delete("/{id}", status_code=204)
-async def destroy_todo_by_user(
-    id: int, user: dict = Depends(get_authenticated_user), db: Session = Depends(get_database)
+@router.put("/bulk", response_model=list[BulkResultSchema], **bulk_update_todo_docs)
+async def bulk_update_todo(
+    payload: Annotated[list[TodoBulkUpdateSchema], Body(min_length=1, max_length=MAX_BULK_SIZE)],
+    service: TodoServiceAnnotation,
 ):
-    if user is None:
-        raise UnauthorizedException
+    updated_ids = set(await service.bulk_update(entities=[item.model_dump() for item in payload]))
+    return [
+        {"id": item.id, "status": BulkStatus.UPDATED if item.id in updated_ids else BulkStatus.NOT_FOUND}
+        for item in payload
+    ]
 
-    todo_model = db.query(TodoModel).filter(TodoModel.owner_id == user.get("id"), TodoModel.id == id).first()
-    if not todo_model:
-        raise NotFoundException
 
-    db.query(TodoModel).filter(TodoModel.owner_id == user.get("id"), TodoModel.id == id).delete()
-    db.commit()
-    return {}
+@router.delete("/bulk", response_model=list[BulkResultSchema], **bulk_destroy_todo_docs)
+async def bulk_destroy_todo(
+    service: TodoServiceAnnotation,
+    ids: list[int] = Query(min_length=1, max_length=MAX_BULK_SIZE),
+):
+    deleted_ids = set(await service.bulk_destroy(ids=ids))
+    return [
+        {"id": id, "status": BulkStatus.DELETED if id in deleted_ids else BulkStatus.NOT_FOUND} for id in ids
+    ]
 
 
-##############################################################################################################
-##############################################################################################################
-##############################################################################################################
-##############################################################################################################
+# NOTE: Declared before `/{id}`, otherwise "export" would be taken as an ID
+@router.get("/export", **export_todo_docs)
+async def export_todo(
+    service: TodoServiceAnnotation,
+    format: ExportFormat = ExportFormat.NDJSON,
+    filter_manager: TodoFilterManager = Depends(get_todo_filter_manager),
+    fields_manager: TodoFieldsManager = Depends(get_todo_fields_manager),
+):
+    rows = service.stream_mappings(filter_manager=filter_manager, fields_manager=fields_manager)
+    headers = {"Content-Disposition": f'attachment; filename="todos.{format.value}"'}
+    if format == ExportFormat.CSV:
+        return CSVStreamingResponse(rows, headers=headers)
+    return NDJSONStreamingResponse(rows, headers=headers)
 
-router = APIRouter(prefix="/todo", tags=["todo"])
 
+# NOTE: Declared before `/{id}`, otherwise "cursor" would be taken as an ID
+@router.get("/cursor", **cursor_list_todo_docs)
+async def list_todo_by_cursor(
+    service: TodoServiceAnnotation,
+    filter_manager: TodoFilterManager = Depends(get_todo_filter_manager),
+    pagination_manager: CursorPagination = Depends(get_cursor_pagination),
+):
+    rows = await service.list_mappings(filter_manager=filter_manager, pagination_manager=pagination_manager)
+    return RowsJSONResponse({"results": rows, **pagination_manager.get_pagination_properties()})
 
-TodoServiceAnnotation = Annotated[TodoService, Depends(get_todo_service)]
 
+@router.get(
+    "/{id}", response_model=TodoReadSchema, response_model_exclude_unset=True, **retrieve_todo_docs
+)
+async def retrieve_todo(
+    id: int,
+    request: Request,
+    response: Response,
+    service: TodoServiceAnnotation,
+    fields_manager: TodoFieldsManager = Depends(get_todo_fields_manager),
+):
+    if is_conditional(request):
+        # NOTE: Validators are fetched first, so unchanged todos are neither loaded nor serialized
+        version = await service.get_by_id(id=id, fields_manager=TodoFieldsManager(fields=VERSION_FIELDS))
+        validators = get_validators([version])
+        if is_not_modified(request, validators):
+            return NotModifiedResponse(validators)
 
-@router.get("/{id}", **retrieve_todo_docs)
-async def retrieve_todo(id: int, service: TodoServiceAnnotation):
-    return service.get_by_id(id=id)
+    # NOTE: Otherwise validators are computed from the todo itself, in a single query
+    todo = await service.get_by_id(id=id, fields_manager=get_versioned_fields_manager(fields_manager))
+    response.headers.update(get_validators([todo]).headers)
+    return todo
 
 
 @router.get("/", **list_todo_docs)
 async def list_todo(
+    request: Request,
     service: TodoServiceAnnotation,
     filter_manager: TodoFilterManager = Depends(get_todo_filter_manager),
-    pagination_manager: LimitOffsetPagination = Depends(get_pagination),
+    pagination_manager: LimitOffsetPagination = Depends(get_pagination(CountStrategy.SKIP)),
+    fields_manager: TodoFieldsManager = Depends(get_todo_fields_manager),
 ):
-    return service.list(filter_manager=filter_manager, pagination_manager=pagination_manager)
+    if is_conditional(request):
+        versions = await service.list_mappings(
+            filter_manager=filter_manager,
+            pagination_manager=pagination_manager,
+            fields_manager=TodoFieldsManager(fields=VERSION_FIELDS),
+        )
+        validators = get_validators(versions)
+        if is_not_modified(request, validators):
+            return NotModifiedResponse(validators)
+
+    rows = await service.list_mappings(
+        filter_manager=filter_manager,
+        pagination_manager=pagination_manager,
+        fields_manager=get_versioned_fields_manager(fields_manager),
+    )
+    validators = get_validators(rows)
+    # NOTE: Left out when only loaded for the validators
+    if fields_manager.fields and "updated_at" not in fields_manager.fields:
+        rows = [{key: value for key, value in row.items() if key != "updated_at"} for row in rows]
+    return RowsJSONResponse(rows, headers=validators.headers)
 
 
 @router.post("/", **create_todo_docs)
 async def create_todo(payload: TodoSchema, service: TodoServiceAnnotation):
     data = payload.model_dump()
-    service.create(entity=data)
+    await service.create(entity=data)
     return data
 
 
-@router.put("/{id}", **update_todo_docs)
+@router.put("/{id}", response_model=TodoReadSchema, **update_todo_docs)
 async def update_todo(id: int, payload: TodoSchema, service: TodoServiceAnnotation):
     data = payload.model_dump(exclude_unset=True)
-    return service.update(id=id, entity=data)
+    return await service.update(id=id, entity=data)
 
 
 @router.delete("/{id}", **destroy_todo_docs)
 async def destroy_todo(id: int, service: TodoServiceAnnotation):
-    return service.destroy(id=id)
+    return await service.destroy(id=id)
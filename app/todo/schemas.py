@@ -1,7 +1,13 @@
+from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from utils.schemas import ReadSchema
+
+MAX_BULK_SIZE = 1000
+"""Maximum number of items accepted by the batch endpoints within a single request."""
+
 
 class TodoSchema(BaseModel):
     title: str
@@ -27,3 +33,34 @@ class TodoSchema(BaseModel):
             ]
         }
     )
+
+
+# NOTE: Every field but `id` may be left out by a sparse fieldset, hence the defaults
+class TodoReadSchema(ReadSchema):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    priority: Optional[int] = None
+    complete: Optional[bool] = None
+    owner_id: Optional[int] = None
+
+
+class TodoBulkUpdateSchema(TodoSchema):
+    id: int
+
+
+class BulkStatus(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
+
+
+class BulkResultSchema(BaseModel):
+    id: int
+    status: BulkStatus
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
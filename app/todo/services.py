@@ -1,7 +1,27 @@
-from utils.services import BaseService
+from typing import Any, Optional
 
-from .repository import TodoRepository
+from app.settings import settings
+from utils.cache import TTLCache
+from utils.services import AsyncBaseService, BaseService, ServiceCache
+
+from .repository import AsyncTodoOwnerRepository, AsyncTodoRepository, TodoRepository
+
+# NOTE: Shared by the services of every request, so reads are cached across them
+todo_cache: Optional[ServiceCache] = None
+if settings.SERVICE_CACHE_MAXSIZE:
+    todo_cache = ServiceCache(
+        TTLCache[Any](maxsize=settings.SERVICE_CACHE_MAXSIZE, ttl=settings.SERVICE_CACHE_TTL),
+        ttl=settings.SERVICE_CACHE_TTL,
+    )
 
 
 class TodoService(BaseService[TodoRepository]):
     pass
+
+
+class AsyncTodoService(AsyncBaseService[AsyncTodoRepository]):
+    pass
+
+
+class AsyncTodoOwnerService(AsyncBaseService[AsyncTodoOwnerRepository]):
+    """Todos of the authenticated user."""
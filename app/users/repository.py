@@ -1,21 +1,97 @@
-from typing import Optional
+from typing import Optional, TypeVar
 
+from sqlalchemy import Select
+from sqlalchemy.orm import Query, load_only
+
+from app.settings import settings
+from utils.cache import TTLCache
 from utils.crypt import get_bcrypt_context
+from utils.database.async_repository import AsyncBaseRepository
 from utils.database.repository import BaseRepository
 
 from .models import User
 
-bcrypt_context = get_bcrypt_context(schemes=["bcrypt"], deprecated="auto")
+QueryType = TypeVar("QueryType", Query[User], Select[tuple[User]])
+
+bcrypt_context = get_bcrypt_context(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    max_workers=settings.BCRYPT_MAX_WORKERS,
+    max_queue=settings.BCRYPT_MAX_QUEUE,
+)
+
+# NOTE: Per process and short-lived, a username registered meanwhile by another process
+# cannot log in until it expires
+unknown_users_cache: Optional[TTLCache[bool]] = None
+if settings.UNKNOWN_USERS_CACHE_TTL:
+    unknown_users_cache = TTLCache(maxsize=10_000, ttl=settings.UNKNOWN_USERS_CACHE_TTL)
+
+
+class AuthenticationMixin:
+    """
+    Authentication looks users up by their (indexed) `username` in a single query loading only
+    the columns the login needs. Unknown users still cost a dummy password verification, so
+    response times do not reveal which usernames exist.
+    """
+
+    authentication_columns = (User.id, User.username, User.hashed_password, User.is_active)
+
+    def authentication_queryset(self, base_query: QueryType, username: str) -> QueryType:
+        return base_query.options(load_only(*self.authentication_columns)).filter_by(username=username)
+
+    def is_unknown_user(self, username: str) -> bool:
+        return unknown_users_cache is not None and unknown_users_cache.get(username, False)
+
+    def set_unknown_user(self, username: str) -> None:
+        if unknown_users_cache is not None:
+            unknown_users_cache.set(username, True)
 
 
-class UserRepository(BaseRepository[User]):
+class UserRepository(AuthenticationMixin, BaseRepository[User]):
     model = User
 
     def authenticate(self, username: str, password: str) -> Optional[User]:
-        user = self.retrieve(username=username, hashed_password=password)
+        user = None
+        if not self.is_unknown_user(username):
+            user = self.authentication_queryset(self.get_base_query(), username).one_or_none()
+            # NOTE: Only remembered on actual misses, so that the entry expires at last
+            if not user:
+                self.set_unknown_user(username)
+
+        if not user:
+            bcrypt_context.dummy_verify()
+            return None
+        verified, new_hash = bcrypt_context.verify_and_update(password, user.hashed_password)
+        if not verified:
+            return None
+        if new_hash:
+            # NOTE: Rehashed with the current settings (e.g., `BCRYPT_ROUNDS` changed)
+            user.hashed_password = new_hash
+            self.perform_commit()
+        return user
+
+
+class AsyncUserRepository(AuthenticationMixin, AsyncBaseRepository[User]):
+    model = User
+
+    async def authenticate(self, username: str, password: str) -> Optional[User]:
+        user = None
+        if not self.is_unknown_user(username):
+            query = self.authentication_queryset(self.get_base_query(), username)
+            user = (await self.session.scalars(query)).one_or_none()
+            # NOTE: Only remembered on actual misses, so that the entry expires at last
+            if not user:
+                self.set_unknown_user(username)
 
         if not user:
+            await bcrypt_context.async_dummy_verify()
             return None
-        if not bcrypt_context.verify_password(password, user.hashed_password):
+        verified, new_hash = await bcrypt_context.async_verify_and_update(password, user.hashed_password)
+        if not verified:
             return None
+        if new_hash:
+            # NOTE: Rehashed with the current settings (e.g., `BCRYPT_ROUNDS` changed)
+            user.hashed_password = new_hash
+            await self.perform_commit()
         return user
@@ -4,14 +4,11 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.database import get_database
-from utils.crypt import get_bcrypt_context
 
 from .models import User
+from .repository import bcrypt_context, unknown_users_cache
 from .schemas import CreateUser
 
-bcrypt_context = get_bcrypt_context(schemes=["bcrypt"], deprecated="auto")
-
-
 router = APIRouter(prefix="/user", tags=["user"])
 
 
@@ -19,8 +16,10 @@ router = APIRouter(prefix="/user", tags=["user"])
 async def create_new_user(schema: CreateUser, db: Session = Depends(get_database)) -> Any:
     data = schema.model_dump(exclude_unset=True, exclude_none=True)
     password = data.pop("password")
-    user_model = User(hashed_password=bcrypt_context.get_password_hash(password), **data)
+    user_model = User(hashed_password=await bcrypt_context.async_get_password_hash(password), **data)
 
     db.add(user_model)
     db.commit()
+    if unknown_users_cache is not None:
+        unknown_users_cache.delete(schema.username)
     return {}
@@ -0,0 +1,126 @@
+"""
+Requests/second of a list endpoint backed by `BaseRepository` (sync session inside an `async def`
+route, blocking the event loop) versus `AsyncBaseRepository` under concurrent clients.
+
+    python -m benchmarks.async_repository --clients 50 --duration 5
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
+
+from utils.database.async_repository import AsyncBaseRepository
+from utils.database.repository import BaseRepository
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+class ItemRepository(BaseRepository[Item]):
+    model = Item
+
+
+class AsyncItemRepository(AsyncBaseRepository[Item]):
+    model = Item
+
+
+def build_app(sync_url: str, async_url: str, pool_size: int) -> FastAPI:
+    # NOTE: Sync pool is sized to the clients count, otherwise its blocking checkout deadlocks the loop
+    session_maker = sessionmaker(bind=create_engine(sync_url, pool_size=pool_size))
+    async_engine = create_async_engine(async_url)
+    async_session_maker = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    def get_database() -> Any:
+        with session_maker() as session:
+            yield session
+
+    async def get_async_database() -> Any:
+        async with async_session_maker() as session:
+            yield session
+
+    app = FastAPI()
+
+    @app.get("/sync")
+    async def list_sync(session: Session = Depends(get_database)) -> Any:
+        return len(ItemRepository(session=session).list())
+
+    @app.get("/async")
+    async def list_async(session: AsyncSession = Depends(get_async_database)) -> Any:
+        return len(await AsyncItemRepository(session=session).list())
+
+    return app
+
+
+async def load(app: FastAPI, path: str, clients: int, duration: float) -> float:
+    transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+    completed = 0
+    deadline = time.perf_counter() + duration
+
+    async def client() -> None:
+        nonlocal completed
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            while time.perf_counter() < deadline:
+                response = await http.get(path)
+                response.raise_for_status()
+                completed += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return completed / (time.perf_counter() - started)
+
+
+def seed(url: str, rows: int) -> None:
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Item(name=f"item-{index}") for index in range(rows))
+        session.commit()
+
+
+async def run(args: argparse.Namespace, sync_url: str, async_url: str) -> None:
+    # NOTE: The async engine must live within a single event loop
+    app = build_app(sync_url, async_url, pool_size=max(args.clients))
+    for clients in args.clients:
+        for path in ("/sync", "/async"):
+            rps = await load(app, path, clients, args.duration)
+            print(f"{path:<8} clients={clients:<4} {rps:10.1f} req/s")
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bench.sqlite3"
+        sync_url = args.sync_url or f"sqlite:///{path}"
+        async_url = args.async_url or f"sqlite+aiosqlite:///{path}"
+        seed(sync_url, args.rows)
+        asyncio.run(run(args, sync_url, async_url))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--sync-url", help="Sync database URL (defaults to a temporary SQLite file)")
+    parser.add_argument("--async-url", help="Async database URL pointing to the same database")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--duration", type=float, default=3.0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
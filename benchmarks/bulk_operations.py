@@ -0,0 +1,105 @@
+"""
+Wall time of inserting N rows through a FastAPI app backed by `AsyncBaseRepository`, one
+`POST /items/` request per row versus a single `POST /items/bulk` request.
+
+    python -m benchmarks.bulk_operations --rows 1000
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import Depends, FastAPI
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from utils.database.async_repository import AsyncBaseRepository
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    priority: Mapped[int]
+
+
+class ItemSchema(BaseModel):
+    name: str
+    priority: int
+
+
+class AsyncItemRepository(AsyncBaseRepository[Item]):
+    model = Item
+
+
+def build_app(async_session_maker: async_sessionmaker[AsyncSession]) -> FastAPI:
+    async def get_repository() -> Any:
+        async with async_session_maker() as session:
+            yield AsyncItemRepository(session=session)
+
+    app = FastAPI()
+
+    @app.post("/items/bulk", status_code=201)
+    async def bulk_create(payload: list[ItemSchema], repository: Any = Depends(get_repository)) -> Any:
+        items = await repository.bulk_create(entities=[item.model_dump() for item in payload])
+        await repository.perform_commit()
+        return [{"id": item.id, "status": "created"} for item in items]
+
+    @app.post("/items/", status_code=201)
+    async def create(payload: ItemSchema, repository: Any = Depends(get_repository)) -> Any:
+        item = await repository.create(entity=payload.model_dump())
+        await repository.perform_commit()
+        return {"id": item.id}
+
+    return app
+
+
+async def run(args: argparse.Namespace, url: str) -> None:
+    # NOTE: The async engine must live within a single event loop
+    engine = create_async_engine(url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+    app = build_app(async_sessionmaker(bind=engine, expire_on_commit=False))
+    payload = [{"name": f"item-{index}", "priority": index % 5} for index in range(args.rows)]
+    transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        started = time.perf_counter()
+        for item in payload:
+            (await http.post("/items/", json=item)).raise_for_status()
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        (await http.post("/items/bulk", json=payload)).raise_for_status()
+        bulk = time.perf_counter() - started
+
+    await engine.dispose()
+    print(f"{'N requests':<12} rows={args.rows:<6} {single * 1000:10.1f} ms")
+    print(f"{'1 bulk':<12} rows={args.rows:<6} {bulk * 1000:10.1f} ms  ({single / bulk:.1f}x)")
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.url or f"sqlite+aiosqlite:///{Path(directory) / 'bench.sqlite3'}"
+        asyncio.run(run(args, url))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--url", help="Async database URL (defaults to a temporary SQLite file)")
+    parser.add_argument("--rows", type=int, default=1000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
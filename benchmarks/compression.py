@@ -0,0 +1,107 @@
+"""
+Bytes on the wire and CPU cost of compressing JSON list responses of several sizes, with every encoding
+installed (`br` and `zstd` require their extras), both at once and streamed in flushed chunks as
+`CompressionMiddleware` does for streaming responses.
+
+    python -m benchmarks.compression --sizes 1 10 100 1000 --levels gzip=6 br=4 zstd=3
+"""
+import argparse
+import timeit
+from typing import Any, Optional
+
+import orjson
+
+from utils.compression import CODECS, Codec, get_codec
+from utils.exceptions.generic import ImproperlyConfigured
+
+
+def build_body(size: int) -> bytes:
+    """A list page of todos of about `size` KiB."""
+    rows: list[dict[str, Any]] = []
+    body = b"[]"
+    while len(body) < size * 1024:
+        id = len(rows) + 1
+        rows.extend(
+            {
+                "id": id + offset,
+                "title": f"Todo {id + offset}",
+                "description": f"Description of the todo number {id + offset}",
+                "priority": (id + offset) % 5,
+                "complete": (id + offset) % 2 == 0,
+                "owner_id": (id + offset) % 17,
+                "created_at": "2024-01-01T10:00:00",
+                "updated_at": "2024-01-02T10:00:00",
+            }
+            for offset in range(50)
+        )
+        body = orjson.dumps(rows)
+    return body[: size * 1024]
+
+
+def compress_streaming(codec: Codec, body: bytes, chunk_size: int) -> bytes:
+    compressor = codec.compressor()
+    chunks = [compressor.compress(body[i : i + chunk_size]) for i in range(0, len(body), chunk_size)]
+    return b"".join(chunks) + compressor.finish()
+
+
+def get_codecs(levels: dict[str, int]) -> list[Codec]:
+    codecs = []
+    for encoding in CODECS:
+        try:
+            codecs.append(get_codec(encoding, levels.get(encoding)))
+        except ImproperlyConfigured as exc:
+            print(f"Skipping `{encoding}`: {exc}")
+    return codecs
+
+
+def measure(codec: Optional[Codec], body: bytes, args: argparse.Namespace) -> tuple[int, float, int, float]:
+    if codec is None:
+        return len(body), 0.0, len(body), 0.0
+
+    compressed = codec.compress(body)
+    streamed = compress_streaming(codec, body, args.chunk_size)
+    timer = timeit.Timer(lambda: codec.compress(body))
+    streaming_timer = timeit.Timer(lambda: compress_streaming(codec, body, args.chunk_size))
+    number, _ = timer.autorange()
+    streaming_number, _ = streaming_timer.autorange()
+    elapsed = min(timer.repeat(repeat=args.repeat, number=number)) / number
+    streaming_elapsed = min(streaming_timer.repeat(repeat=args.repeat, number=streaming_number))
+    streaming_elapsed /= streaming_number
+    return len(compressed), elapsed * 1e6, len(streamed), streaming_elapsed * 1e6
+
+
+def run(args: argparse.Namespace) -> None:
+    levels = {encoding: int(level) for encoding, level in (item.split("=") for item in args.levels)}
+    codecs: list[Optional[Codec]] = [None, *get_codecs(levels)]
+
+    print(
+        f"{'size':>8} {'encoding':<9} {'bytes':>10} {'ratio':>6} {'µs':>10} {'MB/s':>7}"
+        f" {'stream bytes':>13} {'stream µs':>10}"
+    )
+    for size in args.sizes:
+        body = build_body(size)
+        for codec in codecs:
+            compressed, elapsed, streamed, streaming_elapsed = measure(codec, body, args)
+            throughput = f"{len(body) / elapsed:.0f}" if elapsed else "-"
+            encoding = codec.encoding if codec else "identity"
+            print(
+                f"{size:>6}KB {encoding:<9} {compressed:>10} {len(body) / compressed:>6.1f} {elapsed:>10.1f}"
+                f" {throughput:>7} {streamed:>13} {streaming_elapsed:>10.1f}"
+            )
+
+
+def main() -> None:
+    run(parse_args())
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000], help="Body sizes in KiB")
+    parser.add_argument("--levels", nargs="*", default=[], help="Levels by encoding, e.g., gzip=6")
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024, help="Streamed chunks size in bytes")
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Rows/second served by a list endpoint returning ORM instances (`AsyncBaseRepository.list`, serialized by
+`jsonable_encoder`) versus read-only row mappings (`AsyncBaseRepository.list_mappings` + `RowsJSONResponse`).
+
+    python -m benchmarks.core_rows --sizes 100 1000 10000
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from utils.database.async_repository import AsyncBaseRepository
+from utils.pagination import CountStrategy, LimitOffsetPagination
+from utils.responses import RowsJSONResponse
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str]
+    description: Mapped[Optional[str]]
+    priority: Mapped[int]
+    complete: Mapped[bool]
+
+
+class AsyncItemRepository(AsyncBaseRepository[Item]):
+    model = Item
+
+
+def build_app(async_session_maker: async_sessionmaker[Any]) -> FastAPI:
+    app = FastAPI()
+
+    def get_pagination(limit: int) -> LimitOffsetPagination:
+        schema = SimpleNamespace(limit=limit, offset=1)
+        return LimitOffsetPagination(schema, count_strategy=CountStrategy.SKIP)
+
+    @app.get("/orm", response_model=None)
+    async def list_orm(limit: int) -> Any:
+        async with async_session_maker() as session:
+            return await AsyncItemRepository(session=session).list(pagination_manager=get_pagination(limit))
+
+    @app.get("/mappings", response_model=None)
+    async def list_mappings(limit: int) -> Any:
+        async with async_session_maker() as session:
+            repository = AsyncItemRepository(session=session)
+            return RowsJSONResponse(await repository.list_mappings(pagination_manager=get_pagination(limit)))
+
+    return app
+
+
+async def run(args: argparse.Namespace, url: str) -> None:
+    # NOTE: The async engine must live within a single event loop
+    engine = create_async_engine(url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+        rows = [
+            {"title": f"item-{index}", "description": "x" * 40, "priority": index % 5, "complete": False}
+            for index in range(max(args.sizes) + 1)
+        ]
+        await connection.execute(insert(Item), rows)
+
+    app = build_app(async_sessionmaker(bind=engine, expire_on_commit=False))
+    transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        print(f"{'rows':>8} {'orm (rows/s)':>14} {'mappings (rows/s)':>18}")
+        for size in args.sizes:
+            results = []
+            for path in ("/orm", "/mappings"):
+                started = time.perf_counter()
+                for _ in range(args.repeat):
+                    response = await http.get(path, params={"limit": size})
+                    response.raise_for_status()
+                    assert len(response.json()) == size
+                results.append(size * args.repeat / (time.perf_counter() - started))
+            print(f"{size:>8} {results[0]:>14.0f} {results[1]:>18.0f}  ({results[1] / results[0]:.1f}x)")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.url or f"sqlite+aiosqlite:///{Path(directory) / 'bench.sqlite3'}"
+        asyncio.run(run(args, url))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--url", help="Async database URL (defaults to a temporary SQLite file)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
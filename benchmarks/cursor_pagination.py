@@ -0,0 +1,92 @@
+"""
+Latency of fetching a page at increasing depths with `LimitOffsetPagination` (OFFSET)
+versus `CursorPagination` (keyset seek).
+
+    python -m benchmarks.cursor_pagination --rows 200000 --page-size 50
+"""
+import argparse
+import time
+from statistics import median
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from sqlalchemy import Index, create_engine, insert
+from sqlalchemy.orm import DeclarativeBase, Mapped, Query, Session, mapped_column
+
+from utils.pagination import CursorPagination, CursorSchema, LimitOffsetPagination
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+    __table_args__ = (Index("ix_item_priority_id", "priority", "id"),)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    priority: Mapped[int]
+    name: Mapped[str]
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return median(timings) * 1000
+
+
+def main() -> None:
+    args = parse_args()
+    engine = create_engine(args.url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.execute(
+            insert(Item), [{"priority": index % 5, "name": f"item-{index}"} for index in range(args.rows)]
+        )
+        session.commit()
+
+        query: Query[Any] = session.query(Item).order_by(Item.priority.desc())
+        print(f"{'page':>8} {'offset (ms)':>12} {'cursor (ms)':>12}")
+        for page in args.pages:
+            offset = (page - 1) * args.page_size
+            if offset >= args.rows:
+                break
+
+            def fetch_offset() -> None:
+                schema = SimpleNamespace(limit=args.page_size, offset=offset)
+                LimitOffsetPagination(schema).paginate_queryset(query).all()
+
+            # The cursor a client would hold after walking to this page
+            boundary = query.order_by(Item.id.desc()).offset(offset - 1).first() if offset else None
+            cursor = (
+                CursorPagination.encode_cursor([boundary.priority, boundary.id], reverse=False)
+                if boundary
+                else None
+            )
+
+            def fetch_cursor() -> None:
+                schema = CursorSchema(cursor=cursor, page_size=args.page_size)
+                paginator = CursorPagination(schema, model=Item, ordering=["-priority"])
+                paginator.paginate_results(paginator.paginate_queryset(query).all())
+
+            offset_ms = timeit(fetch_offset, args.repeat)
+            cursor_ms = timeit(fetch_cursor, args.repeat)
+            print(f"{page:>8} {offset_ms:>12.3f} {cursor_ms:>12.3f}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--url", default="sqlite://", help="Database URL (defaults to in-memory SQLite)")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 100, 1000, 4000])
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Per-request cost of building (and executing) a filtered/ordered query through `BaseFilterManager`
+with and without the `FilterPlan` cache.
+
+    python -m benchmarks.filter_plan_cache --iterations 5000
+"""
+import argparse
+import time
+from typing import Optional
+
+from fastapi import Query
+from sqlalchemy import create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from utils.cache import TTLCache
+from utils.filters import BaseFilterManager, FilterSchema
+from utils.filters.core import FilterPlan
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str]
+    description: Mapped[str]
+    priority: Mapped[int]
+    complete: Mapped[bool]
+
+
+class ItemFilterSchema(FilterSchema):
+    title__ieq: Optional[str] = Query(None)
+    priority__gte: Optional[int] = Query(None)
+    priority__lte: Optional[int] = Query(None)
+    complete__eq: Optional[bool] = Query(None)
+    description__icontains: Optional[str] = Query(None)
+
+
+class ItemFilterManager(BaseFilterManager):
+    model = Item
+
+
+def run(
+    session: Session, iterations: int, plan_cache: Optional[TTLCache[FilterPlan]], execute: bool
+) -> float:
+    ItemFilterManager.plan_cache = plan_cache
+    started = time.perf_counter()
+    for index in range(iterations):
+        filters = ItemFilterSchema(
+            priority__gte=index % 3, priority__lte=5, complete__eq=bool(index % 2), description__icontains="x"
+        )
+        manager = ItemFilterManager(filters=filters, ordering=["-priority", "id"])
+        query = manager.order_by_queryset(manager.filter_queryset(session.query(Item)))  # type: ignore
+        if execute:
+            query.all()
+        else:
+            query.statement
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main() -> None:
+    args = parse_args()
+    engine = create_engine(args.url)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        for execute in (False, True):
+            label = "build + execute" if execute else "build"
+            uncached = run(session, args.iterations, None, execute)
+            cache: TTLCache[FilterPlan] = TTLCache(ttl=float("inf"))
+            cached = run(session, args.iterations, cache, execute)
+            print(f"{label:<16} uncached={uncached:8.1f}us  cached={cached:8.1f}us  {cache.get_stats()}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--url", default="sqlite://", help="Database URL (defaults to in-memory SQLite)")
+    parser.add_argument("--iterations", type=int, default=5000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
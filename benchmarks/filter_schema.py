@@ -0,0 +1,100 @@
+"""
+Per-request cost of turning query parameters into a filtered/ordered statement: validating the
+`FilterSchema` (parse), then building the `BaseFilterManager` and its statement (build), the
+`FilterPlan` being cached as in production. Nothing is executed.
+
+    python -m benchmarks.filter_schema --iterations 20000
+"""
+import argparse
+import time
+from typing import Any, Callable, Optional
+
+from fastapi import Query
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from utils.filters import BaseFilterManager, FilterSchema
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str]
+    description: Mapped[str]
+    priority: Mapped[int]
+    complete: Mapped[bool]
+
+
+class ItemFilterSchema(FilterSchema):
+    title__ieq: Optional[str] = Query(None)
+    priority__gt: Optional[int] = Query(None)
+    priority__gte: Optional[int] = Query(None)
+    priority__lt: Optional[int] = Query(None)
+    priority__lte: Optional[int] = Query(None)
+    priority__eq: Optional[int] = Query(None)
+    complete__eq: Optional[bool] = Query(None)
+    description__contains: Optional[str] = Query(None)
+    description__icontains: Optional[str] = Query(None)
+
+    class Meta:
+        model = Item
+        ordering_fields = ["id", "priority"]
+
+
+class ItemFilterManager(BaseFilterManager):
+    model = Item
+
+
+def get_params(index: int) -> dict[str, Any]:
+    """Query parameters as FastAPI passes them: every declared one, `None` when not sent."""
+    params: dict[str, Any] = dict.fromkeys(ItemFilterSchema.model_fields)
+    params.update(priority__gte=index % 3, complete__eq=bool(index % 2), description__icontains="x")
+    return params
+
+
+def timeit(func: Callable[[int], Any], iterations: int) -> float:
+    started = time.perf_counter()
+    for index in range(iterations):
+        func(index)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def run(args: argparse.Namespace) -> None:
+    ordering = ["-priority", "id"]
+    params = [get_params(index) for index in range(args.iterations)]
+    schemas = [ItemFilterSchema(**param) for param in params]
+
+    def parse(index: int) -> None:
+        ItemFilterSchema(**params[index])
+
+    def build(index: int) -> None:
+        manager = ItemFilterManager(filters=schemas[index], ordering=ordering)
+        manager.order_by_queryset(manager.filter_queryset(select(Item)))
+
+    def parse_and_build(index: int) -> None:
+        manager = ItemFilterManager(filters=ItemFilterSchema(**params[index]), ordering=ordering)
+        manager.order_by_queryset(manager.filter_queryset(select(Item)))
+
+    for name, func in (("parse", parse), ("build", build), ("parse + build", parse_and_build)):
+        # NOTE: Best of `repeat`, the first round warms the plan cache up
+        elapsed = min(timeit(func, args.iterations) for _ in range(args.repeat))
+        print(f"{name:<14} {elapsed:8.2f}us")
+
+
+def main() -> None:
+    run(parse_args())
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Serialization cost of a list page (the time spent rendering the response body once the rows are fetched):
+ORM instances through `jsonable_encoder` + stdlib `json` (FastAPI's default path) versus a `ReadSchema`
+response model + `ORJSONResponse`, and row mappings through stdlib `json` versus `ORJSONResponse`.
+
+    python -m benchmarks.json_serialization --sizes 10 100 1000
+"""
+import argparse
+import json
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from starlette.responses import JSONResponse
+
+from utils.responses import ORJSONResponse
+from utils.schemas import ReadSchema
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str]
+    description: Mapped[Optional[str]]
+    priority: Mapped[int]
+    complete: Mapped[bool]
+
+
+class ItemReadSchema(ReadSchema):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    priority: Optional[int] = None
+    complete: Optional[bool] = None
+
+
+def build_renderers(instances: list[Item], mappings: list[Any]) -> dict[str, Callable[[], bytes]]:
+    # NOTE: Mirrors `fastapi.routing.serialize_response` for a `response_model=list[ItemReadSchema]` route
+    adapter = TypeAdapter(list[ItemReadSchema])
+    return {
+        "orm + jsonable_encoder": lambda: JSONResponse(jsonable_encoder(instances)).body,
+        "orm + ReadSchema + orjson": lambda: ORJSONResponse(
+            adapter.dump_python(adapter.validate_python(instances), mode="json")
+        ).body,
+        "rows + json": lambda: json.dumps([dict(row) for row in mappings], separators=(",", ":")).encode(),
+        "rows + orjson": lambda: ORJSONResponse(mappings).body,
+    }
+
+
+def run(args: argparse.Namespace, url: str) -> None:
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        rows = [
+            {"title": f"item-{index}", "description": "x" * 40, "priority": index % 5, "complete": False}
+            for index in range(max(args.sizes))
+        ]
+        session.execute(insert(Item), rows)
+        session.commit()
+
+        print(f"{'rows':>6} " + " ".join(f"{name:>26}" for name in build_renderers([], [])) + "   (µs/page)")
+        for size in args.sizes:
+            instances = list(session.scalars(select(Item).limit(size)))
+            mappings = session.execute(select(*Item.__table__.columns).limit(size)).mappings().all()
+            timings = [
+                min(timeit.repeat(render, number=args.number, repeat=args.repeat)) / args.number * 1e6
+                for render in build_renderers(instances, mappings).values()
+            ]
+            print(f"{size:>6} " + " ".join(f"{timing:>26.1f}" for timing in timings))
+            session.expunge_all()
+
+    engine.dispose()
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        run(args, args.url or f"sqlite:///{Path(directory) / 'bench.sqlite3'}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--url", help="Database URL (defaults to a temporary SQLite file)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+p50/p99 latency of a trivial route without middleware, wrapped by the former `BaseHTTPMiddleware` based
+`SQLAlchemyExceptionHandlerMiddleware` and wrapped by the current pure ASGI one.
+Requests are sent straight to the ASGI app, so no client or server overhead is measured.
+
+    python -m benchmarks.middleware_latency --requests 5000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Optional
+
+from fastapi import FastAPI, Request, Response
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import Message
+
+from utils.middleware import SQLAlchemyExceptionHandlerMiddleware
+from utils.responses import DatabaseErrorResponse
+
+
+class BaseHTTPExceptionHandlerMiddleware(BaseHTTPMiddleware):
+    """The former implementation, kept as the baseline."""
+
+    def __init__(self, app: Any, debug: bool = False) -> None:
+        super().__init__(app)
+        self.debug = debug
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        try:
+            return await call_next(request)
+        except SQLAlchemyError as exc:
+            return DatabaseErrorResponse(debug_message=str(exc) if self.debug else None)
+
+
+def build_app(middleware: Optional[type]) -> FastAPI:
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware)
+
+    @app.get("/ping")
+    async def ping() -> dict[str, bool]:
+        return {"ok": True}
+
+    return app
+
+
+async def request(app: FastAPI) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    request_sent = False
+    response_complete = asyncio.Event()
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # NOTE: `BaseHTTPMiddleware` listens for the client disconnection while the response is sent
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_complete.set()
+
+    await app(scope, receive, send)
+
+
+async def run(args: argparse.Namespace) -> None:
+    apps = {
+        "no middleware": build_app(None),
+        "BaseHTTPMiddleware": build_app(BaseHTTPExceptionHandlerMiddleware),
+        "pure ASGI": build_app(SQLAlchemyExceptionHandlerMiddleware),
+    }
+    print(f"{'':<20} {'p50 (µs)':>10} {'p99 (µs)':>10}")
+    for name, app in apps.items():
+        for _ in range(args.warmup):
+            await request(app)
+        latencies = []
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            await request(app)
+            latencies.append((time.perf_counter() - started) * 1e6)
+        percentiles = statistics.quantiles(latencies, n=100)
+        print(f"{name:<20} {percentiles[49]:>10.1f} {percentiles[98]:>10.1f}")
+
+
+def main() -> None:
+    asyncio.run(run(parse_args()))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=200)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
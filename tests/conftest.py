@@ -1,13 +1,20 @@
-from typing import Generator
-from unittest.mock import MagicMock, Mock
+from typing import AsyncGenerator, Generator
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from utils.database.models import APIBaseModel
 
 DATABASE_URL = "sqlite:///:memory:"
+ASYNC_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
 
 
 @pytest.fixture(scope="module")
@@ -31,6 +38,19 @@ def session(engine, create_tables) -> Session:  # type: ignore
     session.close()
 
 
+@pytest.fixture
+async def async_session() -> AsyncGenerator[AsyncSession, None]:
+    engine = create_async_engine(ASYNC_DATABASE_URL)
+    async with engine.begin() as connection:
+        await connection.run_sync(APIBaseModel.metadata.create_all)
+
+    SessionLocal = async_sessionmaker(autoflush=False, bind=engine, expire_on_commit=False)
+    async with SessionLocal() as session:
+        yield session
+        await session.rollback()
+    await engine.dispose()
+
+
 @pytest.fixture
 def mock_repository() -> Mock:
     mock = Mock()
@@ -40,3 +60,14 @@ def mock_repository() -> Mock:
     mock.create.return_value = MagicMock()
     mock.update.return_value = MagicMock()
     return mock
+
+
+@pytest.fixture
+def mock_async_repository() -> AsyncMock:
+    mock = AsyncMock()
+    mock.retrieve_by_id.return_value = MagicMock()
+    mock.retrieve.return_value = MagicMock()
+    mock.list.return_value = [MagicMock()]
+    mock.create.return_value = MagicMock()
+    mock.update.return_value = MagicMock()
+    return mock
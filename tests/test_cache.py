@@ -0,0 +1,94 @@
+import pickle
+from typing import Any, Optional
+
+from utils.cache import RedisCacheBackend, TTLCache
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_get_and_set(self) -> None:
+        cache: TTLCache[int] = TTLCache()
+        assert cache.get("key") is None
+        assert cache.get("key", 0) == 0
+
+        cache.set("key", 1)
+        assert cache.get("key") == 1
+        assert cache.get_stats() == {"hits": 1, "misses": 2, "evictions": 0, "size": 1, "maxsize": 1024}
+
+    def test_expiration(self) -> None:
+        timer = FakeTimer()
+        cache: TTLCache[int] = TTLCache(ttl=10, timer=timer)
+        cache.set("key", 1)
+        cache.set("short", 2, ttl=1)
+
+        timer.now = 5
+        assert cache.get("key") == 1
+        assert cache.get("short") is None
+
+        timer.now = 10
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_eviction(self) -> None:
+        cache: TTLCache[int] = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_delete_and_clear(self) -> None:
+        cache: TTLCache[int] = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        cache.delete("missing")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, tuple[bytes, Optional[int]]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        item = self.data.get(key)
+        return item[0] if item is not None else None
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        self.data[key] = (value, ex)
+
+    def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+
+class TestRedisCacheBackend:
+    def test_get_set_and_delete(self) -> None:
+        client = FakeRedis()
+        backend = RedisCacheBackend(client, ttl=30)
+        value: dict[str, Any] = {"rows": [{"id": 1}]}
+
+        assert backend.get("key") is None
+        backend.set("key", value)
+        backend.set("short", 1, ttl=0.5)
+        assert backend.get("key") == value
+        assert client.data["key"] == (pickle.dumps(value), 30)
+        assert client.data["short"][1] == 1
+
+        backend.delete("key")
+        assert backend.get("key") is None
+        assert backend.get_stats() == {"hits": 1, "misses": 2}
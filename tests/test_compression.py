@@ -0,0 +1,60 @@
+import gzip
+import sys
+
+import pytest
+
+from utils.compression import BrotliCodec, GzipCodec, ZstdCodec, get_codec, parse_accept_encoding
+from utils.exceptions.generic import ImproperlyConfigured
+
+DATA = b'{"id": 1, "title": "Compress me"}\n' * 100
+
+
+class TestGzipCodec:
+    def test_compress(self) -> None:
+        codec = GzipCodec()
+        assert codec.encoding == "gzip"
+        assert gzip.decompress(codec.compress(DATA)) == DATA
+        assert len(codec.compress(DATA)) < len(DATA)
+
+    def test_compressor_flushes_every_chunk(self) -> None:
+        compressor = GzipCodec(level=1).compressor()
+        chunks = [compressor.compress(DATA[:100]), compressor.compress(DATA[100:]), compressor.finish()]
+        assert all(chunks[:2])
+        assert gzip.decompress(b"".join(chunks)) == DATA
+
+
+@pytest.mark.parametrize("codec_class, module", [(BrotliCodec, "brotli"), (ZstdCodec, "zstandard")])
+def test_optional_codecs(codec_class, module) -> None:  # type: ignore
+    library = pytest.importorskip(module)
+    codec = codec_class()
+    compressor = codec.compressor()
+    streamed = compressor.compress(DATA[:100]) + compressor.compress(DATA[100:]) + compressor.finish()
+    if module == "brotli":
+        assert library.decompress(codec.compress(DATA)) == library.decompress(streamed) == DATA
+    else:
+        decompressor = library.ZstdDecompressor()
+        assert decompressor.decompressobj().decompress(streamed) == DATA
+        assert decompressor.decompress(codec.compress(DATA)) == DATA
+
+
+@pytest.mark.parametrize("encoding, module", [("br", "brotli"), ("zstd", "zstandard")])
+def test_optional_codecs_not_installed(monkeypatch, encoding, module) -> None:  # type: ignore
+    monkeypatch.setitem(sys.modules, module, None)
+    with pytest.raises(ImproperlyConfigured):
+        get_codec(encoding)
+
+
+def test_get_codec() -> None:
+    codec = get_codec("gzip", 9)
+    assert isinstance(codec, GzipCodec)
+    assert codec.level == 9
+
+    with pytest.raises(ImproperlyConfigured):
+        get_codec("deflate")
+
+
+def test_parse_accept_encoding() -> None:
+    assert parse_accept_encoding("") == {}
+    assert parse_accept_encoding("gzip, deflate, br") == {"gzip": 1.0, "deflate": 1.0, "br": 1.0}
+    assert parse_accept_encoding("GZIP;q=0.5, br;q=0, *;q=0.1") == {"gzip": 0.5, "br": 0.0, "*": 0.1}
+    assert parse_accept_encoding("gzip;q=nope") == {"gzip": 0.0}
@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from starlette.requests import Request
+
+from utils.conditional import NotModifiedResponse, get_validators, is_conditional, is_not_modified
+
+ROWS = [
+    {"id": 1, "updated_at": datetime(2024, 1, 1, 10, 0, 0, 500)},
+    {"id": 2, "updated_at": datetime(2024, 1, 2, 10, 0, 0)},
+]
+
+
+def get_request(**headers: str) -> Request:
+    raw_headers = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "headers": raw_headers})
+
+
+class TestGetValidators:
+    def test_validators(self) -> None:
+        validators = get_validators(ROWS)
+        assert validators.etag.startswith('W/"')
+        assert validators.last_modified == datetime(2024, 1, 2, 10, 0, 0, tzinfo=timezone.utc)
+        assert validators.headers == {
+            "ETag": validators.etag,
+            "Last-Modified": "Tue, 02 Jan 2024 10:00:00 GMT",
+        }
+
+    def test_etag_changes_with_rows(self) -> None:
+        etag = get_validators(ROWS).etag
+        assert get_validators(list(ROWS)).etag == etag
+        assert get_validators(ROWS[:1]).etag != etag
+        assert get_validators([ROWS[0], {**ROWS[1], "id": 3}]).etag != etag
+        assert get_validators([ROWS[0], {**ROWS[1], "updated_at": datetime(2024, 1, 3)}]).etag != etag
+
+    def test_instances_and_empty_rows(self) -> None:
+        instance = SimpleNamespace(**ROWS[0])
+        assert get_validators([instance]) == get_validators(ROWS[:1])
+
+        validators = get_validators([])
+        assert validators.last_modified is None
+        assert "Last-Modified" not in validators.headers
+
+
+class TestIsNotModified:
+    def test_if_none_match(self) -> None:
+        validators = get_validators(ROWS)
+        strong_etag = validators.etag.removeprefix("W/")
+
+        assert is_conditional(get_request(if_none_match="*"))
+        assert not is_conditional(get_request())
+        assert is_not_modified(get_request(if_none_match=validators.etag), validators)
+        assert is_not_modified(get_request(if_none_match=f'W/"other", {strong_etag}'), validators)
+        assert is_not_modified(get_request(if_none_match="*"), validators)
+        assert not is_not_modified(get_request(if_none_match='W/"other"'), validators)
+        assert not is_not_modified(get_request(), validators)
+
+    def test_if_modified_since(self) -> None:
+        validators = get_validators(ROWS)
+        assert is_not_modified(get_request(if_modified_since="Tue, 02 Jan 2024 10:00:00 GMT"), validators)
+        assert not is_not_modified(get_request(if_modified_since="Tue, 02 Jan 2024 09:59:59 GMT"), validators)
+        assert not is_not_modified(get_request(if_modified_since="yesterday"), validators)
+        request = get_request(if_modified_since="Tue, 02 Jan 2024 10:00:00 GMT")
+        assert not is_not_modified(request, get_validators([]))
+
+    def test_if_none_match_takes_precedence(self) -> None:
+        validators = get_validators(ROWS)
+        request = get_request(if_none_match='W/"other"', if_modified_since="Tue, 02 Jan 2024 10:00:00 GMT")
+        assert not is_not_modified(request, validators)
+
+
+def test_not_modified_response() -> None:
+    validators = get_validators(ROWS)
+    response = NotModifiedResponse(validators)
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == validators.etag
+    assert response.headers["last-modified"] == "Tue, 02 Jan 2024 10:00:00 GMT"
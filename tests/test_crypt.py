@@ -1,6 +1,11 @@
+import asyncio
+import threading
+
+import pytest
 from passlib.context import CryptContext
 
 from utils.crypt import BCryptContext, get_bcrypt_context
+from utils.exceptions.server import ServiceUnavailableException
 
 
 def test_bcrypt_context_initialization():
@@ -29,3 +34,62 @@ def test_verify_password():
 def test_get_bcrypt_context():
     context = get_bcrypt_context()
     assert isinstance(context, BCryptContext)
+
+
+def test_verify_and_update():
+    context = BCryptContext(bcrypt__rounds=4)
+    hashed_password = context.get_password_hash("test_password")
+    assert context.verify_and_update("test_password", hashed_password) == (True, None)
+    assert context.verify_and_update("wrong_password", hashed_password) == (False, None)
+
+    # NOTE: Hashes with different rounds than the configured ones are deprecated
+    context = BCryptContext(bcrypt__rounds=5)
+    verified, new_hash = context.verify_and_update("test_password", hashed_password)
+    assert verified
+    assert new_hash is not None and new_hash.startswith("$2b$05$")
+    assert context.verify_password("test_password", new_hash)
+
+
+def test_dummy_verify():
+    context = BCryptContext(bcrypt__rounds=4)
+    assert context.dummy_verify() is False
+
+
+@pytest.mark.anyio
+async def test_async_methods():
+    context = BCryptContext(bcrypt__rounds=4)
+    hashed_password = await context.async_get_password_hash("test_password")
+
+    assert await context.async_verify_password("test_password", hashed_password)
+    assert not await context.async_verify_password("wrong_password", hashed_password)
+    assert await context.async_verify_and_update("test_password", hashed_password) == (True, None)
+    assert await context.async_dummy_verify() is False
+    assert context.get_stats() == {
+        "max_workers": 4,
+        "max_queue": 64,
+        "running": 0,
+        "queued": 0,
+        "rejected": 0,
+    }
+
+
+@pytest.mark.anyio
+async def test_run_in_pool_rejects_when_saturated():
+    context = BCryptContext(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    running = asyncio.ensure_future(context.run_in_pool(release.wait))
+    queued = asyncio.ensure_future(context.run_in_pool(release.wait))
+    await asyncio.sleep(0.05)
+    assert context.get_stats()["running"] == 1
+    assert context.get_stats()["queued"] == 1
+
+    with pytest.raises(ServiceUnavailableException) as exc_info:
+        await context.run_in_pool(release.wait)
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "1"}
+
+    release.set()
+    assert await running and await queued
+    assert context.get_stats()["rejected"] == 1
+    assert context.get_stats()["queued"] == 0
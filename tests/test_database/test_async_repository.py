@@ -0,0 +1,238 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError, NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from utils.database.async_repository import AsyncBaseRepository, AsyncOwnerScopedRepository
+from utils.database.models import APIBaseModel
+from utils.exceptions.generic import ImproperlyConfigured
+from utils.pagination import LimitOffsetPagination
+
+
+class AsyncMockModel(APIBaseModel):
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str]
+
+
+class AsyncOwnedMockModel(APIBaseModel):
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str]
+    owner_id: Mapped[int]
+
+
+@pytest.mark.anyio
+class TestAsyncBaseRepository:
+    @pytest.fixture(autouse=True)
+    def setup_class(self, async_session: AsyncSession) -> None:
+        self.session = async_session
+        self.repository: AsyncBaseRepository[AsyncMockModel] = AsyncBaseRepository(session=async_session)
+        self.repository.model = AsyncMockModel
+
+    async def test_get_model(self) -> None:
+        assert self.repository.get_model() == AsyncMockModel
+
+        self.repository.model = None
+        with pytest.raises(ImproperlyConfigured):
+            self.repository.get_model()
+
+    async def test_create(self) -> None:
+        entity = {"id": 1, "name": "Test"}
+        await self.repository.create(entity=entity)
+
+        created_entity = (await self.session.scalars(select(AsyncMockModel))).first()
+        assert created_entity.id == 1  # type: ignore
+        assert created_entity.name == "Test"  # type: ignore
+
+        with pytest.raises(IntegrityError):
+            await self.repository.create(entity=entity)
+
+    async def test_retrieve_by_id(self) -> None:
+        await self.repository.create(entity={"id": 1, "name": "Test"})
+
+        retrieved_entity = await self.repository.retrieve_by_id(id=1)
+        assert retrieved_entity.name == "Test"
+
+        with pytest.raises(NoResultFound):
+            await self.repository.retrieve_by_id(id=999)
+
+    async def test_retrieve(self) -> None:
+        await self.repository.create(entity={"id": 1, "name": "Test"})
+
+        retrieved_entity = await self.repository.retrieve(name="Test")
+        assert retrieved_entity.id == 1
+
+    async def test_list(self) -> None:
+        for id in range(1, 6):
+            await self.repository.create(entity={"id": id, "name": f"Test{id}"})
+
+        assert len(await self.repository.list()) == 5
+        assert [entity.id for entity in await self.repository.list(name="Test2")] == [2]
+
+        pagination = LimitOffsetPagination(schema=type("MockSchema", (), {"offset": 1, "limit": 2}))
+        entities = await self.repository.list(pagination_manager=pagination)
+        assert [entity.id for entity in entities] == [2, 3]
+        assert pagination.count == 5
+
+    async def test_list_with_filter_manager(self) -> None:
+        filter_manager_mock = MagicMock()
+        filter_manager_mock.filter_queryset.side_effect = lambda query: query
+        filter_manager_mock.order_by_queryset.side_effect = lambda query: query
+        await self.repository.list(filter_manager=filter_manager_mock, name="Test")
+        filter_manager_mock.filter_queryset.assert_called()
+        filter_manager_mock.order_by_queryset.assert_called()
+
+    async def test_list_mappings(self) -> None:
+        for id in range(1, 6):
+            await self.repository.create(entity={"id": id, "name": f"Test{id}"})
+
+        mappings = await self.repository.list_mappings(name="Test2")
+        assert mappings == [{"id": 2, "name": "Test2"}]
+        assert not any(isinstance(row, AsyncMockModel) for row in mappings)
+
+        pagination = LimitOffsetPagination(schema=type("MockSchema", (), {"offset": 1, "limit": 2}))
+        mappings = await self.repository.list_mappings(pagination_manager=pagination)
+        assert [row["id"] for row in mappings] == [2, 3]
+        assert pagination.count == 5
+
+        fields_manager_mock = MagicMock()
+        fields_manager_mock.columns_queryset.side_effect = lambda query: query.with_only_columns(
+            AsyncMockModel.id
+        )
+        mappings = await self.repository.list_mappings(fields_manager=fields_manager_mock, name="Test1")
+        assert mappings == [{"id": 1}]
+
+    async def test_stream_mappings(self) -> None:
+        await self.repository.bulk_create(entities=[{"id": id, "name": f"Test{id}"} for id in range(1, 6)])
+
+        rows = [row async for row in self.repository.stream_mappings(chunk_size=2)]
+        assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+
+        rows = [row async for row in self.repository.stream_mappings(name="Test3")]
+        assert rows == [{"id": 3, "name": "Test3"}]
+
+    async def test_fields_manager(self) -> None:
+        await self.repository.create(entity={"id": 1, "name": "Test"})
+        fields_manager_mock = MagicMock()
+        fields_manager_mock.only_queryset.side_effect = lambda query: query
+
+        assert len(await self.repository.list(fields_manager=fields_manager_mock)) == 1
+        assert (await self.repository.retrieve_by_id(id=1, fields_manager=fields_manager_mock)).id == 1
+        assert fields_manager_mock.only_queryset.call_count == 2
+
+    async def test_update(self) -> None:
+        await self.repository.create(entity={"id": 1, "name": "Test"})
+
+        updated_entity = await self.repository.update(id=1, entity={"id": 1, "name": "Test_Updated"})
+        assert updated_entity.name == "Test_Updated"
+
+        with pytest.raises(ValueError, match="ID in the entity does not match the given ID."):
+            await self.repository.update(id=1, entity={"id": 2})
+
+        with pytest.raises(NoResultFound):
+            await self.repository.update(id=999, entity={"name": "Missing"})
+
+    async def test_destroy(self) -> None:
+        await self.repository.create(entity={"id": 4, "name": "Test"})
+
+        await self.repository.destroy(id=4)
+
+        destroyed_entity = (await self.session.scalars(select(AsyncMockModel).filter_by(id=4))).first()
+        assert destroyed_entity is None
+
+        with pytest.raises(NoResultFound):
+            await self.repository.destroy(id=4)
+
+    async def test_update_with_returning(self) -> None:
+        self.repository.use_returning = True
+        await self.repository.create(entity={"id": 1, "name": "Test"})
+
+        updated_entity = await self.repository.update(id=1, entity={"name": "Test_Updated"})
+        assert updated_entity.name == "Test_Updated"
+
+        with pytest.raises(NoResultFound):
+            await self.repository.update(id=999, entity={"name": "Missing"})
+
+    async def test_destroy_with_returning(self) -> None:
+        self.repository.use_returning = True
+        await self.repository.create(entity={"id": 1, "name": "Test"})
+
+        await self.repository.destroy(id=1)
+        assert (await self.session.scalars(select(AsyncMockModel).filter_by(id=1))).first() is None
+
+        with pytest.raises(NoResultFound):
+            await self.repository.destroy(id=1)
+
+    async def test_bulk_create(self) -> None:
+        assert await self.repository.bulk_create(entities=[]) == []
+
+        created = await self.repository.bulk_create(entities=[{"name": "First"}, {"name": "Second"}])
+        assert [entity.name for entity in created] == ["First", "Second"]
+        assert len(await self.repository.list()) == 2
+
+    async def test_bulk_update(self) -> None:
+        await self.repository.bulk_create(entities=[{"id": 1, "name": "First"}, {"id": 2, "name": "Second"}])
+
+        updated_ids = await self.repository.bulk_update(
+            entities=[{"id": 2, "name": "Second_Updated"}, {"id": 999, "name": "Missing"}]
+        )
+        assert updated_ids == [2]
+        assert (await self.repository.retrieve_by_id(id=2)).name == "Second_Updated"
+
+        with pytest.raises(ValueError, match="Every entity must include its ID."):
+            await self.repository.bulk_update(entities=[{"name": "Without ID"}])
+
+    async def test_bulk_destroy(self) -> None:
+        await self.repository.bulk_create(entities=[{"id": id, "name": f"Test{id}"} for id in range(1, 4)])
+
+        assert await self.repository.bulk_destroy(ids=[3, 999, 1]) == [3, 1]
+        assert [entity.id for entity in await self.repository.list()] == [2]
+
+    async def test_perform_commit(self) -> None:
+        session_mock = AsyncMock()
+        self.repository.session = session_mock
+        await self.repository.perform_commit()
+        session_mock.commit.assert_awaited()
+
+
+@pytest.mark.anyio
+class TestAsyncOwnerScopedRepository:
+    @pytest.fixture(autouse=True)
+    async def setup_class(self, async_session: AsyncSession) -> None:
+        self.session = async_session
+        self.session.add_all(
+            [
+                AsyncOwnedMockModel(id=1, name="Mine", owner_id=1),
+                AsyncOwnedMockModel(id=2, name="Theirs", owner_id=2),
+            ]
+        )
+        await self.session.flush()
+        self.repository: AsyncOwnerScopedRepository[AsyncOwnedMockModel] = AsyncOwnerScopedRepository(
+            session=async_session, owner_id=1
+        )
+        self.repository.model = AsyncOwnedMockModel
+        self.repository.use_returning = True
+
+    async def test_reads_are_scoped(self) -> None:
+        assert [entity.id for entity in await self.repository.list()] == [1]
+        with pytest.raises(NoResultFound):
+            await self.repository.retrieve_by_id(id=2)
+
+    async def test_writes_are_scoped(self) -> None:
+        assert (await self.repository.create(entity={"id": 3, "name": "New", "owner_id": 2})).owner_id == 1
+        updated = await self.repository.update(id=1, entity={"name": "Updated", "owner_id": 2})
+        assert (updated.name, updated.owner_id) == ("Updated", 1)
+        with pytest.raises(NoResultFound):
+            await self.repository.update(id=2, entity={"name": "Stolen"})
+        with pytest.raises(NoResultFound):
+            await self.repository.destroy(id=2)
+        assert await self.repository.bulk_destroy(ids=[1, 2, 3]) == [1, 3]
+
+    async def test_bulk_updates_keep_the_owner(self) -> None:
+        entities = [{"id": 1, "name": "Given", "owner_id": 2}, {"id": 2, "name": "Stolen", "owner_id": 1}]
+        assert await self.repository.bulk_update(entities=entities) == [1]
+        statement = select(AsyncOwnedMockModel.id, AsyncOwnedMockModel.name, AsyncOwnedMockModel.owner_id)
+        rows = (await self.session.execute(statement)).all()
+        assert sorted(tuple(row) for row in rows) == [(1, "Given", 1), (2, "Theirs", 2)]
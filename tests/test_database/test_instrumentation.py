@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from utils.database.instrumentation import (
+    QueryBudgetExceeded,
+    current_query_stats,
+    fingerprint,
+    instrument_queries,
+    query_budget,
+)
+
+
+def test_fingerprint() -> None:
+    assert fingerprint("SELECT * FROM todo WHERE id = 1") == "SELECT * FROM todo WHERE id = ?"
+    assert fingerprint("SELECT * FROM todo\n  WHERE title = 'it''s'") == "SELECT * FROM todo WHERE title = ?"
+    assert fingerprint("SELECT * FROM todo1 WHERE id IN (?, ?, ?)") == "SELECT * FROM todo1 WHERE id IN (?)"
+    assert fingerprint("SELECT * FROM todo WHERE id IN (%(id_1_1)s, %(id_1_2)s)") == (
+        "SELECT * FROM todo WHERE id IN (?)"
+    )
+    assert fingerprint("SELECT * FROM todo WHERE id = $1") == "SELECT * FROM todo WHERE id = ?"
+
+
+class TestQueryBudget:
+    @pytest.fixture(scope="class")
+    def engine(self):  # type: ignore
+        engine = create_engine("sqlite://")
+        instrument_queries(engine)
+        yield engine
+        engine.dispose()
+
+    def test_within_budget(self, engine) -> None:  # type: ignore
+        with engine.connect() as connection:
+            with query_budget(2) as stats:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+
+        assert stats.count == 2
+        assert stats.duration > 0
+        assert stats.get_repeated() == {"SELECT ?": 2}
+        assert current_query_stats.get() is None
+
+    def test_budget_exceeded(self, engine) -> None:  # type: ignore
+        with engine.connect() as connection:
+            with pytest.raises(QueryBudgetExceeded, match="3 queries executed, 2 allowed"):
+                with query_budget(2):
+                    for id in range(3):
+                        connection.execute(text("SELECT :id"), {"id": id})
+
+    def test_failing_statements(self, engine) -> None:  # type: ignore
+        with engine.connect() as connection:
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    connection.execute(text("SELECT * FROM missing"))
+            with query_budget(1) as stats:
+                connection.execute(text("SELECT 1"))
+            # NOTE: Nothing left behind by the failed statements on the (pooled) connection
+            assert "query_started_at" not in connection.info
+        assert stats.count == 1
+
+    def test_not_recorded_outside_context(self, engine) -> None:  # type: ignore
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        assert current_query_stats.get() is None
+
+
+@pytest.mark.anyio
+async def test_async_engine() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    instrument_queries(engine)
+    try:
+        with query_budget(1) as stats:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+        assert stats.count == 1
+    finally:
+        await engine.dispose()
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from utils.database.metrics import Histogram, PoolMetrics
+
+
+class TestHistogram:
+    def test_observe(self) -> None:
+        histogram = Histogram(buckets=[0.1, 1])
+        for value in (0.05, 0.1, 0.5, 2):
+            histogram.observe(value)
+
+        stats = histogram.get_stats()
+        assert stats["count"] == 4
+        assert stats["sum"] == pytest.approx(2.65)
+        assert stats["buckets"] == {"0.1": 2, "1": 3, "+Inf": 4}
+
+
+class TestPoolMetrics:
+    def test_checkouts(self, tmp_path: Path) -> None:
+        engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite3'}", pool_size=1, max_overflow=0)
+        metrics = PoolMetrics(engine)
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            stats = metrics.get_stats()
+            assert stats["pool"] == "QueuePool"
+            assert stats["size"] == 1
+            assert stats["checkedout"] == 1
+            assert stats["hold"]["count"] == 0
+
+        with engine.connect():
+            pass
+
+        stats = metrics.get_stats()
+        assert stats["checkedout"] == 0
+        assert stats["checkedin"] == 1
+        assert stats["connects"] == 1
+        assert stats["wait"]["count"] == 2
+        assert stats["hold"]["count"] == 2
+        engine.dispose()
+
+    def test_timeouts(self, tmp_path: Path) -> None:
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'db.sqlite3'}", pool_size=1, max_overflow=0, pool_timeout=0.01
+        )
+        metrics = PoolMetrics(engine)
+
+        with engine.connect():
+            with pytest.raises(TimeoutError):
+                engine.connect()
+
+        stats = metrics.get_stats()
+        assert stats["timeouts"] == 1
+        assert stats["wait"]["count"] == 2
+        assert stats["wait"]["sum"] >= 0.01
+        engine.dispose()
+
+    def test_survives_dispose(self, tmp_path: Path) -> None:
+        engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite3'}")
+        metrics = PoolMetrics(engine)
+        engine.dispose()
+
+        with engine.connect():
+            pass
+        assert metrics.get_stats()["hold"]["count"] == 1
+        engine.dispose()
+
+    @pytest.mark.anyio
+    async def test_async_engine(self, tmp_path: Path) -> None:
+        url = f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite3'}"
+        engine = create_async_engine(url, poolclass=AsyncAdaptedQueuePool)
+        metrics = PoolMetrics(engine)
+
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+        stats = metrics.get_stats()
+        assert stats["pool"] == "AsyncAdaptedQueuePool"
+        assert stats["connects"] == 1
+        assert stats["wait"]["count"] == 1
+        assert stats["hold"]["count"] == 1
+        await engine.dispose()
@@ -1,3 +1,4 @@
+from sqlalchemy import update
 from sqlalchemy.orm import Mapped, Session, mapped_column
 
 from utils.database.mixins import TimestampMixin
@@ -26,3 +27,13 @@ class TestTimestampMixin:
         instance.name = "Updated"  # type: ignore
         session.commit()
         assert instance.updated_at != original_updated_at
+
+    def test_updated_at_changes_on_update_statements(self, session: Session):
+        instance = SampleModel(name="Original")
+        session.add(instance)
+        session.commit()
+
+        original_updated_at = instance.updated_at
+        session.execute(update(SampleModel).where(SampleModel.id == instance.id).values(name="Updated"))
+        session.commit()
+        assert instance.updated_at != original_updated_at
@@ -0,0 +1,64 @@
+import importlib
+
+import pytest
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from sqlalchemy.schema import CreateTable
+
+from utils.database.models import APIBaseModel, PostgreSQLComputed
+
+
+class ComputedModel(APIBaseModel):
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    document: Mapped[str] = mapped_column(PostgreSQLComputed("to_tsvector('english', name)", persisted=True))
+
+
+class TestPostgreSQLComputed:
+    def test_expression_on_postgresql(self):
+        ddl = str(CreateTable(ComputedModel.__table__).compile(dialect=postgresql.dialect()))
+        assert "GENERATED ALWAYS AS (to_tsvector('english', name)) STORED" in ddl
+
+    def test_empty_on_other_dialects(self):
+        ddl = str(CreateTable(ComputedModel.__table__).compile(dialect=sqlite.dialect()))
+        assert "GENERATED ALWAYS AS ('') STORED" in ddl
+
+    def test_generated_on_sqlite(self, session: Session):
+        session.add(ComputedModel(name="Test"))
+        session.commit()
+        assert session.scalar(select(ComputedModel.document)) == ""
+
+
+@pytest.fixture
+def app_engine(monkeypatch: pytest.MonkeyPatch) -> Engine:
+    # NOTE: The app settings are required by its database module, imported along with the models
+    for name, value in {
+        "ENGINE": "sqlite",
+        "NAME": ":memory:",
+        "USER": "",
+        "PASSWORD": "",
+        "HOST": "",
+        "PORT": "0",
+    }.items():
+        monkeypatch.setenv(f"DATABASE__{name}", value)
+    return create_engine("sqlite://")
+
+
+def test_app_tables_created_on_sqlite(app_engine: Engine):
+    Base = importlib.import_module("app.database").Base
+    Todo = importlib.import_module("app.todo.models").Todo
+    User = importlib.import_module("app.users.models").User
+
+    Base.metadata.create_all(app_engine)
+    with Session(app_engine) as session:
+        user = User(
+            username="user",
+            email="user@example.com",
+            hashed_password="hash",
+            firstname="First",
+            lastname="Last",
+        )
+        session.add(Todo(title="Title", description="Description", priority=1, owner=user))
+        session.commit()
+        assert session.scalars(select(Todo)).one().owner_id == user.id
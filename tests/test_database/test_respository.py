@@ -1,12 +1,13 @@
 from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, NoResultFound, SQLAlchemyError
 from sqlalchemy.orm import Mapped, Session, mapped_column
 
 from utils.database.models import APIBaseModel
-from utils.database.repository import BaseRepository
+from utils.database.repository import BaseRepository, OwnerScopedRepository
 from utils.exceptions.generic import ImproperlyConfigured
+from utils.pagination import LimitOffsetPagination
 
 
 class MockModel(APIBaseModel):
@@ -14,6 +15,12 @@ class MockModel(APIBaseModel):
     name: Mapped[str]
 
 
+class OwnedMockModel(APIBaseModel):
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str]
+    owner_id: Mapped[int]
+
+
 class TestBaseRepository:
     @pytest.fixture(autouse=True)
     def setup_class(self, session: Session) -> None:
@@ -102,6 +109,29 @@ class TestBaseRepository:
         self.repository.list(pagination_manager=pagination_manager_mock, name="Test")
         pagination_manager_mock.paginate_queryset.assert_called()  # type: ignore
 
+    def test_list_mappings(self) -> None:
+        self.repository.bulk_create(entities=[{"id": id, "name": "Mappings"} for id in range(401, 404)])
+
+        mappings = self.repository.list_mappings(name="Mappings")
+        assert mappings == [{"id": id, "name": "Mappings"} for id in range(401, 404)]
+
+        pagination = LimitOffsetPagination(schema=type("MockSchema", (), {"offset": 1, "limit": 1}))
+        mappings = self.repository.list_mappings(pagination_manager=pagination, name="Mappings")
+        assert mappings == [{"id": 402, "name": "Mappings"}]
+
+    def test_stream_mappings(self) -> None:
+        self.repository.bulk_create(entities=[{"id": id, "name": "Stream"} for id in range(501, 506)])
+
+        rows = list(self.repository.stream_mappings(chunk_size=2, name="Stream"))
+        assert rows == [{"id": id, "name": "Stream"} for id in range(501, 506)]
+
+    def test_list_with_fields_manager(self) -> None:
+        fields_manager_mock = MagicMock()
+        self.repository.get_base_query = MagicMock()
+        self.repository.list(fields_manager=fields_manager_mock)
+        self.repository.retrieve_by_id(id=1, fields_manager=fields_manager_mock)
+        assert fields_manager_mock.only_queryset.call_count == 2
+
     def test_perform_commit(self) -> None:
         session_mock = MagicMock()
         self.repository.session = session_mock
@@ -111,3 +141,97 @@ class TestBaseRepository:
     def test_update_raises_value_error_on_mismatched_id(self) -> None:
         with pytest.raises(ValueError, match="ID in the entity does not match the given ID."):
             self.repository.update(id=1, entity={"id": 2})
+
+    def test_update_with_returning(self) -> None:
+        self.repository.use_returning = True
+        self.repository.create(entity={"id": 301, "name": "Test"})
+
+        updated_entity = self.repository.update(id=301, entity={"name": "Test_Updated"})
+        assert updated_entity.name == "Test_Updated"
+        assert self.repository.retrieve_by_id(id=301) is updated_entity
+
+        with pytest.raises(NoResultFound):
+            self.repository.update(id=999, entity={"name": "Missing"})
+
+    def test_destroy_with_returning(self) -> None:
+        self.repository.use_returning = True
+        self.repository.create(entity={"id": 302, "name": "Test"})
+
+        self.repository.destroy(id=302)
+        assert self.session.query(MockModel).filter_by(id=302).first() is None
+
+        with pytest.raises(NoResultFound):
+            self.repository.destroy(id=302)
+
+    def test_bulk_create(self) -> None:
+        assert self.repository.bulk_create(entities=[]) == []
+
+        created = self.repository.bulk_create(entities=[{"name": "First"}, {"name": "Second"}])
+        assert [entity.name for entity in created] == ["First", "Second"]
+        assert self.session.query(MockModel).filter(MockModel.id.in_([e.id for e in created])).count() == 2
+
+    def test_bulk_update(self) -> None:
+        self.repository.bulk_create(entities=[{"id": 101, "name": "First"}, {"id": 102, "name": "Second"}])
+
+        updated_ids = self.repository.bulk_update(
+            entities=[{"id": 102, "name": "Second_Updated"}, {"id": 999, "name": "Missing"}, {"id": 101}]
+        )
+        assert updated_ids == [102, 101]
+        assert self.repository.retrieve_by_id(id=102).name == "Second_Updated"  # type: ignore
+
+        assert self.repository.bulk_update(entities=[]) == []
+        with pytest.raises(ValueError, match="Every entity must include its ID."):
+            self.repository.bulk_update(entities=[{"name": "Without ID"}])
+
+    def test_bulk_destroy(self) -> None:
+        self.repository.bulk_create(entities=[{"id": id, "name": f"Test{id}"} for id in range(201, 204)])
+
+        assert self.repository.bulk_destroy(ids=[203, 999, 201]) == [203, 201]
+        remaining = self.session.query(MockModel).filter(MockModel.id.in_(range(201, 204)))
+        assert [entity.id for entity in remaining] == [202]
+        assert self.repository.bulk_destroy(ids=[]) == []
+
+
+class TestOwnerScopedRepository:
+    @pytest.fixture(autouse=True)
+    def setup_class(self, session: Session) -> None:
+        self.session = session
+        self.session.add_all(
+            [OwnedMockModel(id=1, name="Mine", owner_id=1), OwnedMockModel(id=2, name="Theirs", owner_id=2)]
+        )
+        self.session.flush()
+        self.repository: OwnerScopedRepository[OwnedMockModel] = OwnerScopedRepository(
+            session=session, owner_id=1
+        )
+        self.repository.model = OwnedMockModel
+        self.repository.use_returning = True
+
+    def test_reads_are_scoped(self) -> None:
+        assert [entity.id for entity in self.repository.list()] == [1]
+        assert self.repository.retrieve_by_id(id=1).name == "Mine"
+        with pytest.raises(NoResultFound):
+            self.repository.retrieve_by_id(id=2)
+        assert self.repository.get_scope() == {"owner_id": 1}
+
+    def test_creates_are_owned(self) -> None:
+        assert self.repository.create(entity={"id": 3, "name": "New", "owner_id": 2}).owner_id == 1
+        assert [entity.owner_id for entity in self.repository.bulk_create(entities=[{"name": "Bulk"}])] == [1]
+
+    def test_writes_are_scoped(self) -> None:
+        updated = self.repository.update(id=1, entity={"name": "Updated", "owner_id": 2})
+        assert (updated.name, updated.owner_id) == ("Updated", 1)
+        with pytest.raises(NoResultFound):
+            self.repository.update(id=2, entity={"name": "Stolen"})
+
+        with pytest.raises(NoResultFound):
+            self.repository.destroy(id=2)
+        self.repository.destroy(id=1)
+        assert [entity.id for entity in self.session.query(OwnedMockModel)] == [2]
+
+        assert self.repository.bulk_destroy(ids=[1, 2]) == []
+
+    def test_bulk_updates_keep_the_owner(self) -> None:
+        entities = [{"id": 1, "name": "Given", "owner_id": 2}, {"id": 2, "name": "Stolen", "owner_id": 1}]
+        assert self.repository.bulk_update(entities=entities) == [1]
+        rows = self.session.query(OwnedMockModel.id, OwnedMockModel.name, OwnedMockModel.owner_id)
+        assert sorted(tuple(row) for row in rows) == [(1, "Given", 1), (2, "Theirs", 2)]
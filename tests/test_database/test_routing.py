@@ -0,0 +1,136 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
+
+from utils.database.routing import ReplicaPicker, RoutingSession
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class SampleRoutingModel(Base):
+    __tablename__ = "sample_routing"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+@pytest.fixture
+def urls(tmp_path: Path) -> dict[str, str]:
+    # NOTE: Every database tells its role apart through the name of its single row
+    urls = {}
+    for role in ("primary", "replica"):
+        path = tmp_path / f"{role}.sqlite3"
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(SampleRoutingModel.__table__.insert(), {"id": 1, "name": role})
+        engine.dispose()
+        urls[role] = str(path)
+    return urls
+
+
+class TestReplicaPicker:
+    def test_round_robin(self) -> None:
+        replicas = [create_engine("sqlite://"), create_engine("sqlite://")]
+        picker = ReplicaPicker(replicas)
+        assert [picker.pick() for _ in range(4)] == [*replicas, *replicas]
+
+    def test_unhealthy_replicas_are_skipped(self) -> None:
+        now = 0.0
+        replicas = [create_engine("sqlite://"), create_engine("sqlite://")]
+        picker = ReplicaPicker(replicas, cooldown=10, timer=lambda: now)
+
+        picker.mark_unhealthy(replicas[0])
+        assert {picker.pick() for _ in range(4)} == {replicas[1]}
+        picker.mark_unhealthy(replicas[1])
+        assert picker.pick() is None
+        assert picker.get_stats() == [
+            {"replica": 0, "healthy": False},
+            {"replica": 1, "healthy": False},
+        ]
+
+        now = 10
+        assert picker.pick() is not None
+
+    def test_connection_errors_mark_unhealthy(self, tmp_path: Path) -> None:
+        replica = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.sqlite3'}")
+        picker = ReplicaPicker([replica])
+
+        with pytest.raises(OperationalError):
+            replica.connect()
+        assert not picker.is_healthy(replica)
+        assert picker.pick() is None
+
+
+class TestRoutingSession:
+    def get_session(self, urls: dict[str, str]) -> RoutingSession:
+        primary = create_engine(f"sqlite:///{urls['primary']}")
+        replicas = ReplicaPicker([create_engine(f"sqlite:///{urls['replica']}")])
+        return sessionmaker(class_=RoutingSession, bind=primary, replicas=replicas)()
+
+    def test_reads_go_to_replicas(self, urls: dict[str, str]) -> None:
+        with self.get_session(urls) as session:
+            assert session.scalars(select(SampleRoutingModel.name)).one() == "replica"
+            assert session.query(SampleRoutingModel).one().name == "replica"
+
+    def test_replica_picked_once_per_session(self, urls: dict[str, str]) -> None:
+        replicas = ReplicaPicker([create_engine(f"sqlite:///{urls['replica']}") for _ in range(2)])
+        primary = create_engine("sqlite://")
+        session_maker = sessionmaker(class_=RoutingSession, bind=primary, replicas=replicas)
+        with session_maker() as session:
+            binds = {session.get_bind(clause=select(SampleRoutingModel)) for _ in range(4)}
+            assert binds == {replicas.engines[0]}
+
+            replicas.mark_unhealthy(replicas.engines[0])
+            assert session.get_bind(clause=select(SampleRoutingModel)) is replicas.engines[1]
+        with session_maker() as session:
+            assert session.get_bind(clause=select(SampleRoutingModel)) is replicas.engines[1]
+
+    def test_locking_reads_go_to_primary(self, urls: dict[str, str]) -> None:
+        with self.get_session(urls) as session:
+            statement = select(SampleRoutingModel.name).with_for_update()
+            assert session.scalars(statement).one() == "primary"
+
+    def test_read_your_writes(self, urls: dict[str, str]) -> None:
+        with self.get_session(urls) as session:
+            session.add(SampleRoutingModel(id=2, name="written"))
+            session.flush()
+            session.commit()
+            names = session.scalars(select(SampleRoutingModel.name).order_by(SampleRoutingModel.id)).all()
+            assert names == ["primary", "written"]
+
+    def test_text_statements_go_to_primary(self, urls: dict[str, str]) -> None:
+        with self.get_session(urls) as session:
+            assert session.execute(text("SELECT name FROM sample_routing")).scalar() == "primary"
+
+    def test_fallback_to_primary(self, urls: dict[str, str]) -> None:
+        with self.get_session(urls) as session:
+            session.replicas.mark_unhealthy(session.replicas.engines[0])  # type: ignore[union-attr]
+            assert session.scalars(select(SampleRoutingModel.name)).one() == "primary"
+
+    def test_without_replicas(self, urls: dict[str, str]) -> None:
+        primary = create_engine(f"sqlite:///{urls['primary']}")
+        with sessionmaker(class_=RoutingSession, bind=primary)() as session:
+            assert session.scalars(select(SampleRoutingModel.name)).one() == "primary"
+
+    @pytest.mark.anyio
+    async def test_async_session(self, urls: dict[str, str]) -> None:
+        primary = create_async_engine(f"sqlite+aiosqlite:///{urls['primary']}")
+        replica = create_async_engine(f"sqlite+aiosqlite:///{urls['replica']}")
+        session_maker = async_sessionmaker(
+            sync_session_class=RoutingSession, bind=primary, replicas=ReplicaPicker([replica])
+        )
+        try:
+            async with session_maker() as session:
+                assert (await session.scalars(select(SampleRoutingModel.name))).one() == "replica"
+                session.add(SampleRoutingModel(id=2, name="written"))
+                await session.flush()
+                assert len((await session.scalars(select(SampleRoutingModel))).all()) == 2
+        finally:
+            await primary.dispose()
+            await replica.dispose()
@@ -1,7 +1,8 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
-from fastapi import HTTPException, status
+from fastapi import FastAPI, HTTPException, status
+from fastapi.testclient import TestClient
 
 from utils.exceptions.client import (
     BadRequestException,
@@ -11,6 +12,7 @@ from utils.exceptions.client import (
     UnauthorizedException,
 )
 from utils.exceptions.generic import HTTPBaseException
+from utils.exceptions.handlers import exception_handlers
 from utils.exceptions.server import DatabaseConnectionError, ServerError
 
 
@@ -60,3 +62,33 @@ class TestServerExceptions:
         exception = DatabaseConnectionError()
         assert exception.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert exception.detail.startswith("Could not connect or perform the operation to the database")
+
+
+class TestExceptionHandlers:
+    def setup_method(self) -> None:
+        app = FastAPI(exception_handlers=exception_handlers)
+
+        @app.get("/items/{id}")
+        def retrieve(id: int):  # type: ignore
+            if id == 204:
+                raise HTTPException(status_code=204)
+            raise NotFoundException(headers={"X-Error": "missing"})
+
+        self.client = TestClient(app)
+
+    def test_http_exception_handler(self) -> None:
+        response = self.client.get("/items/1")
+        assert response.status_code == 404
+        assert response.headers["x-error"] == "missing"
+        assert response.content == b'{"detail":"Not Found"}'
+
+        assert self.client.get("/unknown").json() == {"detail": "Not Found"}
+
+        response = self.client.get("/items/204")
+        assert response.status_code == 204
+        assert response.content == b""
+
+    def test_request_validation_exception_handler(self) -> None:
+        response = self.client.get("/items/abc")
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["path", "id"]
@@ -0,0 +1,145 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Query
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import DeclarativeBase
+
+from utils.filters.advisor import (
+    IndexSuggestion,
+    advise,
+    get_filter_schemas,
+    get_missing_indexes,
+    render_revision,
+)
+from utils.filters.schemas import FilterSchema
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Owner(Base):
+    __tablename__ = "owner"
+    id = Column(Integer, primary_key=True)
+
+
+class Note(Base):
+    __tablename__ = "note"
+    __table_args__ = (
+        Index(
+            "ix_note_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    body = Column(String)
+    rank = Column(Integer, nullable=False, index=True)
+    pinned = Column(Boolean, nullable=False)
+    owner_id = Column(Integer, ForeignKey("owner.id"))
+
+
+class NoteFilterSchema(FilterSchema):
+    title__ieq: Optional[str] = Query(None)
+    title__icontains: Optional[str] = Query(None)
+    body__icontains: Optional[str] = Query(None)
+    rank__gte: Optional[int] = Query(None)
+    pinned__eq: Optional[bool] = Query(None)
+
+    class Meta:
+        model = Note
+        ordering_fields = ["id", "rank"]
+
+
+class OwnerNoteFilterSchema(NoteFilterSchema):
+    class Meta:
+        model = Note
+        ordering_fields = ["id"]
+        scope_fields = ["owner_id"]
+
+
+class UnboundFilterSchema(FilterSchema):
+    title__ieq: Optional[str] = Query(None)
+
+
+class TestAdvise:
+    def test_unscoped(self) -> None:
+        statuses = {advice.shape: advice.status for advice in advise(NoteFilterSchema)}
+        assert statuses == {
+            "title__ieq": "missing ix_note_lower_title",
+            "title__icontains": "served by ix_note_title_trgm",
+            "body__icontains": "missing ix_note_body_trgm",
+            "rank__gte": "served by ix_note_rank",
+            "pinned__eq": "not selective enough to be indexed",
+            "ordering=id": "served by primary key",
+            "ordering=rank": "served by ix_note_rank",
+        }
+
+    def test_scoped(self) -> None:
+        indexes = {advice.shape: advice.index for advice in advise(OwnerNoteFilterSchema)}
+        owned = "owner_id IS NOT NULL"
+        assert indexes["title__ieq"] == IndexSuggestion("note", ("owner_id", "lower(title)"), where=owned)
+        assert indexes["rank__gte"] == IndexSuggestion("note", ("owner_id", "rank"), where=owned)
+        assert indexes["pinned__eq"] == IndexSuggestion("note", ("owner_id", "pinned"), where=owned)
+        assert indexes["ordering=id"] == IndexSuggestion("note", ("owner_id", "id"), where=owned)
+        # NOTE: Trigram indexes cannot hold the scope
+        assert indexes["body__icontains"] == IndexSuggestion(
+            "note", ("body",), using="gin", ops="gin_trgm_ops", where="body IS NOT NULL"
+        )
+
+    def test_missing_indexes(self) -> None:
+        missing = get_missing_indexes([*advise(NoteFilterSchema), *advise(OwnerNoteFilterSchema)])
+        assert [index.name for index in missing] == [
+            "ix_note_lower_title",
+            "ix_note_body_trgm",
+            "ix_note_owner_id_lower_title",
+            "ix_note_owner_id_rank",
+            "ix_note_owner_id_pinned",
+            "ix_note_owner_id_id",
+        ]
+
+    def test_get_filter_schemas(self) -> None:
+        schemas = get_filter_schemas()
+        assert NoteFilterSchema in schemas and OwnerNoteFilterSchema in schemas
+        assert UnboundFilterSchema not in schemas
+
+
+class TestIndexSuggestion:
+    def test_serves(self) -> None:
+        index = IndexSuggestion("note", ("owner_id", "rank"))
+        assert index.serves(IndexSuggestion("note", ("owner_id",)))
+        assert index.serves(IndexSuggestion("note", ("owner_id", "rank"), where="owner_id IS NOT NULL"))
+        assert not index.serves(IndexSuggestion("note", ("rank",)))
+        assert not index.serves(IndexSuggestion("note", ("owner_id",), using="gin"))
+
+        partial = IndexSuggestion("note", ("owner_id",), where="owner_id IS NOT NULL")
+        assert not partial.serves(IndexSuggestion("note", ("owner_id",)))
+
+    def test_name(self) -> None:
+        assert IndexSuggestion("note", ("lower(title)",)).name == "ix_note_lower_title"
+        assert IndexSuggestion("note", ("body",), using="gin", ops="gin_trgm_ops").name == "ix_note_body_trgm"
+        assert len(IndexSuggestion("note", ("a" * 80,)).name) == 63
+
+
+def test_render_revision() -> None:
+    indexes = [
+        IndexSuggestion("note", ("owner_id", "lower(title)"), where="owner_id IS NOT NULL"),
+        IndexSuggestion("note", ("body",), using="gin", ops="gin_trgm_ops"),
+    ]
+    source = render_revision(
+        indexes,
+        message="_0002_Add filter indexes",
+        revision="abc",
+        down_revision="def",
+        create_date=datetime(2024, 1, 1),
+    )
+    compile(source, "revision.py", "exec")
+    assert 'revision = "abc"\ndown_revision = "def"' in source
+    assert 'op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")' in source
+    assert '["owner_id", sa.text("lower(title)")],' in source
+    assert 'postgresql_where=sa.text("owner_id IS NOT NULL"),' in source
+    assert 'postgresql_ops={"body": "gin_trgm_ops"},' in source
+    assert source.index('op.drop_index("ix_note_body_trgm"') < source.index('op.drop_index("ix_note_owner_id')
@@ -1,11 +1,15 @@
-from typing import Optional
+from typing import Any, Optional
 
 import pytest
 from fastapi import Query
-from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy import Column, Computed, Integer, String, create_engine, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
-from utils.filters.core import BaseFilterManager
+from utils.cache import TTLCache
+from utils.exceptions.client import BadRequestException
+from utils.exceptions.generic import ImproperlyConfigured
+from utils.filters.core import BaseFilterManager, FilterPlan
 from utils.filters.schemas import FilterSchema
 
 
@@ -20,14 +24,32 @@ class SampleModel(Base):
     age = Column(Integer)
 
 
+class SearchableModel(Base):
+    __tablename__ = "searchable"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    document = Column(postgresql.TSVECTOR, Computed("to_tsvector('english', name)"))
+
+
 class SampleFilterSchema(FilterSchema):
     name__icontains: Optional[str] = Query(None)
 
 
+class SearchFilterSchema(FilterSchema):
+    name__search: Optional[str] = Query(None)
+    q: Optional[str] = Query(None)
+
+
+class SearchFilterManager(BaseFilterManager):
+    model = SearchableModel
+    search_field = "document"
+    plan_cache = None
+
+
 @pytest.fixture
 def sample_session() -> Session:
     engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
+    Base.metadata.create_all(engine, tables=[SampleModel.__table__])  # type: ignore[list-item]
     session = sessionmaker(bind=engine)
     return session()
 
@@ -64,3 +86,177 @@ class TestBaseFilterManager:
         filter_manager.ordering = None
         query_without_ordering = filter_manager.order_by_queryset(query)  # type: ignore[arg-type]
         assert query_without_ordering == query
+
+    def test_plan_is_cached_per_shape(self, sample_session: Session) -> None:
+        sample_session.add_all([SampleModel(id=1, name="Test"), SampleModel(id=2, name="Other")])
+        sample_session.flush()
+        cache: TTLCache[FilterPlan] = TTLCache()
+
+        def filtered_ids(name: str, ordering: Optional[list[str]] = None) -> list[int]:
+            filters = SampleFilterSchema(name__icontains=name)
+            filter_manager = BaseFilterManager(filters=filters, ordering=ordering)
+            filter_manager.model = SampleModel
+            filter_manager.plan_cache = cache
+            query = filter_manager.filter_queryset(sample_session.query(SampleModel))  # type: ignore
+            return [row.id for row in filter_manager.order_by_queryset(query).all()]
+
+        assert filtered_ids("tes") == [1]
+        assert filtered_ids("THE", ordering=["-id"]) == [2]
+        assert filtered_ids("t", ordering=["-id"]) == [2, 1]
+        assert (cache.hits, cache.misses) == (3, 2)
+
+    def test_plan_is_cached_per_manager(self) -> None:
+        cache: TTLCache[FilterPlan] = TTLCache()
+
+        class NameFilterManager(BaseFilterManager):
+            model = SampleModel
+            plan_cache = cache
+
+        class OtherNameFilterManager(NameFilterManager):
+            def build_plan(self, keys: tuple[str, ...], ordering: Optional[tuple[str, ...]]) -> FilterPlan:
+                return super().build_plan(keys, ("-age",))
+
+        filters = SampleFilterSchema(name__icontains="tes")
+        assert NameFilterManager(filters=filters).get_plan().order_by is None
+        assert OtherNameFilterManager(filters=filters).get_plan().order_by is not None
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_filter_statement(self, sample_session: Session) -> None:
+        sample_session.add_all([SampleModel(id=1, name="Test"), SampleModel(id=2, name="Other")])
+        sample_session.flush()
+
+        filters = SampleFilterSchema(name__icontains="tes")
+        filter_manager = BaseFilterManager(filters=filters, ordering=["name"])
+        filter_manager.model = SampleModel
+        statement = filter_manager.order_by_queryset(filter_manager.filter_queryset(select(SampleModel)))
+        assert sample_session.scalars(statement).one().id == 1
+
+    def test_ieq_compares_lowered_values(self, sample_session: Session) -> None:
+        sample_session.add_all([SampleModel(id=1, name="Test"), SampleModel(id=2, name="Te%")])
+        sample_session.flush()
+
+        class IeqFilterSchema(FilterSchema):
+            name__ieq: Optional[str] = Query(None)
+
+        def filtered_ids(name: str) -> list[int]:
+            filter_manager = BaseFilterManager(filters=IeqFilterSchema(name__ieq=name))
+            filter_manager.model = SampleModel
+            return [row.id for row in filter_manager.filter_queryset(sample_session.query(SampleModel))]
+
+        assert filtered_ids("TEST") == [1]
+        # NOTE: Compared as is, not as a `LIKE` pattern
+        assert filtered_ids("te%") == [2]
+
+    def test_ordering_fields(self) -> None:
+        class OrderedFilterSchema(FilterSchema):
+            name__icontains: Optional[str] = Query(None)
+
+            class Meta:
+                ordering_fields = ["age"]
+
+        BaseFilterManager(filters=OrderedFilterSchema(), ordering=["-age"])
+        with pytest.raises(BadRequestException) as exc_info:
+            BaseFilterManager(filters=OrderedFilterSchema(), ordering=["age", "-name"])
+        assert "Invalid ordering: -name" in exc_info.value.detail
+
+    def test_resolved_lookups(self, sample_session: Session) -> None:
+        sample_session.add_all([SampleModel(id=1, name="Test"), SampleModel(id=2, name="Other")])
+        sample_session.flush()
+
+        class BoundFilterSchema(FilterSchema):
+            name__icontains: Optional[str] = Query(None)
+
+            class Meta:
+                model = SampleModel
+
+        class SampleFilterManager(BaseFilterManager):
+            model = SampleModel
+            plan_cache = None
+
+        filter_manager = SampleFilterManager(filters=BoundFilterSchema(name__icontains="tes"))
+        assert [row.id for row in filter_manager.filter_queryset(sample_session.query(SampleModel))] == [1]
+
+        # NOTE: Managers of other models resolve the columns of theirs
+        filter_manager.model = SearchableModel
+        assert "lower(searchable.name) LIKE lower(" in str(filter_manager.get_plan().conditions)
+
+    def test_plan_without_cache(self) -> None:
+        filters = SampleFilterSchema(name__icontains="tes")
+        filter_manager = BaseFilterManager(filters=filters, ordering=["-age"])
+        filter_manager.model = SampleModel
+        filter_manager.plan_cache = None
+        plan = filter_manager.get_plan()
+        assert "lower(sample.name) LIKE lower(" in str(plan.conditions)
+        assert str(plan.order_by[0]) == "sample.age DESC"  # type: ignore[index]
+
+
+class TestSearch:
+    @staticmethod
+    def compile(statement: Any) -> tuple[str, dict[str, Any]]:
+        compiled = statement.compile(dialect=postgresql.dialect())
+        return str(compiled).replace("\n", ""), compiled.params
+
+    def test_q_searches_the_search_field_by_relevance(self) -> None:
+        filter_manager = SearchFilterManager(filters=SearchFilterSchema(q="buy milk"))
+        statement = filter_manager.order_by_queryset(filter_manager.filter_queryset(select(SearchableModel)))
+        sql, params = self.compile(statement)
+        assert "WHERE searchable.document @@ websearch_to_tsquery(" in sql
+        assert "ORDER BY ts_rank_cd(searchable.document, websearch_to_tsquery(" in sql
+        assert sql.endswith("DESC, searchable.id ASC")
+        assert params["document__search"] == "buy milk"
+        assert "english" in params.values()
+        assert filter_manager.get_cache_key() == ((("document__search", "'buy milk'"),), None)
+
+    def test_requested_ordering_prevails_over_relevance(self) -> None:
+        filter_manager = SearchFilterManager(filters=SearchFilterSchema(q="milk"), ordering=["-id"])
+        statement = filter_manager.order_by_queryset(filter_manager.filter_queryset(select(SearchableModel)))
+        sql, _ = self.compile(statement)
+        assert sql.endswith("ORDER BY searchable.id DESC")
+
+    def test_search_lookup_on_text_column(self) -> None:
+        filter_manager = SearchFilterManager(filters=SearchFilterSchema(name__search="milk"))
+        sql, params = self.compile(filter_manager.filter_queryset(select(SearchableModel)))
+        assert "WHERE to_tsvector(%(to_tsvector_1)s, searchable.name) @@ websearch_to_tsquery(" in sql
+        assert params["name__search"] == "milk"
+        sql, _ = self.compile(filter_manager.order_by_queryset(select(SearchableModel)))
+        assert "ORDER BY" not in sql
+
+    def test_substring_fallback(self) -> None:
+        class FallbackFilterManager(SearchFilterManager):
+            search_fallback_fields = ("name",)
+
+        filter_manager = FallbackFilterManager(filters=SearchFilterSchema(q="mil"))
+        sql, params = self.compile(filter_manager.filter_queryset(select(SearchableModel)))
+        assert "OR searchable.name ILIKE %(param_1)s || %(document__search)s || %(param_2)s" in sql
+        assert (params["param_1"], params["document__search"], params["param_2"]) == ("%", "mil", "%")
+
+    def test_other_dialects_match_by_substring(self, sample_session: Session) -> None:
+        class FallbackFilterManager(SearchFilterManager):
+            search_fallback_fields = ("name",)
+
+        filter_manager = FallbackFilterManager(filters=SearchFilterSchema(q="mil"))
+        statement = filter_manager.order_by_queryset(filter_manager.filter_queryset(select(SearchableModel)))
+        sql = str(statement.compile(dialect=sqlite.dialect())).replace("\n", "")
+        # NOTE: `tsvector` columns match nothing, the fallback fields do
+        assert "WHERE 0 = 1 OR lower(searchable.name) LIKE lower(" in sql
+        assert sql.endswith("ORDER BY NULL DESC, searchable.id ASC")
+
+        sample_session.add_all([SampleModel(id=1, name="Buy milk"), SampleModel(id=2, name="Walk")])
+        sample_session.flush()
+
+        class TextSearchFilterManager(BaseFilterManager):
+            model = SampleModel
+            search_field = "name"
+            plan_cache = None
+
+        filter_manager = TextSearchFilterManager(filters=SearchFilterSchema(q="MIL"))
+        statement = filter_manager.order_by_queryset(filter_manager.filter_queryset(select(SampleModel)))
+        assert [row.id for row in sample_session.scalars(statement)] == [1]
+
+    def test_q_requires_search_field(self) -> None:
+        with pytest.raises(ImproperlyConfigured):
+            BaseFilterManager(filters=SearchFilterSchema(q="milk"))
+
+    def test_invalid_lookup(self) -> None:
+        with pytest.raises(ValueError):
+            FilterSchema(name__match="milk")
@@ -0,0 +1,89 @@
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import DeclarativeBase, Session, deferred, sessionmaker
+
+from utils.exceptions.client import BadRequestException
+from utils.filters import BaseFieldsManager
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class SampleFieldsModel(Base):
+    __tablename__ = "sample_fields"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    age = Column(Integer)
+    description = Column(String)
+    notes = deferred(Column(String))
+
+
+class SampleFieldsManager(BaseFieldsManager):
+    model = SampleFieldsModel
+
+
+@pytest.fixture
+def sample_session() -> Session:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(SampleFieldsModel(id=1, name="Test", age=30, description="Long text"))
+    session.commit()
+    session.expunge_all()
+    return session
+
+
+class TestBaseFieldsManager:
+    def test_only_queryset(self, sample_session: Session) -> None:
+        query = sample_session.query(SampleFieldsModel)
+        only_query = SampleFieldsManager(fields=["name"]).only_queryset(query)
+
+        statement = str(only_query)
+        assert "sample_fields.name" in statement
+        assert "sample_fields.id" in statement
+        assert "sample_fields.age" not in statement
+        assert "sample_fields.description" not in statement
+
+        instance = only_query.one()
+        assert instance.name == "Test"
+        # Non requested columns are neither loaded nor lazy loaded afterwards
+        assert "age" not in vars(instance)
+        with pytest.raises(InvalidRequestError):
+            instance.age
+
+    def test_only_queryset_keeps_ordering_columns(self, sample_session: Session) -> None:
+        query = sample_session.query(SampleFieldsModel).order_by(SampleFieldsModel.age.desc())
+        only_query = SampleFieldsManager(fields=["name"]).only_queryset(query)
+        assert only_query.one().age == 30
+
+    def test_only_queryset_select(self, sample_session: Session) -> None:
+        statement = SampleFieldsManager(fields=["age"]).only_queryset(select(SampleFieldsModel))
+        instance = sample_session.scalars(statement).one()
+        assert instance.age == 30
+        assert "name" not in vars(instance)
+
+    def test_only_queryset_without_fields(self, sample_session: Session) -> None:
+        query = sample_session.query(SampleFieldsModel)
+        assert SampleFieldsManager().only_queryset(query) is query
+        assert SampleFieldsManager(fields=[]).only_queryset(query) is query
+
+    def test_only_queryset_invalid_fields(self, sample_session: Session) -> None:
+        query = sample_session.query(SampleFieldsModel)
+        with pytest.raises(BadRequestException) as exc_info:
+            SampleFieldsManager(fields=["name", "unknown"]).only_queryset(query)
+        assert exc_info.value.detail == "Bad Request - Invalid fields: unknown"
+
+    def test_columns_queryset(self, sample_session: Session) -> None:
+        query = sample_session.query(SampleFieldsModel)
+        rows = SampleFieldsManager(fields=["name"]).columns_queryset(query).all()
+        assert [dict(row._mapping) for row in rows] == [{"id": 1, "name": "Test"}]
+
+        statement = SampleFieldsManager().columns_queryset(select(SampleFieldsModel))
+        mappings = sample_session.execute(statement).mappings().all()
+        assert mappings == [{"id": 1, "name": "Test", "age": 30, "description": "Long text"}]
+
+    def test_columns_queryset_requested_deferred_column(self, sample_session: Session) -> None:
+        statement = SampleFieldsManager(fields=["notes"]).columns_queryset(select(SampleFieldsModel))
+        assert sample_session.execute(statement).mappings().all() == [{"id": 1, "notes": None}]
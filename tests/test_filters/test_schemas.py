@@ -1,9 +1,24 @@
+from typing import Optional
+
 import pytest
+from fastapi import Query
 from pydantic_core import ValidationError
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from utils.filters.operations import OPERATIONS
 from utils.filters.schemas import FilterSchema
 
 
+class Base(DeclarativeBase):
+    pass
+
+
+class SampleModel(Base):
+    __tablename__ = "sample"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
 class TestFilterSchema:
     def test_extra_filter_lookups_forbid(self) -> None:
         valid_filters = {"field__gt": 10, "name__contains": "test"}
@@ -20,3 +35,44 @@ class TestFilterSchema:
             ValueError, match=r"Filter attribute field__invalid_lookup should be a valid lookup:"
         ):
             SampleFilterSchema(**invalid_filters)
+
+    def test_lookups_are_resolved_once_per_class(self) -> None:
+        class SampleFilterSchema(FilterSchema):
+            name__icontains: Optional[str] = Query(None)
+            age__gte: Optional[int] = Query(None)
+            invalid__lookup: Optional[int] = Query(None)
+
+            class Meta:
+                ordering_fields = ["age"]
+
+        assert SampleFilterSchema._lookups == {
+            "name__icontains": ("name", "icontains"),
+            "age__gte": ("age", "gte"),
+        }
+        assert SampleFilterSchema._meta.ordering_fields == ["age"]
+        assert FilterSchema._meta.ordering_fields == []
+
+    def test_lookups_are_resolved_against_the_model(self) -> None:
+        class SampleFilterSchema(FilterSchema):
+            name__icontains: Optional[str] = Query(None)
+            missing__eq: Optional[int] = Query(None)
+
+            class Meta:
+                model = SampleModel
+
+        # NOTE: Fields which are not attributes of the model are left to the filter managers
+        assert list(SampleFilterSchema._resolved_lookups) == ["name__icontains"]
+        column, operation = SampleFilterSchema._resolved_lookups["name__icontains"]
+        assert column is SampleModel.name
+        assert operation is OPERATIONS["icontains"]
+        assert FilterSchema._resolved_lookups == {}
+
+    def test_get_filters(self) -> None:
+        class SampleFilterSchema(FilterSchema):
+            name__icontains: Optional[str] = Query(None)
+            age__gte: Optional[int] = Query(None)
+            age__lte: Optional[int] = Query(None)
+
+        filters = SampleFilterSchema(name__icontains="test", age__gte=None)
+        assert filters.get_filters() == {"name__icontains": "test"}
+        assert filters.get_filters() == filters.model_dump(exclude_none=True, exclude_unset=True)
@@ -3,12 +3,18 @@ from typing import Any, Callable, Coroutine, Dict, Type, Union
 import pytest
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy import create_engine, text
 from sqlalchemy.exc import NoResultFound, SQLAlchemyError, TimeoutError
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, Response, StreamingResponse
 from starlette.testclient import TestClient
 
-from utils.middleware import SQLAlchemyExceptionHandlerMiddleware
+from utils.database.instrumentation import QueryBudgetExceeded, instrument_queries
+from utils.middleware import (
+    CompressionMiddleware,
+    QueryInstrumentationMiddleware,
+    SQLAlchemyExceptionHandlerMiddleware,
+)
 
 
 def raise_no_result_found() -> None:
@@ -35,6 +41,18 @@ def route_with_server_error() -> None:
     raise RuntimeError("Oops!")
 
 
+def stream_chunks() -> StreamingResponse:
+    return StreamingResponse(iter([b"first,", b"second"]))
+
+
+def raise_while_streaming() -> StreamingResponse:
+    def chunks():  # type: ignore
+        yield b"first,"
+        raise SQLAlchemyError()
+
+    return StreamingResponse(chunks())
+
+
 def no_error() -> Dict[str, str]:
     return {"message": "No error here"}
 
@@ -79,6 +97,8 @@ class TestSQLAlchemyExceptionHandlerMiddleware:
         self.test_app.get("/raise-general-sqlalchemy-error")(raise_general_sqlalchemy_error)
         self.test_app.get("/no-error")(no_error)
         self.test_app.get("/raise-no-content-error")(raise_no_content_error)
+        self.test_app.get("/stream")(stream_chunks)
+        self.test_app.get("/raise-while-streaming")(raise_while_streaming)
 
         self.client = TestClient(self.test_app)
 
@@ -97,6 +117,27 @@ class TestSQLAlchemyExceptionHandlerMiddleware:
         assert response.status_code == 500
         assert response.json()["detail"] == "Could not connect or perform the operation to the database"
 
+    def test_debug_message(self) -> None:
+        assert "debug_message" in self.client.get("/raise-timeout-error").json()
+
+        app = FastAPI()
+        app.add_middleware(SQLAlchemyExceptionHandlerMiddleware)
+        app.get("/raise-timeout-error")(raise_timeout_error)
+        assert TestClient(app).get("/raise-timeout-error").json() == {"detail": "Process timed out"}
+
+    def test_streaming_response(self) -> None:
+        response = self.client.get("/stream")
+        assert response.status_code == 200
+        assert response.text == "first,second"
+
+    def test_error_while_streaming_raises(self) -> None:
+        # NOTE: The response already started, hence it cannot be replaced by an error one.
+        # Starlette may wrap the error within an exception group raised by the streaming task group
+        with pytest.raises(Exception) as exc_info:
+            self.client.get("/raise-while-streaming")
+        exceptions = getattr(exc_info.value, "exceptions", [exc_info.value])
+        assert isinstance(exceptions[0], SQLAlchemyError)
+
     def test_no_exceptions(self) -> None:
         response = self.client.get("/no-error")
         assert response.status_code == 200
@@ -137,3 +178,115 @@ class TestSQLAlchemyExceptionHandlerMiddleware:
         response = client.get("/server-error")
         assert response.status_code == 500
         assert response.json() == {"exception": "server-error"}
+
+
+class TestQueryInstrumentationMiddleware:
+    @pytest.fixture(autouse=True)
+    def setup_class(self) -> None:
+        engine = create_engine("sqlite://")
+        instrument_queries(engine)
+
+        def run_queries(count: int) -> Dict[str, int]:
+            with engine.connect() as connection:
+                for id in range(count):
+                    connection.execute(text("SELECT :id"), {"id": id})
+            return {"count": count}
+
+        self.test_app = FastAPI()
+        self.test_app.get("/queries/{count}")(run_queries)
+
+    def test_server_timing(self, caplog: pytest.LogCaptureFixture) -> None:
+        self.test_app.add_middleware(QueryInstrumentationMiddleware)
+        client = TestClient(self.test_app)
+
+        with caplog.at_level("INFO", logger="utils.middleware"):
+            response = client.get("/queries/3")
+        assert response.status_code == 200
+        assert response.headers["server-timing"].startswith("db;dur=")
+        assert response.headers["server-timing"].endswith('desc="3 queries"')
+
+        record = caplog.records[-1]
+        assert record.queries == 3  # type: ignore[attr-defined]
+        assert record.repeated_queries == {"SELECT ?": 3}  # type: ignore[attr-defined]
+
+        assert client.get("/queries/0").headers["server-timing"].endswith('desc="0 queries"')
+
+    def test_query_budget(self) -> None:
+        self.test_app.add_middleware(QueryInstrumentationMiddleware, query_budget=2)
+        client = TestClient(self.test_app)
+
+        assert client.get("/queries/2").status_code == 200
+        with pytest.raises(QueryBudgetExceeded):
+            client.get("/queries/3")
+
+
+class TestCompressionMiddleware:
+    @pytest.fixture(autouse=True)
+    def setup_class(self) -> None:
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+        @app.get("/json")
+        def json_route(size: int = 1000) -> Response:
+            return Response(b"x" * size, media_type="application/json", headers={"ETag": '"v1"'})
+
+        @app.get("/image")
+        def image_route() -> Response:
+            return Response(b"x" * 1000, media_type="image/png")
+
+        @app.get("/no-transform")
+        def no_transform_route() -> Response:
+            return Response(b"x" * 1000, media_type="text/plain", headers={"Cache-Control": "no-transform"})
+
+        @app.get("/stream")
+        def stream_route() -> StreamingResponse:
+            return StreamingResponse(iter([b"a" * 10, b"b" * 10, b""]), media_type="application/x-ndjson")
+
+        @app.get("/empty", status_code=204)
+        def empty_route() -> Response:
+            return Response(status_code=204)
+
+        self.client = TestClient(app)
+
+    def test_compresses_complete_bodies(self) -> None:
+        response = self.client.get("/json", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < 1000
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert response.content == b"x" * 1000
+
+    def test_small_bodies_are_not_compressed(self) -> None:
+        response = self.client.get("/json", params={"size": 99}, headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == '"v1"'
+        assert response.content == b"x" * 99
+
+    def test_not_accepted_encodings(self) -> None:
+        for accept_encoding in ("identity", "gzip;q=0", "br"):
+            response = self.client.get("/json", headers={"Accept-Encoding": accept_encoding})
+            assert "content-encoding" not in response.headers
+            assert response.headers["vary"] == "Accept-Encoding"
+
+        response = self.client.get("/json", headers={"Accept-Encoding": "*"})
+        assert response.headers["content-encoding"] == "gzip"
+
+    def test_excluded_responses(self) -> None:
+        for path in ("/image", "/no-transform", "/empty"):
+            response = self.client.get(path, headers={"Accept-Encoding": "gzip"})
+            assert "content-encoding" not in response.headers
+            assert "vary" not in response.headers
+
+    def test_compresses_streaming_responses(self) -> None:
+        with self.client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+            assert response.headers["content-encoding"] == "gzip"
+            assert "content-length" not in response.headers
+            assert response.read() == b"a" * 10 + b"b" * 10
+
+    def test_disabled(self) -> None:
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, encodings=[])
+        app.get("/")(lambda: Response(b"x" * 2000, media_type="text/plain"))
+        response = TestClient(app).get("/", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
@@ -1,4 +1,21 @@
-from utils.responses import DatabaseErrorResponse, NotFoundErrorResponse, TimeoutErrorResponse
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from utils.responses import (
+    CSVStreamingResponse,
+    DatabaseErrorResponse,
+    NDJSONStreamingResponse,
+    NotFoundErrorResponse,
+    ORJSONResponse,
+    RowsJSONResponse,
+    TimeoutErrorResponse,
+)
 
 
 class TestSpecificErrorResponses:
@@ -27,3 +44,83 @@ class TestSpecificErrorResponses:
             '{"detail":"' + DatabaseErrorResponse.detail + '","debug_message":"' + debug_msg + '"}'
         )
         assert response.body.decode() == expected_body
+
+
+class TestORJSONResponse:
+    def test_render(self):
+        uuid = UUID("12345678-1234-5678-1234-567812345678")
+        response = ORJSONResponse({"at": datetime(2023, 1, 2, 3, 4), "id": uuid, 1: "ñ"})
+        assert response.headers["content-type"] == "application/json"
+        assert response.body.decode() == (
+            '{"at":"2023-01-02T03:04:00","id":"12345678-1234-5678-1234-567812345678","1":"ñ"}'
+        )
+
+    def test_default_response_class(self):
+        app = FastAPI(default_response_class=ORJSONResponse)
+
+        @app.get("/")
+        def retrieve():  # type: ignore
+            return {"amount": Decimal("1.5")}
+
+        assert TestClient(app).get("/").content == b'{"amount":1.5}'
+
+
+class TestRowsJSONResponse:
+    def test_render_row_mappings(self):
+        with create_engine("sqlite://").connect() as connection:
+            rows = connection.execute(text("SELECT 1 AS id, 'Test' AS name")).mappings().all()
+        response = RowsJSONResponse(rows)
+        assert response.body.decode() == '[{"id":1,"name":"Test"}]'
+
+    def test_render_non_json_types(self):
+        response = RowsJSONResponse([{"day": date(2023, 1, 2), "amount": Decimal("1.5")}])
+        assert response.body.decode() == '[{"day":"2023-01-02","amount":1.5}]'
+
+        with pytest.raises(TypeError):
+            RowsJSONResponse([object()])
+
+
+async def async_rows():  # type: ignore
+    for id in range(1, 4):
+        yield {"id": id, "name": f"Test,{id}", "day": date(2023, 1, id)}
+
+
+class TestRowsStreamingResponses:
+    @pytest.fixture
+    def client(self) -> TestClient:
+        app = FastAPI()
+        rows = [{"id": id, "name": f"Test,{id}", "day": date(2023, 1, id)} for id in range(1, 4)]
+
+        @app.get("/ndjson")
+        def ndjson():  # type: ignore
+            return NDJSONStreamingResponse(iter(rows), buffer_size=1)
+
+        @app.get("/csv")
+        def csv():  # type: ignore
+            return CSVStreamingResponse(async_rows())
+
+        @app.get("/empty")
+        def empty():  # type: ignore
+            return CSVStreamingResponse([])
+
+        return TestClient(app)
+
+    def test_ndjson(self, client: TestClient) -> None:
+        response = client.get("/ndjson")
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.text.splitlines() == [
+            '{"id":1,"name":"Test,1","day":"2023-01-01"}',
+            '{"id":2,"name":"Test,2","day":"2023-01-02"}',
+            '{"id":3,"name":"Test,3","day":"2023-01-03"}',
+        ]
+
+    def test_csv(self, client: TestClient) -> None:
+        response = client.get("/csv")
+        assert response.headers["content-type"].startswith("text/csv")
+        assert response.text.splitlines() == [
+            "id,name,day",
+            '1,"Test,1",2023-01-01',
+            '2,"Test,2",2023-01-02',
+            '3,"Test,3",2023-01-03',
+        ]
+        assert client.get("/empty").text == ""
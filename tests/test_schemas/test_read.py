@@ -0,0 +1,52 @@
+from typing import Optional
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Session, load_only, sessionmaker
+
+from utils.schemas import ReadSchema
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class SampleReadModel(Base):
+    __tablename__ = "sample_read"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    age = Column(Integer)
+
+
+class SampleReadSchema(ReadSchema):
+    id: int
+    name: Optional[str] = None
+    age: Optional[int] = None
+
+
+@pytest.fixture
+def sample_session() -> Session:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(SampleReadModel(id=1, name="Test", age=30))
+    session.commit()
+    session.expunge_all()
+    return session
+
+
+def test_read_schema_from_instance(sample_session: Session) -> None:
+    instance = sample_session.scalars(select(SampleReadModel)).one()
+    schema = SampleReadSchema.model_validate(instance)
+    assert schema.model_dump() == {"id": 1, "name": "Test", "age": 30}
+
+
+def test_read_schema_skips_unloaded_attributes(sample_session: Session) -> None:
+    statement = select(SampleReadModel).options(load_only(SampleReadModel.name, raiseload=True))
+    instance = sample_session.scalars(statement).one()
+    schema = SampleReadSchema.model_validate(instance)
+    assert schema.model_dump(exclude_unset=True) == {"id": 1, "name": "Test"}
+
+
+def test_read_schema_from_dict() -> None:
+    assert SampleReadSchema.model_validate({"id": 1}).model_dump(exclude_unset=True) == {"id": 1}
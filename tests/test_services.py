@@ -1,11 +1,37 @@
-from utils.services import BaseService
+from pathlib import Path
+from typing import Generator
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, inspect, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from utils.cache import TTLCache
+from utils.database.async_repository import AsyncBaseRepository
+from utils.database.models import APIBaseModel
+from utils.database.repository import BaseRepository, OwnerScopedRepository
+from utils.pagination import CountStrategy, PageNumberPagination, PageNumberSchema
+from utils.services import AsyncBaseService, BaseService, ServiceCache
+
+
+class CachedModel(APIBaseModel):
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+class OwnedCachedModel(APIBaseModel):
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    owner_id: Mapped[int]
 
 
 class TestBaseService:
     def test_get_by_id(self, mock_repository):  # type: ignore
         service = BaseService(repository=mock_repository)
         result = service.get_by_id(id=1)
-        mock_repository.retrieve_by_id.assert_called_once_with(id=1)
+        mock_repository.retrieve_by_id.assert_called_once_with(id=1, fields_manager=None)
         assert result == mock_repository.retrieve_by_id.return_value
 
     def test_get(self, mock_repository):  # type: ignore
@@ -19,9 +45,27 @@ class TestBaseService:
         service = BaseService(repository=mock_repository)
         filters = {"key": "value"}
         result = service.list(filter_manager=None, pagination_manager=None, **filters)
-        mock_repository.list.assert_called_once_with(filter_manager=None, pagination_manager=None, **filters)
+        mock_repository.list.assert_called_once_with(
+            filter_manager=None, pagination_manager=None, fields_manager=None, **filters
+        )
         assert result == mock_repository.list.return_value
 
+    def test_list_mappings(self, mock_repository):  # type: ignore
+        service = BaseService(repository=mock_repository)
+        result = service.list_mappings(key="value")
+        mock_repository.list_mappings.assert_called_once_with(
+            filter_manager=None, pagination_manager=None, fields_manager=None, key="value"
+        )
+        assert result == mock_repository.list_mappings.return_value
+
+    def test_stream_mappings(self, mock_repository):  # type: ignore
+        service = BaseService(repository=mock_repository)
+        result = service.stream_mappings(key="value")
+        mock_repository.stream_mappings.assert_called_once_with(
+            filter_manager=None, fields_manager=None, chunk_size=1000, key="value"
+        )
+        assert result == mock_repository.stream_mappings.return_value
+
     def test_create(self, mock_repository):  # type: ignore
         service = BaseService(repository=mock_repository)
         entity = {"key": "value"}
@@ -40,3 +84,257 @@ class TestBaseService:
         service = BaseService(repository=mock_repository)
         service.destroy(id=1)
         mock_repository.destroy.assert_called_once_with(id=1)
+
+    def test_bulk_operations(self, mock_repository):  # type: ignore
+        service = BaseService(repository=mock_repository)
+        entities = [{"key": "value"}]
+        assert service.bulk_create(entities=entities) == mock_repository.bulk_create.return_value
+        mock_repository.bulk_create.assert_called_once_with(entities=entities)
+        assert service.bulk_update(entities=entities) == mock_repository.bulk_update.return_value
+        mock_repository.bulk_update.assert_called_once_with(entities=entities)
+        assert service.bulk_destroy(ids=[1, 2]) == mock_repository.bulk_destroy.return_value
+        mock_repository.bulk_destroy.assert_called_once_with(ids=[1, 2])
+        assert mock_repository.perform_commit.call_count == 3
+
+
+@pytest.mark.anyio
+class TestAsyncBaseService:
+    async def test_get_by_id(self, mock_async_repository):  # type: ignore
+        service = AsyncBaseService(repository=mock_async_repository)
+        result = await service.get_by_id(id=1)
+        mock_async_repository.retrieve_by_id.assert_awaited_once_with(id=1, fields_manager=None)
+        assert result == mock_async_repository.retrieve_by_id.return_value
+
+    async def test_get(self, mock_async_repository):  # type: ignore
+        service = AsyncBaseService(repository=mock_async_repository)
+        filters = {"key": "value"}
+        result = await service.get(**filters)
+        mock_async_repository.retrieve.assert_awaited_once_with(**filters)
+        assert result == mock_async_repository.retrieve.return_value
+
+    async def test_list(self, mock_async_repository):  # type: ignore
+        service = AsyncBaseService(repository=mock_async_repository)
+        filters = {"key": "value"}
+        result = await service.list(filter_manager=None, pagination_manager=None, **filters)
+        mock_async_repository.list.assert_awaited_once_with(
+            filter_manager=None, pagination_manager=None, fields_manager=None, **filters
+        )
+        assert result == mock_async_repository.list.return_value
+
+    async def test_list_mappings(self, mock_async_repository):  # type: ignore
+        service = AsyncBaseService(repository=mock_async_repository)
+        result = await service.list_mappings(key="value")
+        mock_async_repository.list_mappings.assert_awaited_once_with(
+            filter_manager=None, pagination_manager=None, fields_manager=None, key="value"
+        )
+        assert result == mock_async_repository.list_mappings.return_value
+
+    async def test_create(self, mock_async_repository):  # type: ignore
+        service = AsyncBaseService(repository=mock_async_repository)
+        entity = {"key": "value"}
+        result = await service.create(entity=entity)
+        mock_async_repository.create.assert_awaited_once_with(entity=entity)
+        assert result == mock_async_repository.create.return_value
+
+    async def test_update(self, mock_async_repository):  # type: ignore
+        service = AsyncBaseService(repository=mock_async_repository)
+        entity = {"key": "value"}
+        result = await service.update(id=1, entity=entity)
+        mock_async_repository.update.assert_awaited_once_with(id=1, entity=entity)
+        assert result == mock_async_repository.update.return_value
+
+    async def test_destroy(self, mock_async_repository):  # type: ignore
+        service = AsyncBaseService(repository=mock_async_repository)
+        await service.destroy(id=1)
+        mock_async_repository.destroy.assert_awaited_once_with(id=1)
+
+    async def test_bulk_operations(self, mock_async_repository):  # type: ignore
+        service = AsyncBaseService(repository=mock_async_repository)
+        entities = [{"key": "value"}]
+        assert await service.bulk_create(entities=entities) == mock_async_repository.bulk_create.return_value
+        mock_async_repository.bulk_create.assert_awaited_once_with(entities=entities)
+        assert await service.bulk_update(entities=entities) == mock_async_repository.bulk_update.return_value
+        mock_async_repository.bulk_update.assert_awaited_once_with(entities=entities)
+        assert await service.bulk_destroy(ids=[1, 2]) == mock_async_repository.bulk_destroy.return_value
+        mock_async_repository.bulk_destroy.assert_awaited_once_with(ids=[1, 2])
+        assert mock_async_repository.perform_commit.await_count == 3
+
+    async def test_bulk_writes_are_committed(self, tmp_path: Path) -> None:
+        # NOTE: A file database, so the fresh session reads through another connection
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bulk.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(APIBaseModel.metadata.create_all)
+        SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        async with SessionLocal() as session:
+            repository: AsyncBaseRepository[CachedModel] = AsyncBaseRepository(session=session)
+            repository.model = CachedModel
+            service = AsyncBaseService(repository=repository)
+            await service.bulk_create(entities=[{"id": 1, "name": "First"}, {"id": 2, "name": "Second"}])
+            await service.bulk_update(entities=[{"id": 1, "name": "Updated"}])
+            await service.bulk_destroy(ids=[2])
+
+        async with SessionLocal() as session:
+            rows = (await session.execute(select(CachedModel.id, CachedModel.name))).all()
+        assert [tuple(row) for row in rows] == [(1, "Updated")]
+        await engine.dispose()
+
+
+class TestServiceCache:
+    def test_keys_are_normalized(self) -> None:
+        cache = ServiceCache(TTLCache())
+        pagination = PageNumberPagination(PageNumberSchema(page=1, page_size=10))
+
+        key = cache.get_key(CachedModel, "list", None, pagination, a=1, b=2)
+        assert key == cache.get_key(CachedModel, "list", None, pagination, b=2, a=1)
+        assert key != cache.get_key(CachedModel, "list", None, pagination, a=1, b=3)
+        assert key != cache.get_key(CachedModel, "list_mappings", None, pagination, a=1, b=2)
+        assert key.startswith("service:cachedmodel:")  # type: ignore[union-attr]
+
+    def test_managers_without_cache_key_are_not_cached(self) -> None:
+        cache = ServiceCache(TTLCache())
+        assert cache.get_key(CachedModel, "list", object()) is None
+        assert cache.get_instance(None, CachedModel) is None
+
+    def test_invalidate(self) -> None:
+        backend: TTLCache[object] = TTLCache()
+        cache = ServiceCache(backend)
+        key = cache.get_key(CachedModel, "id", None, id=1)
+        assert key == cache.get_key(CachedModel, "id", None, id=1)
+
+        cache.invalidate(CachedModel)
+        assert key != cache.get_key(CachedModel, "id", None, id=1)
+
+        # NOTE: A lost version is replaced rather than restarted, stale entries stay unreachable
+        key = cache.get_key(CachedModel, "id", None, id=1)
+        backend.delete("service:cachedmodel:version")
+        assert key != cache.get_key(CachedModel, "id", None, id=1)
+
+    def test_instances_round_trip(self) -> None:
+        data = ServiceCache.dump_instance(CachedModel(id=1, name="Cached"))
+        assert data == {"id": 1, "name": "Cached"}
+
+        instance = ServiceCache.load_instance(CachedModel, data)
+        assert isinstance(instance, CachedModel)
+        assert (instance.id, instance.name) == (1, "Cached")
+        assert inspect(instance).session is None
+
+
+class TestCachedService:
+    @pytest.fixture(autouse=True)
+    def setup_class(self) -> Generator[None, None, None]:
+        # NOTE: Writes through the service are committed, hence a database of its own
+        engine = create_engine("sqlite:///:memory:")
+        APIBaseModel.metadata.create_all(engine)
+        self.session = Session(engine)
+        repository: BaseRepository[CachedModel] = BaseRepository(session=self.session)
+        repository.model = CachedModel
+        repository.create(entity={"id": 1, "name": "First"})
+        repository.create(entity={"id": 2, "name": "Second"})
+        self.repository = Mock(wraps=repository)
+        self.cache = ServiceCache(TTLCache())
+        self.service = BaseService(repository=self.repository, cache=self.cache)
+        yield
+        self.session.close()
+        engine.dispose()
+
+    def test_get_by_id(self) -> None:
+        assert self.service.get_by_id(id=1).name == "First"
+        cached = self.service.get_by_id(id=1)
+        assert cached.name == "First"
+        assert inspect(cached).session is None
+        self.repository.retrieve_by_id.assert_called_once()
+        assert self.cache.get_stats()["hits"] == 1
+        assert self.cache.get_stats()["misses"] == 1
+
+    def test_list(self) -> None:
+        def get_pagination(page_size: int) -> PageNumberPagination:
+            schema = PageNumberSchema(page=1, page_size=page_size)
+            return PageNumberPagination(schema, count_strategy=CountStrategy.SKIP)
+
+        assert [todo.id for todo in self.service.list(pagination_manager=get_pagination(1))] == [1]
+        pagination = get_pagination(1)
+        assert [todo.id for todo in self.service.list(pagination_manager=pagination)] == [1]
+        assert pagination.has_next is True
+        assert self.repository.list.call_count == 1
+
+        assert len(self.service.list(pagination_manager=get_pagination(2))) == 2
+        assert self.repository.list.call_count == 2
+
+    def test_list_mappings(self) -> None:
+        rows = self.service.list_mappings(name="Second")
+        assert self.service.list_mappings(name="Second") == [dict(row) for row in rows]
+        self.repository.list_mappings.assert_called_once()
+
+    def test_writes_invalidate(self) -> None:
+        self.service.get_by_id(id=1)
+        self.service.list()
+
+        self.service.update(id=1, entity={"name": "Updated"})
+        assert self.service.get_by_id(id=1).name == "Updated"
+        assert self.repository.retrieve_by_id.call_count == 2
+
+        self.service.destroy(id=2)
+        assert [todo.id for todo in self.service.list()] == [1]
+        assert self.repository.list.call_count == 2
+        assert self.cache.get_stats()["invalidations"] == 2
+
+    def test_writes_invalidate_once_committed(self) -> None:
+        invalidations_on_commit = []
+        self.repository.perform_commit.side_effect = lambda: invalidations_on_commit.append(
+            self.cache.get_stats()["invalidations"]
+        )
+        self.service.create(entity={"id": 3, "name": "Third"})
+        self.service.bulk_destroy(ids=[3])
+        assert invalidations_on_commit == [0, 1]
+        assert self.cache.get_stats()["invalidations"] == 2
+
+    def test_rolled_back_writes_are_not_cached(self) -> None:
+        assert self.service.get_by_id(id=1).name == "First"
+        self.repository.perform_commit.side_effect = OperationalError("COMMIT", {}, Exception("Locked"))
+
+        with pytest.raises(OperationalError):
+            self.service.update(id=1, entity={"name": "Rolled back"})
+        # NOTE: Neither the flushed update is served, nor the cache invalidated before the rollback
+        assert self.service.get_by_id(id=1).name == "First"
+        self.session.rollback()
+        assert self.cache.get_stats()["invalidations"] == 0
+        assert self.service.get_by_id(id=1).name == "First"
+        self.repository.retrieve_by_id.assert_called_once()
+
+    def test_scoped_reads_are_not_shared(self) -> None:
+        self.session.add_all(
+            [
+                OwnedCachedModel(id=1, name="Mine", owner_id=1),
+                OwnedCachedModel(id=2, name="Theirs", owner_id=2),
+            ]
+        )
+        self.session.flush()
+
+        def get_service(owner_id: int) -> BaseService[OwnerScopedRepository[OwnedCachedModel]]:
+            repository: OwnerScopedRepository[OwnedCachedModel] = OwnerScopedRepository(
+                session=self.session, owner_id=owner_id
+            )
+            repository.model = OwnedCachedModel
+            return BaseService(repository=repository, cache=self.cache)
+
+        assert [row["id"] for row in get_service(1).list_mappings()] == [1]
+        assert [row["id"] for row in get_service(2).list_mappings()] == [2]
+        assert self.cache.get_stats()["hits"] == 0
+
+
+@pytest.mark.anyio
+class TestAsyncCachedService:
+    async def test_get_by_id_and_writes(self, mock_async_repository):  # type: ignore
+        mock_async_repository.get_model = Mock(return_value=CachedModel)
+        mock_async_repository.get_scope = Mock(return_value={})
+        mock_async_repository.retrieve_by_id.return_value = CachedModel(id=1, name="Cached")
+        service = AsyncBaseService(repository=mock_async_repository, cache=ServiceCache(TTLCache()))
+
+        assert (await service.get_by_id(id=1)).name == "Cached"
+        assert (await service.get_by_id(id=1)).name == "Cached"
+        mock_async_repository.retrieve_by_id.assert_awaited_once()
+
+        await service.bulk_destroy(ids=[1])
+        await service.get_by_id(id=1)
+        assert mock_async_repository.retrieve_by_id.await_count == 2
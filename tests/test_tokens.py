@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from utils.cache import TTLCache
+from utils.exceptions.generic import ImproperlyConfigured
+from utils.tokens import InvalidTokenError, JoseJWTBackend, TokenDecoder, get_jwt_backend
+
+KEY = "secret"
+
+
+def create_token(**claims) -> str:  # type: ignore
+    return JoseJWTBackend().encode({"sub": "user", **claims}, KEY, algorithm="HS256")
+
+
+class TestJWTBackends:
+    def test_jose_backend(self) -> None:
+        backend = get_jwt_backend("jose")
+        token = create_token(id=1)
+        assert backend.decode(token, KEY, ["HS256"]) == {"sub": "user", "id": 1}
+
+        with pytest.raises(InvalidTokenError):
+            backend.decode(token, "another-secret", ["HS256"])
+        with pytest.raises(InvalidTokenError):
+            backend.decode(create_token(exp=datetime.utcnow() - timedelta(minutes=1)), KEY, ["HS256"])
+
+    def test_unknown_backend(self) -> None:
+        with pytest.raises(ImproperlyConfigured):
+            get_jwt_backend("unknown")
+
+
+class TestTokenDecoder:
+    def test_decode_without_cache(self) -> None:
+        backend = Mock(wraps=JoseJWTBackend())
+        decoder = TokenDecoder(key=KEY, algorithms=["HS256"], backend=backend)
+        token = create_token()
+
+        assert decoder.decode(token) == decoder.decode(token) == {"sub": "user"}
+        assert backend.decode.call_count == 2
+        assert decoder.get_stats() == {}
+
+    def test_decode_cached(self) -> None:
+        backend = Mock(wraps=JoseJWTBackend())
+        decoder = TokenDecoder(key=KEY, algorithms=["HS256"], backend=backend, cache=TTLCache(ttl=60))
+        token = create_token()
+
+        claims = decoder.decode(token)
+        claims["sub"] = "altered"
+        assert decoder.decode(token) == {"sub": "user"}
+        assert backend.decode.call_count == 1
+        assert decoder.get_stats()["hits"] == 1
+        assert decoder.get_stats()["misses"] == 1
+
+    def test_cache_bounded_by_expiry(self) -> None:
+        now = 1_000_000.0
+        cache: TTLCache[dict] = TTLCache(ttl=60, timer=lambda: now)
+        decoder = TokenDecoder(key=KEY, algorithms=["HS256"], backend=Mock(), cache=cache, clock=lambda: now)
+        decoder.backend.decode.return_value = {"sub": "user", "exp": now + 10}  # type: ignore[attr-defined]
+
+        decoder.decode("token")
+        assert cache._data[next(iter(cache._data))][0] == now + 10
+
+        # Already expired claims are not cached
+        decoder.backend.decode.return_value = {"sub": "user", "exp": now - 1}  # type: ignore[attr-defined]
+        decoder.decode("expired-token")
+        assert len(cache) == 1
+
+    def test_invalid_tokens_are_not_cached(self) -> None:
+        cache: TTLCache[dict] = TTLCache(ttl=60)
+        decoder = TokenDecoder(key=KEY, algorithms=["HS256"], cache=cache)
+
+        for _ in range(2):
+            with pytest.raises(InvalidTokenError):
+                decoder.decode("not-a-token")
+        assert len(cache) == 0
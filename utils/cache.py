@@ -0,0 +1,123 @@
+"""
+Caching helpers: an in-process LRU cache with TTL, and the interface of the backends
+(e.g., the in-process cache, or a Redis-compatible store) services cache their reads into.
+"""
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Optional, Protocol, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """
+    Thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    The least recently used entry is evicted once `maxsize` entries are stored.
+    Hits, misses and evictions are counted to make the cache effectiveness observable.
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: float = 60, timer: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[T] = None) -> Optional[T]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= self.timer():
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key: Hashable, value: T, *, ttl: Optional[float] = None) -> None:
+        expires_at = self.timer() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CacheBackend(Protocol):  # pragma: no cover
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    def set(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+    def get_stats(self) -> dict[str, Any]:
+        ...
+
+
+class RedisCacheBackend:
+    """
+    Backend storing pickled values into a Redis-compatible store, through any client exposing
+    `get`, `set` (with `ex`) and `delete` as `redis.Redis` does, e.g.:
+
+        RedisCacheBackend(redis.Redis.from_url("redis://localhost:6379/0"), ttl=60)
+
+    Entries are evicted by the store itself (e.g., `maxmemory-policy allkeys-lru`), hence
+    only hits and misses are counted here.
+    """
+
+    def __init__(self, client: Any, *, ttl: float = 60) -> None:
+        self.client = client
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.client.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(value)
+
+    def set(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        # NOTE: Redis expects whole seconds, at least one
+        expires_in = max(1, int(self.ttl if ttl is None else ttl))
+        self.client.set(key, pickle.dumps(value), ex=expires_in)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,83 @@
+"""
+HTTP conditional requests (RFC 9110): `ETag` and `Last-Modified` validators of the rows a response is
+made of, and `304 Not Modified` answers to the requests whose validators still match.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Iterable, Mapping, NamedTuple, Optional
+
+from fastapi import Request, Response
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: Optional[datetime]
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+
+def get_validators(
+    rows: Iterable[Any], *, id_field: str = "id", version_field: str = "updated_at"
+) -> Validators:
+    """
+    Computes the validators of the provided rows (ORM instances or mappings), which only need their
+    `id_field` and `version_field` loaded, e.g. through a sparse fieldset, so they are cheap to fetch.
+
+    The weak ETag hashes every (id, version) pair, hence it changes whenever a row is modified, added
+    or removed. `Last-Modified` is the latest version, naive datetimes being taken as UTC.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    last_modified: Optional[datetime] = None
+    for row in rows:
+        values = row if isinstance(row, Mapping) else vars(row)
+        version = values[version_field]
+        digest.update(f"{values[id_field]}:{version.isoformat()};".encode())
+        if last_modified is None or version > last_modified:
+            last_modified = version
+
+    if last_modified is not None and last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # NOTE: Weak, as equivalent representations may differ byte wise (e.g., once compressed)
+    return Validators(etag=f'W/"{digest.hexdigest()}"', last_modified=last_modified)
+
+
+def is_conditional(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """
+    Evaluates `If-None-Match` (weak comparison) or, when absent, `If-Modified-Since`
+    (to the second, as HTTP dates are) against the provided validators.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        etag = validators.etag.removeprefix("W/")
+        return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validators.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        # NOTE: Invalid dates are ignored, as the header was not sent
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return validators.last_modified.replace(microsecond=0) <= since
+
+
+class NotModifiedResponse(Response):
+    """`304 Not Modified`, without body, bearing the validators of the unchanged representation."""
+
+    def __init__(self, validators: Validators) -> None:
+        super().__init__(status_code=304, headers=validators.headers)
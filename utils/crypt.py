@@ -1,11 +1,41 @@
-from typing import Any
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
 
 from passlib.context import CryptContext
 
+from utils.exceptions.server import ServiceUnavailableException
+
+T = TypeVar("T")
+
 
 class BCryptContext:
-    def __init__(self, schemes: list[str] = ["bcrypt"], deprecated: str = "auto", **kwargs: Any) -> None:
+    """
+    Hashes and verifies passwords.
+
+    The `async_*` methods run on a dedicated pool of `max_workers` threads (bcrypt releases the GIL),
+    so hashing never blocks the event loop. At most `max_queue` calls wait for a free worker;
+    further ones are rejected with a `ServiceUnavailableException` (503) instead of piling up.
+    """
+
+    def __init__(
+        self,
+        schemes: list[str] = ["bcrypt"],
+        deprecated: str = "auto",
+        *,
+        max_workers: int = 4,
+        max_queue: int = 64,
+        **kwargs: Any,
+    ) -> None:
         self.bcrypt_context = CryptContext(schemes=schemes, deprecated=deprecated, **kwargs)
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self.pending = 0
+        self.running = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
 
     def get_password_hash(self, password: str) -> str:
         return self.bcrypt_context.hash(password)
@@ -13,6 +43,75 @@ class BCryptContext:
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return self.bcrypt_context.verify(plain_password, hashed_password)
 
+    def verify_and_update(self, plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        """
+        Verifies the password and, if its hash is deprecated (e.g., the configured rounds changed),
+        returns a new hash to replace it with.
+
+        Returns:
+            tuple[bool, Optional[str]]: Whether the password matches and the new hash, if any.
+        """
+        return self.bcrypt_context.verify_and_update(plain_password, hashed_password)
+
+    def dummy_verify(self) -> bool:
+        """
+        Takes as long as verifying a password, e.g., for unknown users, so response times
+        do not reveal which users exist. Always returns False.
+        """
+        return self.bcrypt_context.dummy_verify()
+
+    async def async_get_password_hash(self, password: str) -> str:
+        return await self.run_in_pool(self.get_password_hash, password)
+
+    async def async_verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run_in_pool(self.verify_password, plain_password, hashed_password)
+
+    async def async_verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        return await self.run_in_pool(self.verify_and_update, plain_password, hashed_password)
+
+    async def async_dummy_verify(self) -> bool:
+        return await self.run_in_pool(self.dummy_verify)
+
+    async def run_in_pool(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Raises:
+            ServiceUnavailableException: If the pool is saturated.
+        """
+        with self._lock:
+            if self.pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise ServiceUnavailableException(
+                    detail="Too many concurrent password operations", headers={"Retry-After": "1"}
+                )
+            self.pending += 1
+
+        def run() -> T:
+            with self._lock:
+                self.running += 1
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, run)
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self.running,
+                "queued": self.pending - self.running,
+                "rejected": self.rejected,
+            }
+
 
 def get_bcrypt_context(**kwargs: Any) -> BCryptContext:
     return BCryptContext(**kwargs)
@@ -0,0 +1,453 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Callable, Generic, Optional, Protocol, Type
+
+from sqlalchemy import RowMapping, Select, delete, insert, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import ReturningUpdate
+
+from .repository import ModelMixin, ModelType
+
+
+class AsyncFilterManagerProtocol(Protocol):  # pragma: no cover
+    def filter_queryset(self, query: Select[tuple[ModelType]]) -> Select[tuple[ModelType]]:  # type: ignore
+        pass
+
+    def order_by_queryset(self, query: Select[tuple[ModelType]]) -> Select[tuple[ModelType]]:  # type: ignore
+        pass
+
+
+class AsyncFieldsManagerProtocol(Protocol):  # pragma: no cover
+    def only_queryset(self, query: Select[tuple[ModelType]]) -> Select[tuple[ModelType]]:  # type: ignore
+        pass
+
+    def columns_queryset(self, query: Select[tuple[ModelType]]) -> Select[Any]:  # type: ignore
+        pass
+
+
+class AsyncPaginationManagerProtocol(Protocol):  # pragma: no cover
+    async def apaginate_queryset(  # type: ignore
+        self, query: Select[tuple[ModelType]], *, session: AsyncSession
+    ) -> Select[tuple[ModelType]]:
+        pass
+
+    def paginate_results(self, results: list[ModelType]) -> list[ModelType]:  # type: ignore
+        pass
+
+
+class AsyncListModelMixin(Generic[ModelType]):
+    session: AsyncSession
+    get_model: Callable[..., Type[ModelType]]
+    get_base_query: Callable[..., Select[tuple[ModelType]]]
+
+    async def list(
+        self,
+        *,
+        filter_manager: Optional[AsyncFilterManagerProtocol] = None,
+        pagination_manager: Optional[AsyncPaginationManagerProtocol] = None,
+        fields_manager: Optional[AsyncFieldsManagerProtocol] = None,
+        **filters: Any,
+    ) -> list[ModelType]:
+        """
+        Args:
+            filter_manager: Object implementing `filter_queryset` and `order_by_queryset` methods
+            pagination_manager: Object implementing `apaginate_queryset` method
+            fields_manager: Object implementing `only_queryset` method
+            **filters: Filters to refine the query results.
+
+        Returns:
+            List of ModelType instances.
+        """
+        query = self.get_list_query(filter_manager=filter_manager, **filters)
+        if fields_manager:
+            query = fields_manager.only_queryset(query)
+        if pagination_manager:
+            query = await pagination_manager.apaginate_queryset(query, session=self.session)
+        results = list((await self.session.scalars(query)).all())
+        if pagination_manager:
+            return pagination_manager.paginate_results(results)
+        return results
+
+    async def list_mappings(
+        self,
+        *,
+        filter_manager: Optional[AsyncFilterManagerProtocol] = None,
+        pagination_manager: Optional[AsyncPaginationManagerProtocol] = None,
+        fields_manager: Optional[AsyncFieldsManagerProtocol] = None,
+        **filters: Any,
+    ) -> list[RowMapping]:
+        """
+        Read-only counterpart of `list`. The very same statement selects the model columns rather than
+        the entity, so rows skip the identity map and instance state tracking altogether.
+
+        Args:
+            filter_manager: Object implementing `filter_queryset` and `order_by_queryset` methods
+            pagination_manager: Object implementing `apaginate_queryset` method
+            fields_manager: Object implementing `columns_queryset` method
+            **filters: Filters to refine the query results.
+
+        Returns:
+            List of read-only `{column: value}` mappings.
+        """
+        query = self.get_list_query(filter_manager=filter_manager, **filters)
+        if fields_manager:
+            columns_query = fields_manager.columns_queryset(query)
+        else:
+            columns_query = self.columns_queryset(query)
+        if pagination_manager:
+            columns_query = await pagination_manager.apaginate_queryset(columns_query, session=self.session)
+        results = list((await self.session.execute(columns_query)).mappings().all())
+        if pagination_manager:
+            return pagination_manager.paginate_results(results)
+        return results
+
+    async def stream_mappings(
+        self,
+        *,
+        filter_manager: Optional[AsyncFilterManagerProtocol] = None,
+        fields_manager: Optional[AsyncFieldsManagerProtocol] = None,
+        chunk_size: int = 1000,
+        **filters: Any,
+    ) -> AsyncIterator[RowMapping]:
+        """
+        Streaming counterpart of `list_mappings`. Rows are fetched through a server-side cursor
+        `chunk_size` at a time, so memory stays flat whatever the size of the result set.
+
+        Args:
+            filter_manager: Object implementing `filter_queryset` and `order_by_queryset` methods
+            fields_manager: Object implementing `columns_queryset` method
+            chunk_size: Number of rows buffered per fetch.
+            **filters: Filters to refine the query results.
+
+        Yields:
+            Read-only `{column: value}` mappings.
+        """
+        query = self.get_list_query(filter_manager=filter_manager, **filters)
+        if fields_manager:
+            columns_query = fields_manager.columns_queryset(query)
+        else:
+            columns_query = self.columns_queryset(query)
+        result = await self.session.stream(columns_query.execution_options(yield_per=chunk_size))
+        async for row in result.mappings():
+            yield row
+
+    def get_list_query(
+        self, *, filter_manager: Optional[AsyncFilterManagerProtocol] = None, **filters: Any
+    ) -> Select[tuple[ModelType]]:
+        base_query = self.get_base_query()
+        query = self.list_queryset(base_query, **filters)
+        if filter_manager:
+            query = filter_manager.filter_queryset(query)
+            query = filter_manager.order_by_queryset(query)
+        return query
+
+    def list_queryset(self, base_query: Select[tuple[ModelType]], **filters: Any) -> Select[tuple[ModelType]]:
+        """Override for custom list fetching logic."""
+        return base_query.filter_by(**filters)
+
+    def columns_queryset(self, query: Select[tuple[ModelType]]) -> Select[Any]:
+        """Override for custom `list_mappings` columns. Every mapped column but deferred ones by default."""
+        model = self.get_model()
+        columns = [getattr(model, attr.key) for attr in inspect(model).column_attrs if not attr.deferred]
+        return query.with_only_columns(*columns, maintain_column_froms=True)
+
+
+class AsyncRetrieveModelMixin(Generic[ModelType]):
+    session: AsyncSession
+    get_base_query: Callable[..., Select[tuple[ModelType]]]
+
+    async def retrieve_by_id(
+        self, *, id: int, fields_manager: Optional[AsyncFieldsManagerProtocol] = None
+    ) -> ModelType:
+        """
+        Args:
+            id: ID of the entity to retrieve.
+            fields_manager: Object implementing `only_queryset` method
+
+        Returns:
+            Single ModelType instance.
+        """
+        base_query = self.get_base_query()
+        query = self.retrieve_queryset(base_query, id=id)
+        if fields_manager:
+            query = fields_manager.only_queryset(query)
+        result = await self.session.scalars(query)
+        return result.one()
+
+    async def retrieve(self, **filters: Any) -> ModelType:
+        """
+        Args:
+            **filters: Filters to refine the query results.
+
+        Returns:
+            Single ModelType instance.
+        """
+        base_query = self.get_base_query()
+        result = await self.session.scalars(self.retrieve_queryset(base_query, **filters))
+        return result.one()
+
+    def retrieve_queryset(
+        self, base_query: Select[tuple[ModelType]], **filters: Any
+    ) -> Select[tuple[ModelType]]:
+        """Override for custom retrieval logic."""
+        return base_query.filter_by(**filters)
+
+
+class AsyncCreateModelMixin(Generic[ModelType]):
+    session: AsyncSession
+    get_model: Callable[..., Type[ModelType]]
+
+    async def create(self, *, entity: dict[str, Any]) -> ModelType:
+        """
+        Args:
+            entity: Data dictionary to create a new entity.
+
+        Returns:
+            Newly created ModelType instance.
+        """
+        model = self.get_model()
+        new_record = self.create_queryset(model=model, entity=entity)
+        self.session.add(new_record)
+        await self.session.flush()
+        return new_record
+
+    def create_queryset(self, *, model: Type[ModelType], entity: dict[str, Any]) -> ModelType:
+        """Override for custom object creation logic."""
+        return model(**entity)
+
+    async def bulk_create(self, *, entities: list[dict[str, Any]]) -> list[ModelType]:
+        """
+        Inserts every entity within a single `INSERT ... RETURNING` (executemany) statement.
+
+        Args:
+            entities: List of data dictionaries to create new entities.
+
+        Returns:
+            Newly created ModelType instances, in the same order as `entities`.
+        """
+        if not entities:
+            return []
+        model = self.get_model()
+        statement = insert(model).returning(model, sort_by_parameter_order=True)
+        return list(await self.session.scalars(statement, entities))
+
+
+class AsyncUpdateModelMixin(Generic[ModelType]):
+    session: AsyncSession
+    get_model: Callable[..., Type[ModelType]]
+    get_base_query: Callable[..., Select[tuple[ModelType]]]
+
+    use_returning: bool = False
+    """
+    Opt-in single round-trip `UPDATE ... RETURNING` instead of `UPDATE` followed by a `SELECT`.
+    Requires a backend supporting RETURNING (e.g., PostgreSQL, SQLite >= 3.35).
+    `update_queryset` is bypassed, override `update_returning_statement` instead.
+    """
+
+    async def update(self, *, id: int, entity: dict[str, Any]) -> ModelType:
+        """
+        Args:
+            id: ID of the entity to update.
+            entity: Data dictionary with updated values.
+
+        Returns:
+            Updated ModelType instance.
+
+        Raises:
+            ValueError: If provided ID doesn't match entity's ID.
+        """
+        if id != entity.pop("id", id):
+            raise ValueError("ID in the entity does not match the given ID.")
+
+        base_query = self.get_base_query()
+        if self.use_returning:
+            # NOTE: `.one()` keeps raising `NoResultFound` when no row matched, i.e. a 404 response
+            statement = self.update_returning_statement(base_query, id=id, entity=entity)
+            return (await self.session.scalars(statement)).one()
+
+        query = await self.update_queryset(base_query, id=id, entity=entity)
+        result = await self.session.scalars(query)
+        instance = result.one()
+        await self.session.flush()
+        return instance
+
+    async def update_queryset(
+        self, base_query: Select[tuple[ModelType]], *, id: int, entity: dict[str, Any]
+    ) -> Select[tuple[ModelType]]:
+        query = base_query.filter_by(id=id)
+        await self.session.execute(update(self.get_model()).where(query.whereclause).values(entity))
+        return query
+
+    def update_returning_statement(
+        self, base_query: Select[tuple[ModelType]], *, id: int, entity: dict[str, Any]
+    ) -> ReturningUpdate[tuple[ModelType]]:
+        """Override for custom update logic when `use_returning` is enabled."""
+        model = self.get_model()
+        query = base_query.filter_by(id=id)
+        return update(model).where(query.whereclause).values(entity).returning(model)
+
+    async def bulk_update(self, *, entities: list[dict[str, Any]]) -> list[int]:
+        """
+        Updates every entity by primary key with a single executemany `UPDATE` statement.
+        psycopg 3 sends its parameter sets in pipeline mode, i.e. within a single round-trip.
+
+        Args:
+            entities: List of data dictionaries with updated values, each one including its `id`.
+
+        Returns:
+            IDs of the updated entities. Missing ones (or filtered out by the base query) are skipped.
+
+        Raises:
+            ValueError: If any entity has no ID.
+        """
+        if any(entity.get("id") is None for entity in entities):
+            raise ValueError("Every entity must include its ID.")
+        if not entities:
+            return []
+
+        model = self.get_model()
+        ids = [entity["id"] for entity in entities]
+        id_column = model.id  # type: ignore[attr-defined]
+        query = self.get_base_query().filter(id_column.in_(ids)).with_only_columns(id_column)
+        existing_ids = set(await self.session.scalars(query))
+        if existing_ids:
+            existing_entities = [entity for entity in entities if entity["id"] in existing_ids]
+            await self.session.execute(update(model), existing_entities)
+        return [id for id in ids if id in existing_ids]
+
+
+class AsyncDestroyModelMixin(Generic[ModelType]):
+    session: AsyncSession
+    get_model: Callable[..., Type[ModelType]]
+    get_base_query: Callable[..., Select[tuple[ModelType]]]
+
+    use_returning: bool = False
+    """
+    Opt-in single round-trip `DELETE ... RETURNING id` instead of loading the instance first.
+    Requires a backend supporting RETURNING (e.g., PostgreSQL, SQLite >= 3.35).
+    `perform_destroy` is bypassed, so it does not fit custom deletes such as soft-deletes.
+    """
+
+    async def destroy(self, *, id: int) -> None:
+        """
+        Args:
+            id: ID of the entity to delete.
+        """
+        base_query = self.get_base_query()
+        query = self.destroy_queryset(base_query, id=id)
+        if self.use_returning:
+            model = self.get_model()
+            id_column = model.id  # type: ignore[attr-defined]
+            statement = delete(model).where(query.whereclause).returning(id_column)
+            # NOTE: `.one()` keeps raising `NoResultFound` when no row matched, i.e. a 404 response
+            (await self.session.scalars(statement)).one()
+            return
+
+        result = await self.session.scalars(query)
+        await self.perform_destroy(result.one())
+        await self.session.flush()
+
+    def destroy_queryset(self, base_query: Select[tuple[ModelType]], *, id: int) -> Select[tuple[ModelType]]:
+        query = base_query.filter_by(id=id)
+        return query
+
+    async def perform_destroy(self, instance: ModelType) -> None:
+        """
+        Handle deletion of an instance. Override for custom delete behavior, e.g., soft deletes.
+        """
+        await self.session.delete(instance)
+
+    async def bulk_destroy(self, *, ids: list[int]) -> list[int]:
+        """
+        Deletes every entity within a single `DELETE ... WHERE id IN (...) RETURNING id` statement.
+
+        NOTE: `perform_destroy` is bypassed, override this method as well for custom delete behavior.
+
+        Args:
+            ids: IDs of the entities to delete.
+
+        Returns:
+            IDs of the deleted entities. Missing ones (or filtered out by the base query) are skipped.
+        """
+        if not ids:
+            return []
+        model = self.get_model()
+        id_column = model.id  # type: ignore[attr-defined]
+        query = self.get_base_query().filter(id_column.in_(ids))
+        statement = delete(model).where(query.whereclause).returning(id_column)
+        deleted_ids = set(await self.session.scalars(statement))
+        return [id for id in ids if id in deleted_ids]
+
+
+class AsyncBaseRepository(
+    ModelMixin[ModelType],
+    AsyncListModelMixin[ModelType],
+    AsyncRetrieveModelMixin[ModelType],
+    AsyncCreateModelMixin[ModelType],
+    AsyncUpdateModelMixin[ModelType],
+    AsyncDestroyModelMixin[ModelType],
+):
+    """
+    `BaseRepository` counterpart built on top of `AsyncSession`, so database
+    round-trips are awaited instead of blocking the event loop.
+    """
+
+    def __init__(self, *, session: AsyncSession):
+        """
+        Args:
+            session: SQLAlchemy async session instance.
+        """
+        self.session = session
+
+    def get_base_query(self) -> Select[tuple[ModelType]]:
+        """Provides the base statement associated with the model of the repository."""
+        return select(self.get_model())
+
+    def get_scope(self) -> dict[str, Any]:
+        """Column values every row of the repository has (e.g., its owner), none by default."""
+        return {}
+
+    async def perform_commit(self) -> None:
+        await self.session.commit()
+
+
+class AsyncOwnerScopedRepository(AsyncBaseRepository[ModelType]):
+    """
+    `OwnerScopedRepository` counterpart built on top of `AsyncSession`: the owner predicate is part of
+    the base statement, hence of every read, update and delete, and created rows are assigned to the owner.
+    """
+
+    owner_field: str = "owner_id"
+
+    def __init__(self, *, session: AsyncSession, owner_id: int):
+        """
+        Args:
+            session: SQLAlchemy async session instance.
+            owner_id: ID of the owner the rows are restricted to.
+        """
+        super().__init__(session=session)
+        self.owner_id = owner_id
+
+    def get_base_query(self) -> Select[tuple[ModelType]]:
+        owner_column = getattr(self.get_model(), self.owner_field)
+        return super().get_base_query().where(owner_column == self.owner_id)
+
+    def get_scope(self) -> dict[str, Any]:
+        return {self.owner_field: self.owner_id}
+
+    def create_queryset(self, *, model: Type[ModelType], entity: dict[str, Any]) -> ModelType:
+        return super().create_queryset(model=model, entity={**entity, **self.get_scope()})
+
+    async def bulk_create(self, *, entities: list[dict[str, Any]]) -> list[ModelType]:
+        return await super().bulk_create(entities=[{**entity, **self.get_scope()} for entity in entities])
+
+    async def update(self, *, id: int, entity: dict[str, Any]) -> ModelType:
+        # NOTE: Rows cannot be handed over to another owner
+        entity.pop(self.owner_field, None)
+        return await super().update(id=id, entity=entity)
+
+    async def bulk_update(self, *, entities: list[dict[str, Any]]) -> list[int]:
+        # NOTE: Rows cannot be handed over to another owner
+        for entity in entities:
+            entity.pop(self.owner_field, None)
+        return await super().bulk_update(entities=entities)
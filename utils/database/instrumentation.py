@@ -0,0 +1,114 @@
+"""
+Per request SQL instrumentation, gathered through SQLAlchemy cursor events.
+
+Statements are recorded into the `QueryStats` of the current context (set by
+`utils.middleware.QueryInstrumentationMiddleware` or `query_budget`), if any.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Union
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAMETERS = re.compile(r"\?|%\(\w+\)s|%s|\$\d+|:\w+")
+_PARAMETER_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACES = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """More SQL statements than allowed were executed"""
+
+    pass
+
+
+class QueryStats:
+    """
+    SQL statements executed within a context (e.g., a request): how many, for how long
+    and how many times every statement fingerprint was executed.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def get_repeated(self) -> dict[str, int]:
+        """Fingerprints executed more than once, usually the sign of an N+1 query."""
+        return {statement: count for statement, count in self.fingerprints.items() if count > 1}
+
+    def get_stats(self) -> dict[str, Any]:
+        return {"count": self.count, "duration": self.duration, "repeated": self.get_repeated()}
+
+    def check_budget(self, max_queries: int) -> None:
+        """
+        Raises:
+            QueryBudgetExceeded: If more than `max_queries` statements were executed.
+        """
+        if self.count > max_queries:
+            raise QueryBudgetExceeded(
+                f"{self.count} queries executed, {max_queries} allowed. Repeated: {self.get_repeated()}"
+            )
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalizes the provided statement so the ones differing only in their literals, parameter
+    style or the length of their `IN` lists share the same fingerprint.
+    """
+    statement = _PARAMETERS.sub("?", statement)
+    statement = _LITERALS.sub("?", statement)
+    statement = _PARAMETER_LISTS.sub("(?)", statement)
+    return _WHITESPACES.sub(" ", statement).strip()
+
+
+def instrument_queries(engine: Union[Engine, AsyncEngine]) -> None:
+    """Records every statement executed by the provided engine into the current `QueryStats`."""
+    engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# NOTE: The start time is kept by the execution context, dropped along with it when the statement fails
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    context.query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - context.query_started_at)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """
+    Fails, raising `QueryBudgetExceeded`, when more than `max_queries` statements are
+    executed within the block by an instrumented engine. Meant for tests, e.g.:
+
+        with query_budget(2):
+            repository.update(id=1, entity={"title": "Nice Item"})
+    """
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+    stats.check_budget(max_queries)
@@ -0,0 +1,131 @@
+"""
+Connection pool metrics, gathered through SQLAlchemy pool events.
+"""
+import bisect
+import threading
+import time
+from typing import Any, Callable, Sequence, Union
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+"""Upper bounds, in seconds, of the histogram buckets."""
+
+
+class Histogram:
+    """
+    Thread-safe histogram of durations, in seconds, with cumulative buckets (as Prometheus' ones).
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = sorted(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            stats: dict[str, Any] = {"count": self.count, "sum": self.sum}
+
+        buckets, total = {}, 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], counts):
+            total += count
+            buckets[bound] = total
+        return {**stats, "buckets": buckets}
+
+
+class PoolMetrics:
+    """
+    Exposes the state of the connection pool of an engine, along with:
+
+    * `wait`: time spent acquiring a connection, including the wait for a free one
+      once `pool_size + max_overflow` connections are checked out.
+    * `hold`: time a connection stays checked out, from checkout to checkin.
+    * Counters of opened and invalidated connections, and of checkouts timing out.
+
+    The wait is measured around `Engine.raw_connection`, through which every connection is
+    checked out, as pool events are only fired once the connection is acquired.
+    Both survive `Engine.dispose()`, since the recreated pool keeps the event listeners.
+    """
+
+    def __init__(
+        self,
+        engine: Union[Engine, AsyncEngine],
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        self.timer = timer
+        self.wait = Histogram(buckets)
+        self.hold = Histogram(buckets)
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.instrument()
+
+    def instrument(self) -> None:
+        event.listen(self.engine, "connect", self.on_connect)
+        event.listen(self.engine, "checkout", self.on_checkout)
+        event.listen(self.engine, "checkin", self.on_checkin)
+        event.listen(self.engine, "invalidate", self.on_invalidate)
+
+        raw_connection = self.engine.raw_connection
+
+        def timed_raw_connection() -> PoolProxiedConnection:
+            started = self.timer()
+            try:
+                return raw_connection()
+            except TimeoutError:
+                self.timeouts += 1
+                raise
+            finally:
+                self.wait.observe(self.timer() - started)
+
+        self.engine.raw_connection = timed_raw_connection  # type: ignore[method-assign]
+
+    def on_connect(self, dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+        self.connects += 1
+
+    def on_checkout(
+        self, dbapi_connection: Any, connection_record: ConnectionPoolEntry, connection_proxy: Any
+    ) -> None:
+        connection_record.info["checked_out_at"] = self.timer()
+
+    def on_checkin(self, dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            self.hold.observe(self.timer() - checked_out_at)
+
+    def on_invalidate(
+        self, dbapi_connection: Any, connection_record: ConnectionPoolEntry, exception: Any
+    ) -> None:
+        self.invalidations += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        pool = self.engine.pool
+        # NOTE: Only queue pools report their size, e.g., `NullPool` and `StaticPool` do not
+        state = {
+            name: getattr(pool, name)() if hasattr(pool, name) else None
+            for name in ("size", "checkedin", "checkedout", "overflow")
+        }
+        return {
+            "pool": type(pool).__name__,
+            **state,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait": self.wait.get_stats(),
+            "hold": self.hold.get_stats(),
+        }
@@ -9,7 +9,10 @@ T = TypeVar("T", bound="TimestampMixin")
 
 class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
+    # NOTE: `onupdate` covers `UPDATE` statements (e.g., the repositories' ones), the event covers ORM flushes
+    updated_at: Mapped[datetime] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
 
     @staticmethod
     def _timestamp_before_update(mapper: Mapper[T], connection: Connection, target: T) -> None:
@@ -1,10 +1,34 @@
+from sqlalchemy import Computed, text
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
+from sqlalchemy.sql.compiler import DDLCompiler
 from typing import Any
 
+
 class APIBaseModel(DeclarativeBase):
     id: Any
     __name__
 
     @declared_attr.directive
     def __tablename__(cls) -> str:
-        return cls.__name__
+        return cls.__name__.lower()
+
+
+class PostgreSQLComputed(Computed):
+    """`Computed` whose expression is only rendered on PostgreSQL, e.g. relying on its functions.
+
+    Other dialects (e.g. SQLite while developing) generate an empty string instead, so that the tables
+    can still be created.
+    """
+
+    inherit_cache = True
+
+
+@compiles(PostgreSQLComputed)
+def _compile_computed(element: PostgreSQLComputed, compiler: DDLCompiler, **kw: Any) -> str:
+    return compiler.visit_computed_column(Computed(text("''"), persisted=element.persisted), **kw)
+
+
+@compiles(PostgreSQLComputed, "postgresql")
+def _compile_postgresql_computed(element: PostgreSQLComputed, compiler: DDLCompiler, **kw: Any) -> str:
+    return compiler.visit_computed_column(element, **kw)
@@ -1,6 +1,10 @@
-from typing import Any, Callable, Generic, Optional, Protocol, Type, TypeVar
+from __future__ import annotations
 
+from typing import Any, Callable, Generic, Iterator, Optional, Protocol, Type, TypeVar
+
+from sqlalchemy import RowMapping, delete, insert, inspect, update
 from sqlalchemy.orm import DeclarativeBase, Query, Session
+from sqlalchemy.sql.dml import ReturningUpdate
 
 from utils.exceptions.generic import ImproperlyConfigured
 
@@ -15,13 +19,25 @@ class FilterManagerProtocol(Protocol):  # pragma: no cover
         pass
 
 
+class FieldsManagerProtocol(Protocol):  # pragma: no cover
+    def only_queryset(self, query: Query[ModelType]) -> Query[ModelType]:  # type: ignore
+        pass
+
+    def columns_queryset(self, query: Query[ModelType]) -> Query[Any]:  # type: ignore
+        pass
+
+
 class PaginationManagerProtocol(Protocol):  # pragma: no cover
     def paginate_queryset(self, query: Query[ModelType]) -> Query[ModelType]:  # type: ignore
         pass
 
+    def paginate_results(self, results: list[ModelType]) -> list[ModelType]:  # type: ignore
+        pass
+
 
 class ListModelMixin(Generic[ModelType]):
     session: Session
+    get_model: Callable[..., Type[ModelType]]
     get_base_query: Callable[..., Query[ModelType]]
 
     def list(
@@ -29,46 +45,129 @@ class ListModelMixin(Generic[ModelType]):
         *,
         filter_manager: Optional[FilterManagerProtocol] = None,
         pagination_manager: Optional[PaginationManagerProtocol] = None,
+        fields_manager: Optional[FieldsManagerProtocol] = None,
         **filters: Any,
     ) -> list[ModelType]:
         """
         Args:
             filter_manager: Object implementing `filter_queryset` and `order_by_queryset` methods
             pagination_manager: Object implementing `paginate_queryset` method
+            fields_manager: Object implementing `only_queryset` method
             **filters: Filters to refine the query results.
 
         Returns:
             List of ModelType instances.
         """
 
+        query = self.get_list_query(filter_manager=filter_manager, **filters)
+        if fields_manager:
+            query = fields_manager.only_queryset(query)
+        if pagination_manager:
+            query = pagination_manager.paginate_queryset(query)
+            return pagination_manager.paginate_results(query.all())
+        return query.all()
+
+    def list_mappings(
+        self,
+        *,
+        filter_manager: Optional[FilterManagerProtocol] = None,
+        pagination_manager: Optional[PaginationManagerProtocol] = None,
+        fields_manager: Optional[FieldsManagerProtocol] = None,
+        **filters: Any,
+    ) -> list[RowMapping]:
+        """
+        Read-only counterpart of `list`. The very same statement selects the model columns rather than
+        the entity, so rows skip the identity map and instance state tracking altogether.
+
+        Args:
+            filter_manager: Object implementing `filter_queryset` and `order_by_queryset` methods
+            pagination_manager: Object implementing `paginate_queryset` method
+            fields_manager: Object implementing `columns_queryset` method
+            **filters: Filters to refine the query results.
+
+        Returns:
+            List of read-only `{column: value}` mappings.
+        """
+        query = self.get_list_query(filter_manager=filter_manager, **filters)
+        if fields_manager:
+            columns_query = fields_manager.columns_queryset(query)
+        else:
+            columns_query = self.columns_queryset(query)
+        if pagination_manager:
+            columns_query = pagination_manager.paginate_queryset(columns_query)
+        results = list(self.session.execute(columns_query.statement).mappings().all())
+        if pagination_manager:
+            return pagination_manager.paginate_results(results)
+        return results
+
+    def stream_mappings(
+        self,
+        *,
+        filter_manager: Optional[FilterManagerProtocol] = None,
+        fields_manager: Optional[FieldsManagerProtocol] = None,
+        chunk_size: int = 1000,
+        **filters: Any,
+    ) -> Iterator[RowMapping]:
+        """
+        Streaming counterpart of `list_mappings`. Rows are fetched through a server-side cursor
+        `chunk_size` at a time, so memory stays flat whatever the size of the result set.
+
+        Args:
+            filter_manager: Object implementing `filter_queryset` and `order_by_queryset` methods
+            fields_manager: Object implementing `columns_queryset` method
+            chunk_size: Number of rows buffered per fetch.
+            **filters: Filters to refine the query results.
+
+        Yields:
+            Read-only `{column: value}` mappings.
+        """
+        query = self.get_list_query(filter_manager=filter_manager, **filters)
+        if fields_manager:
+            columns_query = fields_manager.columns_queryset(query)
+        else:
+            columns_query = self.columns_queryset(query)
+        result = self.session.execute(columns_query.statement, execution_options={"yield_per": chunk_size})
+        yield from result.mappings()
+
+    def get_list_query(
+        self, *, filter_manager: Optional[FilterManagerProtocol] = None, **filters: Any
+    ) -> Query[ModelType]:
         base_query = self.get_base_query()
         query = self.list_queryset(base_query, **filters)
         if filter_manager:
             query = filter_manager.filter_queryset(query)
             query = filter_manager.order_by_queryset(query)
-        if pagination_manager:
-            query = pagination_manager.paginate_queryset(query)
-        return query.all()
+        return query
 
     def list_queryset(self, base_query: Query[ModelType], **filters: Any) -> Query[ModelType]:
         """Override for custom list fetching logic."""
         return base_query.filter_by(**filters)
 
+    def columns_queryset(self, query: Query[ModelType]) -> Query[Any]:
+        """Override for custom `list_mappings` columns. Every mapped column but deferred ones by default."""
+        model = self.get_model()
+        columns = [getattr(model, attr.key) for attr in inspect(model).column_attrs if not attr.deferred]
+        return query.with_entities(*columns)
+
 
 class RetrieveModelMixin(Generic[ModelType]):
     session: Session
     get_base_query: Callable[..., Query[ModelType]]
 
-    def retrieve_by_id(self, *, id: int) -> ModelType:
+    def retrieve_by_id(self, *, id: int, fields_manager: Optional[FieldsManagerProtocol] = None) -> ModelType:
         """
         Args:
             id: ID of the entity to retrieve.
+            fields_manager: Object implementing `only_queryset` method
 
         Returns:
             Single ModelType instance.
         """
         base_query = self.get_base_query()
-        return self.retrieve_queryset(base_query, id=id).one()
+        query = self.retrieve_queryset(base_query, id=id)
+        if fields_manager:
+            query = fields_manager.only_queryset(query)
+        return query.one()
 
     def retrieve(self, **filters: Any) -> ModelType:
         """
@@ -108,11 +207,35 @@ class CreateModelMixin(Generic[ModelType]):
         """Override for custom object creation logic."""
         return model(**entity)
 
+    def bulk_create(self, *, entities: list[dict[str, Any]]) -> list[ModelType]:
+        """
+        Inserts every entity within a single `INSERT ... RETURNING` (executemany) statement.
+
+        Args:
+            entities: List of data dictionaries to create new entities.
+
+        Returns:
+            Newly created ModelType instances, in the same order as `entities`.
+        """
+        if not entities:
+            return []
+        model = self.get_model()
+        statement = insert(model).returning(model, sort_by_parameter_order=True)
+        return list(self.session.scalars(statement, entities))
+
 
 class UpdateModelMixin(Generic[ModelType]):
     session: Session
+    get_model: Callable[..., Type[ModelType]]
     get_base_query: Callable[..., Query[ModelType]]
 
+    use_returning: bool = False
+    """
+    Opt-in single round-trip `UPDATE ... RETURNING` instead of `UPDATE` followed by a `SELECT`.
+    Requires a backend supporting RETURNING (e.g., PostgreSQL, SQLite >= 3.35).
+    `update_queryset` is bypassed, override `update_returning_statement` instead.
+    """
+
     def update(self, *, id: int, entity: dict[str, Any]) -> ModelType:
         """
         Args:
@@ -129,6 +252,11 @@ class UpdateModelMixin(Generic[ModelType]):
             raise ValueError("ID in the entity does not match the given ID.")
 
         base_query = self.get_base_query()
+        if self.use_returning:
+            # NOTE: `.one()` keeps raising `NoResultFound` when no row matched, i.e. a 404 response
+            statement = self.update_returning_statement(base_query, id=id, entity=entity)
+            return self.session.scalars(statement).one()
+
         query = self.update_queryset(base_query, id=id, entity=entity)
         instance = query.one()
         self.session.flush()
@@ -141,18 +269,72 @@ class UpdateModelMixin(Generic[ModelType]):
         query.update(entity)  # type: ignore[arg-type]
         return query
 
+    def update_returning_statement(
+        self, base_query: Query[ModelType], *, id: int, entity: dict[str, Any]
+    ) -> ReturningUpdate[tuple[ModelType]]:
+        """Override for custom update logic when `use_returning` is enabled."""
+        model = self.get_model()
+        query = base_query.filter_by(id=id)
+        return update(model).where(query.whereclause).values(entity).returning(model)
+
+    def bulk_update(self, *, entities: list[dict[str, Any]]) -> list[int]:
+        """
+        Updates every entity by primary key with a single executemany `UPDATE` statement.
+        psycopg 3 sends its parameter sets in pipeline mode, i.e. within a single round-trip.
+
+        Args:
+            entities: List of data dictionaries with updated values, each one including its `id`.
+
+        Returns:
+            IDs of the updated entities. Missing ones (or filtered out by the base query) are skipped.
+
+        Raises:
+            ValueError: If any entity has no ID.
+        """
+        if any(entity.get("id") is None for entity in entities):
+            raise ValueError("Every entity must include its ID.")
+        if not entities:
+            return []
+
+        model = self.get_model()
+        ids = [entity["id"] for entity in entities]
+        id_column = model.id  # type: ignore[attr-defined]
+        query = self.get_base_query().filter(id_column.in_(ids)).with_entities(id_column)
+        existing_ids = set(self.session.scalars(query.statement))
+        if existing_ids:
+            existing_entities = [entity for entity in entities if entity["id"] in existing_ids]
+            self.session.execute(update(model), existing_entities)
+        return [id for id in ids if id in existing_ids]
+
 
 class DestroyModelMixin(Generic[ModelType]):
     session: Session
+    get_model: Callable[..., Type[ModelType]]
     get_base_query: Callable[..., Query[ModelType]]
 
+    use_returning: bool = False
+    """
+    Opt-in single round-trip `DELETE ... RETURNING id` instead of loading the instance first.
+    Requires a backend supporting RETURNING (e.g., PostgreSQL, SQLite >= 3.35).
+    `perform_destroy` is bypassed, so it does not fit custom deletes such as soft-deletes.
+    """
+
     def destroy(self, *, id: int) -> None:
         """
         Args:
             id: ID of the entity to delete.
         """
         base_query = self.get_base_query()
-        instance = self.destroy_queryset(base_query, id=id).one()
+        query = self.destroy_queryset(base_query, id=id)
+        if self.use_returning:
+            model = self.get_model()
+            id_column = model.id  # type: ignore[attr-defined]
+            statement = delete(model).where(query.whereclause).returning(id_column)
+            # NOTE: `.one()` keeps raising `NoResultFound` when no row matched, i.e. a 404 response
+            self.session.scalars(statement).one()
+            return
+
+        instance = query.one()
         self.perform_destroy(instance)
         self.session.flush()
 
@@ -168,16 +350,48 @@ class DestroyModelMixin(Generic[ModelType]):
         """
         self.session.delete(instance)
 
+    def bulk_destroy(self, *, ids: list[int]) -> list[int]:
+        """
+        Deletes every entity within a single `DELETE ... WHERE id IN (...) RETURNING id` statement.
+
+        NOTE: `perform_destroy` is bypassed, override this method as well for custom delete behavior.
+
+        Args:
+            ids: IDs of the entities to delete.
+
+        Returns:
+            IDs of the deleted entities. Missing ones (or filtered out by the base query) are skipped.
+        """
+        if not ids:
+            return []
+        model = self.get_model()
+        id_column = model.id  # type: ignore[attr-defined]
+        query = self.get_base_query().filter(id_column.in_(ids))
+        deleted_ids = set(self.session.scalars(delete(model).where(query.whereclause).returning(id_column)))
+        return [id for id in ids if id in deleted_ids]
+
+
+class ModelMixin(Generic[ModelType]):
+    model: Optional[Type[ModelType]]
+
+    def get_model(self) -> Type[ModelType]:
+        """Get the model associated with this repository. Raise exception if not set."""
+        if self.model is None:
+            raise ImproperlyConfigured(
+                "%(cls)s is missing a Model. Define %(cls)s.model, or override "
+                "%(cls)s.get_model()." % {"cls": self.__class__.__name__}
+            )
+        return self.model
+
 
 class BaseRepository(
+    ModelMixin[ModelType],
     ListModelMixin[ModelType],
     RetrieveModelMixin[ModelType],
     CreateModelMixin[ModelType],
     UpdateModelMixin[ModelType],
     DestroyModelMixin[ModelType],
 ):
-    model: Optional[Type[ModelType]]
-
     def __init__(self, *, session: Session):
         """
         Args:
@@ -185,18 +399,59 @@ class BaseRepository(
         """
         self.session = session
 
-    def get_model(self) -> Type[ModelType]:
-        """Get the model associated with this repository. Raise exception if not set."""
-        if self.model is None:
-            raise ImproperlyConfigured(
-                "%(cls)s is missing a Model. Define %(cls)s.model, or override "
-                "%(cls)s.get_model()." % {"cls": self.__class__.__name__}
-            )
-        return self.model
-
     def get_base_query(self) -> Query[ModelType]:
         """Provides the base query associated with the model of the repository."""
         return self.session.query(self.get_model())
 
+    def get_scope(self) -> dict[str, Any]:
+        """Column values every row of the repository has (e.g., its owner), none by default."""
+        return {}
+
     def perform_commit(self) -> None:
         self.session.commit()
+
+
+class OwnerScopedRepository(BaseRepository[ModelType]):
+    """
+    `BaseRepository` restricted to the rows of a single owner: the owner predicate is part of the base
+    query, hence of every read, update and delete, and created rows are assigned to the owner.
+
+    Along with `use_returning`, ownership-checked updates and deletes take a single round-trip,
+    `UPDATE/DELETE ... WHERE id = :id AND owner_id = :owner_id RETURNING`, raising `NoResultFound`
+    (i.e. a 404 response) for rows of other owners as for missing ones.
+    """
+
+    owner_field: str = "owner_id"
+
+    def __init__(self, *, session: Session, owner_id: int):
+        """
+        Args:
+            session: SQLAlchemy session instance.
+            owner_id: ID of the owner the rows are restricted to.
+        """
+        super().__init__(session=session)
+        self.owner_id = owner_id
+
+    def get_base_query(self) -> Query[ModelType]:
+        owner_column = getattr(self.get_model(), self.owner_field)
+        return super().get_base_query().filter(owner_column == self.owner_id)
+
+    def get_scope(self) -> dict[str, Any]:
+        return {self.owner_field: self.owner_id}
+
+    def create_queryset(self, *, model: Type[ModelType], entity: dict[str, Any]) -> ModelType:
+        return super().create_queryset(model=model, entity={**entity, **self.get_scope()})
+
+    def bulk_create(self, *, entities: list[dict[str, Any]]) -> list[ModelType]:
+        return super().bulk_create(entities=[{**entity, **self.get_scope()} for entity in entities])
+
+    def update(self, *, id: int, entity: dict[str, Any]) -> ModelType:
+        # NOTE: Rows cannot be handed over to another owner
+        entity.pop(self.owner_field, None)
+        return super().update(id=id, entity=entity)
+
+    def bulk_update(self, *, entities: list[dict[str, Any]]) -> list[int]:
+        # NOTE: Rows cannot be handed over to another owner
+        for entity in entities:
+            entity.pop(self.owner_field, None)
+        return super().bulk_update(entities=entities)
@@ -0,0 +1,96 @@
+"""
+Read replicas support: a session routing plain reads to replicas and everything else to the primary.
+"""
+import itertools
+import time
+from typing import Any, Callable, Optional, Sequence, Union
+
+from sqlalchemy import Engine, Select, event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+
+class ReplicaPicker:
+    """
+    Round robin over the healthy replicas.
+
+    A replica is deemed unhealthy for `cooldown` seconds whenever connecting to it fails or one
+    of its connections is lost (`handle_error` event). `pick` returns `None` when no replica
+    is healthy, so callers can fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[Union[Engine, AsyncEngine]],
+        *,
+        cooldown: float = 30,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.engines = [
+            engine.sync_engine if isinstance(engine, AsyncEngine) else engine for engine in engines
+        ]
+        self.cooldown = cooldown
+        self.timer = timer
+        self._unhealthy_until: dict[Engine, float] = {}
+        self._counter = itertools.count()
+        for engine in self.engines:
+            event.listen(engine, "handle_error", self.on_error)
+
+    def on_error(self, context: ExceptionContext) -> None:
+        # NOTE: No connection means it could not be established
+        if context.engine is not None and (context.is_disconnect or context.connection is None):
+            self.mark_unhealthy(context.engine)
+
+    def mark_unhealthy(self, engine: Engine) -> None:
+        self._unhealthy_until[engine] = self.timer() + self.cooldown
+
+    def is_healthy(self, engine: Engine) -> bool:
+        return self._unhealthy_until.get(engine, 0) <= self.timer()
+
+    def pick(self) -> Optional[Engine]:
+        healthy = [engine for engine in self.engines if self.is_healthy(engine)]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        # NOTE: Replicas are told apart by their position, their URLs holding credentials
+        return [
+            {"replica": index, "healthy": self.is_healthy(engine)}
+            for index, engine in enumerate(self.engines)
+        ]
+
+
+class RoutingSession(Session):
+    """
+    Session sending plain reads (`SELECT`s not locking rows) to a replica picked by `replicas`,
+    and flushes, DML and locking reads to the primary, i.e. its `bind`.
+
+    The replica is picked once per session, and kept as long as it is healthy, so that its reads
+    are consistent with each other. Once the session writes, every following statement goes to the
+    primary (read-your-writes), as replicas may lag behind. Sessions living as long as a request,
+    the stickiness does too.
+    It behaves as a regular `Session` when no `replicas` are provided.
+
+        sessionmaker(class_=RoutingSession, bind=primary, replicas=ReplicaPicker([replica]))
+        async_sessionmaker(sync_session_class=RoutingSession, bind=primary, replicas=ReplicaPicker([replica]))
+    """
+
+    def __init__(self, *args: Any, replicas: Optional[ReplicaPicker] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kwargs: Any) -> Any:
+        if self.replicas is None or self.info.get("use_primary"):
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        is_read = isinstance(clause, Select) and clause._for_update_arg is None
+        if self._flushing or not is_read:
+            self.info["use_primary"] = True
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        replica = self.info.get("replica")
+        if replica is None or not self.replicas.is_healthy(replica):
+            replica = self.info["replica"] = self.replicas.pick()
+        return replica or super().get_bind(mapper, clause=clause, **kwargs)
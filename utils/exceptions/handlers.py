@@ -0,0 +1,33 @@
+"""
+This module provides exception handlers rendering `HTTPException`s and request validation errors
+with `ORJSONResponse`, in place of FastAPI's default ones built on the stdlib `json` module.
+
+    app = FastAPI(default_response_class=ORJSONResponse, exception_handlers=exception_handlers)
+"""
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException
+
+from utils.responses import ORJSONResponse
+
+
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
+
+
+async def request_validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
+    # NOTE: Errors may carry arbitrary objects within their context (e.g., the raised `ValueError`)
+    return ORJSONResponse({"detail": jsonable_encoder(exc.errors())}, status_code=422)
+
+
+exception_handlers: dict[Any, Callable[..., Any]] = {
+    HTTPException: http_exception_handler,
+    RequestValidationError: request_validation_exception_handler,
+}
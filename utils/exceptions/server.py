@@ -21,3 +21,12 @@ class DatabaseConnectionError(ServerError):
     """
 
     detail = "Could not connect or perform the operation to the database"
+
+
+class ServiceUnavailableException(ServerError):
+    """
+    The server is not ready to handle the request, e.g., it is overloaded.
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    detail = "Service Unavailable"
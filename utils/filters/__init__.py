@@ -1,7 +1,9 @@
 from .core import BaseFilterManager
+from .fields import BaseFieldsManager
 from .schemas import FilterSchema
 
 __all__ = (
+    "BaseFieldsManager",
     "BaseFilterManager",
     "FilterSchema",
 )
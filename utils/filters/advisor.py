@@ -0,0 +1,298 @@
+"""
+advisor.py
+
+Index advisor: which index serves each filter "shape" a `FilterSchema` allows, that is each one of its
+`field__lookup` filters and ordering fields (`Meta.ordering_fields`), preceded by the fields every query
+is restricted by (`Meta.scope_fields`, e.g. the owner). Schemas without `Meta.model` are skipped.
+
+Suggestions follow the lookups: B-tree indexes with the scope fields first, on `lower(field)` for `ieq`,
+trigram (`pg_trgm`) GIN indexes for `contains`/`icontains` and GIN ones for `search`. Indexes on nullable
+columns are partial (`WHERE field IS NOT NULL`), as no lookup matches `NULL`.
+
+Reports the indexes of the model table serving each shape, and renders the missing ones as an Alembic
+revision:
+
+    python -m utils.filters.advisor app.todo.filters --revision
+"""
+import argparse
+import importlib
+import json
+import re
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple, Optional, Type
+
+from sqlalchemy import Boolean, ColumnClause, Table, UniqueConstraint, inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from .operations import SEARCH_CONFIG
+from .schemas import FilterSchema
+
+TRIGRAM_LOOKUPS = ("contains", "icontains")
+
+
+class IndexSuggestion(NamedTuple):
+    """
+    An index, described by its expressions (column names or SQL, e.g. `lower(title)`) as rendered
+    by PostgreSQL, so the suggested and existing indexes can be compared.
+    """
+
+    table: str
+    expressions: tuple[str, ...]
+    using: str = "btree"
+    ops: Optional[str] = None
+    where: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        parts = [re.sub(r"\W+", "_", expression).strip("_") for expression in self.expressions]
+        suffix = "_trgm" if self.ops == "gin_trgm_ops" else ""
+        # NOTE: PostgreSQL truncates identifiers to 63 characters
+        return f"ix_{self.table}_{'_'.join(parts)}"[: 63 - len(suffix)] + suffix
+
+    def serves(self, other: "IndexSuggestion") -> bool:
+        """Whether this index serves the queries `other` would, i.e. `other` is redundant."""
+        if (self.table, self.using, self.ops) != (other.table, other.using, other.ops):
+            return False
+        # NOTE: A partial index only serves queries implying its predicate
+        if self.where is not None and self.where != other.where:
+            return False
+        if self.using != "btree":
+            return self.expressions == other.expressions
+        # NOTE: B-tree indexes serve any query on a leading subset of their columns
+        return self.expressions[: len(other.expressions)] == other.expressions
+
+
+class Advice(NamedTuple):
+    schema: str
+    shape: str
+    index: Optional[IndexSuggestion]
+    served_by: Optional[str]
+
+    @property
+    def status(self) -> str:
+        if self.index is None:
+            return "not selective enough to be indexed"
+        if self.served_by is None:
+            return f"missing {self.index.name}"
+        return f"served by {self.served_by}"
+
+
+def compile_expression(expression: Any) -> str:
+    if isinstance(expression, ColumnClause):
+        return expression.name
+    compiled = expression.compile(dialect=postgresql.dialect(), compile_kwargs={"include_table": False})
+    return str(compiled)
+
+
+def get_table_indexes(table: Table) -> dict[str, IndexSuggestion]:
+    """Indexes of `table`, along with its primary key and unique constraints, by name."""
+    indexes = {
+        "primary key": IndexSuggestion(table.name, tuple(column.name for column in table.primary_key))
+    }
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            name = str(constraint.name or f"unique {', '.join(column.name for column in constraint.columns)}")
+            indexes[name] = IndexSuggestion(table.name, tuple(column.name for column in constraint.columns))
+
+    for index in table.indexes:
+        options = index.dialect_options["postgresql"]
+        expressions = tuple(compile_expression(expression) for expression in index.expressions)
+        ops = options["ops"] or {}
+        where = options["where"]
+        indexes[str(index.name)] = IndexSuggestion(
+            table=table.name,
+            expressions=expressions,
+            using=options["using"] or "btree",
+            ops=next((ops[expression] for expression in expressions if expression in ops), None),
+            where=compile_expression(where) if where is not None else None,
+        )
+    return indexes
+
+
+def suggest_index(
+    table: Table, field: str, lookup: Optional[str], scope_fields: list[str]
+) -> Optional[IndexSuggestion]:
+    """
+    The index serving the `field__lookup` filter (or the ordering by `field` when `lookup` is `None`)
+    restricted by `scope_fields`. `None` when an index would not be selective enough.
+    """
+    column = table.c[field]
+    scope = tuple(name for name in scope_fields if name != field)
+    nullable = [name for name in (*scope, field) if table.c[name].nullable]
+    where = " AND ".join(f"{name} IS NOT NULL" for name in nullable) or None
+
+    if lookup == "search":
+        if isinstance(column.type, TSVECTOR):
+            return IndexSuggestion(table.name, (field,), using="gin")
+        return IndexSuggestion(table.name, (f"to_tsvector('{SEARCH_CONFIG}', {field})",), using="gin")
+    if lookup in TRIGRAM_LOOKUPS:
+        # NOTE: Scope fields cannot be part of a trigram index, they are filtered once found
+        where = f"{field} IS NOT NULL" if column.nullable else None
+        return IndexSuggestion(table.name, (field,), using="gin", ops="gin_trgm_ops", where=where)
+    if lookup == "ieq":
+        return IndexSuggestion(table.name, (*scope, f"lower({field})"), where=where)
+    if isinstance(column.type, Boolean) and not scope:
+        return None
+    return IndexSuggestion(table.name, (*scope, field), where=where)
+
+
+def advise(schema: Type[FilterSchema]) -> list[Advice]:
+    """Advice for every filter and ordering field of `schema`, whose `Meta.model` must be set."""
+    meta = schema._meta
+    table: Table = inspect(meta.model).local_table
+    existing = get_table_indexes(table)
+
+    shapes: list[tuple[str, str, Optional[str]]] = []
+    for key in schema.model_fields:
+        if key.count("__") == 1:
+            field, lookup = key.split("__")
+            shapes.append((key, field, lookup))
+    shapes.extend((f"ordering={field}", field, None) for field in meta.ordering_fields)
+
+    advices = []
+    for shape, field, lookup in shapes:
+        index = suggest_index(table, field, lookup, meta.scope_fields)
+        served_by = None
+        if index is not None:
+            served_by = next((name for name, other in existing.items() if other.serves(index)), None)
+        advices.append(Advice(schema.__name__, shape, index, served_by))
+    return advices
+
+
+def get_missing_indexes(advices: Iterable[Advice]) -> list[IndexSuggestion]:
+    """Indexes to create, leaving out the ones another suggested index serves as well."""
+    missing = list(dict.fromkeys(advice.index for advice in advices if advice.index and not advice.served_by))
+    return [
+        index
+        for index in missing
+        if not any(other != index and other.serves(index) for other in missing)
+    ]
+
+
+def get_filter_schemas(*modules: str) -> list[Type[FilterSchema]]:
+    """`FilterSchema` subclasses bound to a model (`Meta.model`), once `modules` are imported."""
+    for module in modules:
+        importlib.import_module(module)
+
+    schemas = []
+    pending = list(FilterSchema.__subclasses__())
+    while pending:
+        schema = pending.pop(0)
+        pending.extend(schema.__subclasses__())
+        if schema._meta.model is not None:
+            schemas.append(schema)
+    return schemas
+
+
+def literal(value: Optional[str]) -> str:
+    """Python literal of `value`, double quoted as the project code is."""
+    return "None" if value is None else json.dumps(value)
+
+
+def render_create_index(index: IndexSuggestion) -> str:
+    expressions = [
+        literal(expression) if re.fullmatch(r"\w+", expression) else f"sa.text({literal(expression)})"
+        for expression in index.expressions
+    ]
+    arguments = [literal(index.name), literal(index.table), f"[{', '.join(expressions)}]", "unique=False"]
+    if index.using != "btree":
+        arguments.append(f"postgresql_using={literal(index.using)}")
+    if index.ops is not None:
+        arguments.append(f"postgresql_ops={{{literal(index.expressions[0])}: {literal(index.ops)}}}")
+    if index.where is not None:
+        arguments.append(f"postgresql_where=sa.text({literal(index.where)})")
+    return "op.create_index(\n" + "".join(f"        {argument},\n" for argument in arguments) + "    )"
+
+
+def render_revision(
+    indexes: list[IndexSuggestion],
+    *,
+    message: str,
+    revision: str,
+    down_revision: Optional[str],
+    create_date: datetime,
+) -> str:
+    """Source of the Alembic revision creating `indexes`, laid out as the project ones."""
+    upgrades = [render_create_index(index) for index in indexes]
+    if any(index.ops == "gin_trgm_ops" for index in indexes):
+        upgrades.insert(0, 'op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")')
+    downgrades = [
+        f"op.drop_index({literal(index.name)}, table_name={literal(index.table)})"
+        for index in reversed(indexes)
+    ]
+    return f'''"""{message}
+
+Revision ID: {revision}
+Revises: {down_revision or ""}
+Create Date: {create_date}
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = {literal(revision)}
+down_revision = {literal(down_revision)}
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    {chr(10).join(f"    {line}" for line in upgrades).strip() or "pass"}
+
+
+def downgrade() -> None:
+    {chr(10).join(f"    {line}" for line in downgrades).strip() or "pass"}
+'''
+
+
+def write_revision(indexes: list[IndexSuggestion], *, config_file: str, message: str) -> Path:
+    """Writes the revision creating `indexes` on top of the current head, named as the project ones."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(Config(config_file))
+    number = len(list(script.walk_revisions())) + 1
+    now = datetime.now()
+    slug = re.sub(r"\W+", "_", message.lower())
+    path = Path(script.versions) / f"{now:%Y-%m-%d}__{number:04d}_{slug}.py"
+    source = render_revision(
+        indexes,
+        message=f"_{number:04d}_{message}",
+        revision=uuid.uuid4().hex[-12:],
+        down_revision=script.get_current_head(),
+        create_date=now,
+    )
+    path.write_text(source)
+    return path
+
+
+def run(args: argparse.Namespace) -> None:
+    advices = [advice for schema in get_filter_schemas(*args.modules) for advice in advise(schema)]
+    for advice in advices:
+        print(f"{advice.schema:<24} {advice.shape:<28} {advice.status}")
+
+    missing = get_missing_indexes(advices)
+    if args.revision and missing:
+        print(f"Written {write_revision(missing, config_file=args.config, message=args.message)}")
+
+
+def main() -> None:
+    run(parse_args())
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("modules", nargs="+", help="Modules defining filter schemas, e.g. app.todo.filters")
+    parser.add_argument("--revision", action="store_true", help="Write the missing indexes as a revision")
+    parser.add_argument("--message", default="Add filter indexes", help="Message of the revision")
+    parser.add_argument("--config", default="alembic.ini", help="Alembic configuration file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,30 @@
-from typing import Any, Callable, Dict, Optional, Type
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Type, TypeVar, Union
 
-from sqlalchemy import and_, asc, desc
+from sqlalchemy import ColumnElement, Select, String, and_, asc, bindparam, desc, inspect, or_
 from sqlalchemy.orm import DeclarativeBase, Query
 from sqlalchemy.sql.expression import ColumnExpressionArgument, UnaryExpression
 
+from utils.cache import TTLCache
+from utils.exceptions.client import BadRequestException
+from utils.exceptions.generic import ImproperlyConfigured
+
+from .operations import OPERATIONS, search_rank
 from .schemas import FilterSchema
 
+QueryType = TypeVar("QueryType", bound=Union[Query[DeclarativeBase], Select[tuple[DeclarativeBase]]])
+
+
+class FilterPlan(NamedTuple):
+    """
+    Filtering conditions and ordering expressions of a filter "shape".
+
+    Conditions are built with named bound parameters (one per `field__op` key), so the very same
+    plan serves every request sharing the shape whatever the values are.
+    """
+
+    conditions: Optional[ColumnElement[bool]]
+    order_by: Optional[list[UnaryExpression[Any]]]
+
 
 class BaseFilterManager:
     """
@@ -28,6 +47,18 @@ class BaseFilterManager:
     ordering : Optional[list[str]]
         List of fields by which the queryset should be ordered.
 
+    plan_cache : Optional[TTLCache[FilterPlan]]
+        Cache of `FilterPlan` keyed by model, sorted `field__op` keys and ordering.
+        Set it to `None` to build the expressions on every request.
+
+    search_field : Optional[str]
+        The (`tsvector`) column searched by the `q` filter, as a `search_field__search` lookup.
+        Unless an ordering is requested, results are then sorted by relevance (`ts_rank_cd`).
+
+    search_fallback_fields : tuple[str, ...]
+        Text columns also matched by substring (`ILIKE`) along with the `q` search, so partial
+        words are found as well. Back them with trigram (`pg_trgm`) indexes.
+
     Available operations:
     ---------------------
     - "gt": Greater than
@@ -35,9 +66,10 @@ class BaseFilterManager:
     - "lt": Less than
     - "lte": Less than or equal to
     - "eq": Equal to
-    - "ieq": Case insensitive equality (using `ILIKE`)
+    - "ieq": Case insensitive equality (comparing `lower()` of both sides, to use a `lower(field)` index)
     - "contains": Check if column contains the value
     - "icontains": Case insensitive check if column contains the value
+    - "search": Full text search (PostgreSQL), matching `websearch_to_tsquery` of the value
 
     Example:
     --------
@@ -54,16 +86,13 @@ class BaseFilterManager:
 
     model: Type[DeclarativeBase]
 
-    OPERATIONS: Dict[str, Callable[[Any, Any], Any]] = {
-        "gt": lambda col, val: col > val,
-        "gte": lambda col, val: col >= val,
-        "lt": lambda col, val: col < val,
-        "lte": lambda col, val: col <= val,
-        "eq": lambda col, val: col == val,
-        "ieq": lambda col, val: col.ilike(val),
-        "contains": lambda col, val: col.contains(val),
-        "icontains": lambda col, val: col.ilike(f"%{val}%"),
-    }
+    OPERATIONS: Dict[str, Callable[[Any, Any], Any]] = OPERATIONS
+
+    # NOTE: Shared by every manager, the model is part of the key. No TTL as plans never go stale
+    plan_cache: Optional[TTLCache[FilterPlan]] = TTLCache(maxsize=512, ttl=float("inf"))
+
+    search_field: Optional[str] = None
+    search_fallback_fields: tuple[str, ...] = ()
 
     def __init__(self, *, filters: FilterSchema, ordering: Optional[list[str]] = None) -> None:
         """
@@ -72,11 +101,38 @@ class BaseFilterManager:
         filters : Type[FilterSchema]
             A schema containing filtering conditions.
             See `filters.schemas.FilterSchema` for more details.
+
+        ordering : Optional[list[str]]
+            Fields to order by, descending when prefixed by `-`.
+
+        Raises:
+        -------
+        BadRequestException:
+            If the schema restricts the ordering fields (`Meta.ordering_fields`) and any is not allowed.
         """
-        self.filters: dict[str, Any] = filters.model_dump(exclude_none=True, exclude_unset=True)
+        self.filters: dict[str, Any] = filters.get_filters()
+        self.lookups = filters._lookups
+        self.resolved_lookups = filters._resolved_lookups
+        self.lookups_model = filters._meta.model
         self.ordering = ordering
 
-    def filter_queryset(self, query: Query[DeclarativeBase]) -> Query[DeclarativeBase]:
+        allowed_ordering = filters._meta.ordering_fields
+        if ordering and allowed_ordering:
+            invalid_ordering = [field for field in ordering if field.lstrip("+-") not in allowed_ordering]
+            if invalid_ordering:
+                raise BadRequestException(detail=f"Invalid ordering: {', '.join(invalid_ordering)}")
+
+        if "q" in self.filters:
+            if self.search_field is None:
+                name = type(self).__name__
+                raise ImproperlyConfigured(f"{name} must define `search_field` to filter by `q`")
+            self.filters[self.search_key] = self.filters.pop("q")
+
+    @property
+    def search_key(self) -> str:
+        return f"{self.search_field}__search"
+
+    def filter_queryset(self, query: QueryType) -> QueryType:
         """
         Applies filtering conditions from self.filters to the provided query.
 
@@ -92,15 +148,18 @@ class BaseFilterManager:
         """
         if not self.filters:
             return query
-        conditions: list[ColumnExpressionArgument[bool]] = []
-        for key, value in self.filters.items():
-            if "__" in key:
-                field, op = key.split("__")
-                column = getattr(self.model, field)
-                conditions.append(self.OPERATIONS[op](column, value))
-        return query.filter(and_(*conditions))
-
-    def order_by_queryset(self, query: Query[DeclarativeBase]) -> Query[DeclarativeBase]:
+
+        plan = self.get_plan()
+        if plan.conditions is None:
+            return query
+
+        values = self.get_values()
+        if isinstance(query, Query):
+            # NOTE: Values are bound at execution time, the expression tree is reused as is
+            return query.filter(plan.conditions).params(**values)  # type: ignore[return-value]
+        return query.filter(plan.conditions.params(values))  # type: ignore[return-value]
+
+    def order_by_queryset(self, query: QueryType) -> QueryType:
         """
         Orders the provided query based on self.ordering.
 
@@ -114,16 +173,76 @@ class BaseFilterManager:
         Query
             The ordered query.
         """
-        if self.ordering is None:
+        if self.ordering is None and self.search_key not in self.filters:
             return query
 
-        order_expressions: list[UnaryExpression[DeclarativeBase]] = []
-        for field in self.ordering:
-            if field.startswith("-"):
-                attr = getattr(self.model, field[1:])
-                order_expressions.append(desc(attr))
-            else:
-                attr = getattr(self.model, field.lstrip("+"))
-                order_expressions.append(asc(attr))
+        plan = self.get_plan()
+        if self.ordering is not None or isinstance(query, Query):
+            return query.order_by(*plan.order_by or [])  # type: ignore[return-value]
+        # NOTE: Relevance ranking depends on the search terms
+        values = self.get_values()
+        order_by = [expression.params(values) for expression in plan.order_by or []]
+        return query.order_by(*order_by)  # type: ignore[return-value]
+
+    def get_plan(self) -> FilterPlan:
+        """Returns the (cached) `FilterPlan` matching the shape of the current filters and ordering."""
+        keys = tuple(sorted(key for key in self.filters if "__" in key))
+        ordering = tuple(self.ordering) if self.ordering is not None else None
+        if self.plan_cache is None:
+            return self.build_plan(keys, ordering)
+
+        # NOTE: Managers may build different plans of the same model, e.g. through other search fields
+        cache_key = (type(self), self.model, keys, ordering)
+        plan = self.plan_cache.get(cache_key)
+        if plan is None:
+            plan = self.build_plan(keys, ordering)
+            self.plan_cache.set(cache_key, plan)
+        return plan
+
+    def get_cache_key(self) -> Hashable:
+        """Normalized filters and ordering, e.g. to cache the results of the filtered query."""
+        ordering = tuple(self.ordering) if self.ordering is not None else None
+        return (tuple(sorted((key, repr(value)) for key, value in self.filters.items())), ordering)
+
+    def get_values(self) -> dict[str, Any]:
+        """Values of the bound parameters of the plan conditions, by `field__op` key."""
+        return {key: value for key, value in self.filters.items() if "__" in key}
+
+    def build_plan(self, keys: tuple[str, ...], ordering: Optional[tuple[str, ...]]) -> FilterPlan:
+        # NOTE: Columns and operations resolved by the schema, unless bound to another model or operations
+        resolved = self.resolved_lookups
+        if self.lookups_model is not self.model or self.OPERATIONS is not OPERATIONS:
+            resolved = {}
 
-        return query.order_by(*order_expressions)
+        conditions: list[ColumnExpressionArgument[bool]] = []
+        for key in keys:
+            field, op = self.lookups[key] if key in self.lookups else key.split("__")
+            if key in resolved:
+                column, operation = resolved[key]
+            else:
+                column, operation = getattr(self.model, field), self.OPERATIONS[op]
+            # NOTE: Search terms are text whatever the searched column is
+            value = bindparam(key, type_=String() if op == "search" else column.type)
+            condition = operation(column, value)
+            if key == self.search_key and self.search_fallback_fields:
+                fallbacks = [getattr(self.model, name) for name in self.search_fallback_fields]
+                condition = or_(condition, *[fallback.ilike("%" + value + "%") for fallback in fallbacks])
+            conditions.append(condition)
+
+        order_expressions: Optional[list[UnaryExpression[Any]]] = None
+        if ordering is not None:
+            order_expressions = []
+            for field in ordering:
+                if field.startswith("-"):
+                    attr = getattr(self.model, field[1:])
+                    order_expressions.append(desc(attr))
+                else:
+                    attr = getattr(self.model, field.lstrip("+"))
+                    order_expressions.append(asc(attr))
+        elif self.search_key in keys:
+            value = bindparam(self.search_key, type_=String())
+            rank = search_rank(getattr(self.model, str(self.search_field)), value)
+            # NOTE: Ties broken by primary key so pages are stable
+            order_expressions = [desc(rank), *[asc(column) for column in inspect(self.model).primary_key]]
+
+        return FilterPlan(conditions=and_(*conditions) if conditions else None, order_by=order_expressions)
@@ -0,0 +1,117 @@
+from typing import Any, Hashable, Optional, Sequence, Type, TypeVar, Union
+
+from sqlalchemy import Select, inspect
+from sqlalchemy.orm import DeclarativeBase, InstrumentedAttribute, Query, load_only
+
+from utils.exceptions.client import BadRequestException
+
+QueryType = TypeVar("QueryType", bound=Union[Query[DeclarativeBase], Select[tuple[DeclarativeBase]]])
+
+
+class BaseFieldsManager:
+    """
+    The BaseFieldsManager restricts the columns loaded by a query to a
+    sparse fieldset requested by the client, e.g. `?fields=id,title,complete`.
+
+    Non requested columns are neither selected nor lazy loaded afterwards
+    (they raise instead), hence they are absent from the serialized response.
+    The primary key and the columns the query is ordered by are always loaded,
+    the latter so that pagination managers can build their cursors.
+
+    Attributes:
+    -----------
+    model : Type[DeclarativeBase]
+        The SQL model whose columns are projected.
+
+    fields : Optional[Sequence[str]]
+        Names of the columns to load. Every column is loaded when it is `None` or empty.
+    """
+
+    model: Type[DeclarativeBase]
+
+    def __init__(self, *, fields: Optional[Sequence[str]] = None) -> None:
+        """
+        Parameters:
+        -----------
+        fields : Optional[Sequence[str]]
+            Names of the columns to load.
+        """
+        self.fields = fields
+
+    def get_cache_key(self) -> Hashable:
+        """Normalized fields, e.g. to cache the results of the restricted query."""
+        return tuple(sorted(self.fields)) if self.fields else None
+
+    def only_queryset(self, query: QueryType) -> QueryType:
+        """
+        Restricts the columns loaded by the provided query to `self.fields`.
+
+        Parameters:
+        -----------
+        query : Query
+            The query to be restricted.
+
+        Returns:
+        --------
+        Query
+            The restricted query.
+
+        Raises:
+        -------
+        BadRequestException:
+            If any field is not a column of the model.
+        """
+        if not self.fields:
+            return query
+        return query.options(load_only(*self.get_attributes(query), raiseload=True))  # type: ignore
+
+    def columns_queryset(self, query: QueryType) -> Any:
+        """
+        Replaces the entity selected by the provided query with its columns,
+        restricted to `self.fields` if any, so it yields plain rows rather than instances.
+
+        Parameters:
+        -----------
+        query : Query
+            The query to be projected.
+
+        Returns:
+        --------
+        Query
+            The projected query.
+
+        Raises:
+        -------
+        BadRequestException:
+            If any field is not a column of the model.
+        """
+        if self.fields:
+            attributes = self.get_attributes(query)
+        else:
+            # NOTE: Deferred columns (e.g., search documents) are left out, as ORM queries do
+            mapper = inspect(self.model)
+            attributes = [getattr(self.model, attr.key) for attr in mapper.column_attrs if not attr.deferred]
+        if isinstance(query, Query):
+            return query.with_entities(*attributes)
+        return query.with_only_columns(*attributes, maintain_column_froms=True)
+
+    def get_attributes(self, query: QueryType) -> list[InstrumentedAttribute[Any]]:
+        """Validated attributes of the requested fields, along with the primary key and ordering ones."""
+        mapper = inspect(self.model)
+        invalid_fields = [field for field in self.fields or [] if field not in mapper.column_attrs]
+        if invalid_fields:
+            raise BadRequestException(detail=f"Invalid fields: {', '.join(invalid_fields)}")
+
+        primary_keys = [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+        names = dict.fromkeys([*primary_keys, *(self.fields or []), *self.get_ordering_names(query)])
+        return [getattr(self.model, name) for name in names]
+
+    def get_ordering_names(self, query: QueryType) -> list[str]:
+        """Names of the model columns the provided query is ordered by."""
+        columns = inspect(self.model).column_attrs
+        names = []
+        for clause in query._order_by_clauses:
+            key = getattr(getattr(clause, "element", clause), "key", None)
+            if key in columns:
+                names.append(key)
+        return names
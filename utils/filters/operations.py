@@ -0,0 +1,87 @@
+"""
+Filtering operations by lookup name (the `op` of `field__op` filters), shared by `FilterSchema`,
+which resolves them once per subclass, and `BaseFilterManager`, which builds the conditions.
+"""
+from typing import Any, Callable, Dict
+
+from sqlalchemy import Boolean, Float, false, func, null
+from sqlalchemy.dialects.postgresql import TSVECTOR, to_tsvector, websearch_to_tsquery
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+
+# NOTE: Must be the configuration the searched `tsvector` columns are generated with
+SEARCH_CONFIG = "english"
+
+
+def search_document(column: Any) -> Any:
+    """`tsvector` columns as they are, any other (text) column parsed on the fly (no index is used then)."""
+    if isinstance(column.type, TSVECTOR):
+        return column
+    return to_tsvector(SEARCH_CONFIG, column)
+
+
+def search_query(value: Any) -> Any:
+    """Parses `value` as a web search engine would: quoted phrases, `or` and `-` exclusions."""
+    return websearch_to_tsquery(SEARCH_CONFIG, value)
+
+
+class search_match(FunctionElement[bool]):
+    """
+    `search_match(column, value)`: the `column` document matching the `value` search on PostgreSQL.
+
+    Full text search being PostgreSQL only, other dialects (e.g., SQLite while developing) match text
+    columns by substring (`ILIKE`) and `tsvector` ones not at all, leaving it to the fallback fields.
+    """
+
+    name = "search_match"
+    type = Boolean()
+    inherit_cache = True
+
+
+class search_rank(FunctionElement[float]):
+    """`search_rank(column, value)`: relevance (`ts_rank_cd`) on PostgreSQL, none (`NULL`) otherwise."""
+
+    name = "search_rank"
+    type = Float()
+    inherit_cache = True
+
+
+@compiles(search_match, "postgresql")
+def compile_search_match(element: search_match, compiler: SQLCompiler, **kw: Any) -> str:
+    column, value = element.clauses
+    return compiler.process(search_document(column).bool_op("@@")(search_query(value)), **kw)
+
+
+@compiles(search_match)
+def compile_search_match_fallback(element: search_match, compiler: SQLCompiler, **kw: Any) -> str:
+    column, value = element.clauses
+    if isinstance(column.type, TSVECTOR):
+        return compiler.process(false(), **kw)
+    # NOTE: Parenthesized, as non native booleans are compared to 1 (i.e. `... LIKE ... = 1`)
+    return f"({compiler.process(column.ilike('%' + value + '%'), **kw)})"
+
+
+@compiles(search_rank, "postgresql")
+def compile_search_rank(element: search_rank, compiler: SQLCompiler, **kw: Any) -> str:
+    column, value = element.clauses
+    return compiler.process(func.ts_rank_cd(search_document(column), search_query(value)), **kw)
+
+
+@compiles(search_rank)
+def compile_search_rank_fallback(element: search_rank, compiler: SQLCompiler, **kw: Any) -> str:
+    return compiler.process(null(), **kw)
+
+
+# NOTE: `val` is a `BindParameter` typed as the column, hence operations must be SQL expressions
+OPERATIONS: Dict[str, Callable[[Any, Any], Any]] = {
+    "gt": lambda col, val: col > val,
+    "gte": lambda col, val: col >= val,
+    "lt": lambda col, val: col < val,
+    "lte": lambda col, val: col <= val,
+    "eq": lambda col, val: col == val,
+    "ieq": lambda col, val: func.lower(col) == func.lower(val),
+    "contains": lambda col, val: col.contains(val),
+    "icontains": lambda col, val: col.ilike("%" + val + "%"),
+    "search": lambda col, val: search_match(col, val),
+}
@@ -29,21 +29,26 @@ Note:
 When adding new schemas, ensure to provide necessary validations and documentation
 for clarity and maintainability.
 """
-from typing import Any, Optional, Type, TypeVar
+from typing import Any, Callable, ClassVar, Optional
 
-from pydantic import BaseModel, ConfigDict, PrivateAttr, root_validator
+from pydantic import BaseModel, ConfigDict, root_validator
 
-T = TypeVar("T", bound="FilterSchema")
+from .operations import OPERATIONS
+
+LOOKUPS = ("gt", "gte", "lt", "lte", "eq", "ieq", "contains", "icontains", "search")
 
 
 class FilterMeta:
     def __init__(self, options: Optional[dict[str, Any]] = None):
         self.model = getattr(options, "model", None)
+        # NOTE: Fields the results can be ordered by, and fields every query is restricted by (e.g., owner).
+        #       Both describe the queries to serve, see `filters.advisor`
+        self.ordering_fields: list[str] = list(getattr(options, "ordering_fields", []))
+        self.scope_fields: list[str] = list(getattr(options, "scope_fields", []))
 
         # NOTE: This is not used yet. WIP!
         # self.fields = getattr(options, "fields", None)
         # self.exclude = getattr(options, "exclude", None)
-        # allowed_order_by_fields
         # order_by_field_name
 
 
@@ -60,6 +65,18 @@ class FilterSchema(BaseModel):
         Configuration dictionary for the schema, forbidding extra
         attributes that are not explicitly defined.
 
+    _meta : FilterMeta
+        Options of the inner `Meta` class, resolved once per subclass.
+
+    _lookups : dict[str, tuple[str, str]]
+        The `(field, lookup)` pair of every valid `field__lookup` attribute, resolved once per
+        subclass so requests neither parse nor validate the attribute names again.
+
+    _resolved_lookups : dict[str, tuple[Any, Callable[[Any, Any], Any]]]
+        The `(column, operation)` pair of every valid `field__lookup` attribute whose field is an
+        attribute of `Meta.model`, resolved once per subclass when bound to a model, so filter
+        managers of that model build their conditions straight away.
+
     Methods:
     --------
     check_valid_filter_lookups:
@@ -68,21 +85,28 @@ class FilterSchema(BaseModel):
     """
 
     model_config = ConfigDict(extra="forbid")
-    _meta = PrivateAttr()
-
-    def __new__(cls: Type[T], **kwargs: Optional[dict[str, Any]]) -> T:
-        _meta = FilterMeta(getattr(cls, "Meta", None))
-        new_class = super(FilterSchema, cls).__new__(cls)
-
-        # Here (rather than __ini__) for better compatibility with validators
-        cls._meta = _meta
-        return new_class
-
-    # def __init__(self, **data: Optional[dict[str, Any]]) -> None:
-    #     super().__init__(**data)
-    #     self._meta = FilterMeta(getattr(self, "Meta", None))
-
-    # TODO: Validate ordering IF DEFINED
+    _meta: ClassVar[FilterMeta] = FilterMeta()
+    _lookups: ClassVar[dict[str, tuple[str, str]]] = {}
+    _resolved_lookups: ClassVar[dict[str, tuple[Any, Callable[[Any, Any], Any]]]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._meta = FilterMeta(getattr(cls, "Meta", None))
+        lookups = {}
+        for key in cls.model_fields:
+            field, _, lookup = key.partition("__")
+            if lookup in LOOKUPS:
+                lookups[key] = (field, lookup)
+        # NOTE: Invalid attributes are left out, `check_valid_filter_lookups` rejects them when sent
+        cls._lookups = lookups
+
+        model = cls._meta.model
+        cls._resolved_lookups = {
+            key: (getattr(model, field), OPERATIONS[lookup])
+            for key, (field, lookup) in lookups.items()
+            if model is not None and hasattr(model, field)
+        }
 
     # TODO: Possible bug? extra='forbid' is not working
     #       UPDATE: This is because of the nature of query params
@@ -110,13 +134,21 @@ class FilterSchema(BaseModel):
         ValueError:
             If any filter attribute is invalid.
         """
-
-        valid_lookups = ["gt", "gte", "lt", "lte", "eq", "ieq", "contains", "icontains"]
+        lookups = cls._lookups
         for key in values.keys():
+            if key in lookups:
+                continue
             if key.count("__") == 1:
                 suffix = key.split("__")[-1]
-                if suffix not in valid_lookups:
-                    raise ValueError(
-                        f"Filter attribute {key} should be a valid lookup: {', '.join(valid_lookups)}"
-                    )
+                if suffix not in LOOKUPS:
+                    raise ValueError(f"Filter attribute {key} should be a valid lookup: {', '.join(LOOKUPS)}")
         return values
+
+    def get_filters(self) -> dict[str, Any]:
+        """
+        Filters sent, i.e. set and not `None`, by attribute name.
+
+        Same as `model_dump(exclude_none=True, exclude_unset=True)` without serializing every value.
+        """
+        values = self.__dict__
+        return {key: values[key] for key in self.model_fields_set if values[key] is not None}
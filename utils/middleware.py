@@ -1,12 +1,17 @@
-from typing import Optional, Type
+import logging
+from fnmatch import fnmatch
+from typing import Mapping, Optional, Sequence, Type
 
-from fastapi import Request, Response
 from sqlalchemy.exc import NoResultFound, SQLAlchemyError, TimeoutError
-from starlette.middleware.base import BaseHTTPMiddleware, DispatchFunction, RequestResponseEndpoint
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from .compression import Codec, Compressor, get_codec, parse_accept_encoding
+from .database.instrumentation import QueryStats, current_query_stats
 from .responses import BaseErrorResponse, DatabaseErrorResponse, NotFoundErrorResponse, TimeoutErrorResponse
 
+logger = logging.getLogger(__name__)
+
 
 # NOTE: HTTPExceptions are automatically handled by the `ExceptionMiddleware` class
 # from the `starlette.middleware.exceptions` module, which FastAPI extends/inherits.
@@ -15,26 +20,226 @@ from .responses import BaseErrorResponse, DatabaseErrorResponse, NotFoundErrorRe
 #
 # With love,
 # Jordy Cuan
-class SQLAlchemyExceptionHandlerMiddleware(BaseHTTPMiddleware):
-    def __init__(
-        self,
-        app: ASGIApp,
-        dispatch: Optional[DispatchFunction] = None,
-        debug: bool = False,
-    ) -> None:
+#
+# NOTE: Implemented as a pure ASGI middleware rather than a `BaseHTTPMiddleware`, which runs every
+# request within extra tasks and memory streams, adding latency and buffering streaming responses.
+class SQLAlchemyExceptionHandlerMiddleware:
+    def __init__(self, app: ASGIApp, debug: bool = False) -> None:
         self.app = app
-        self.dispatch_func = self.dispatch if dispatch is None else dispatch
         self.debug = debug
         self._exception_responses: dict[Type[Exception], Type[BaseErrorResponse]] = {
             NoResultFound: NotFoundErrorResponse,
             TimeoutError: TimeoutErrorResponse,
         }
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except SQLAlchemyError as exc:
+            # NOTE: A response cannot be sent once another one has started (e.g., a streaming one)
+            if response_started:
+                raise
             error_response = self._exception_responses.get(type(exc), DatabaseErrorResponse)
             debug_message = str(exc) if self.debug else None
-            return error_response(debug_message=debug_message)
+            await error_response(debug_message=debug_message)(scope, receive, send)
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Records the SQL statements executed by every request through the engines instrumented by
+    `utils.database.instrumentation.instrument_queries`. Their count and total duration are sent
+    as a `Server-Timing` header and logged along with the repeated statements (likely N+1 queries).
+
+    When `query_budget` is set, requests executing more statements raise `QueryBudgetExceeded`
+    once their response is sent, hence tests exercising them fail.
+    """
+
+    def __init__(self, app: ASGIApp, query_budget: Optional[int] = None) -> None:
+        self.app = app
+        self.query_budget = query_budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                server_timing = f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"'
+                MutableHeaders(scope=message).append("Server-Timing", server_timing)
+            await send(message)
+
+        token = current_query_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_query_stats.reset(token)
+            logger.info(
+                "%s %s executed %d queries in %.2f ms",
+                scope["method"],
+                scope["path"],
+                stats.count,
+                stats.duration * 1000,
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "queries": stats.count,
+                    "db_duration": stats.duration,
+                    "repeated_queries": stats.get_repeated(),
+                },
+            )
+
+        if self.query_budget is not None:
+            stats.check_budget(self.query_budget)
+
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "text/*",
+    "application/json",
+    "application/*+json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/javascript",
+    "image/svg+xml",
+)
+
+
+class CompressionMiddleware:
+    """
+    Compresses the responses whose content type matches any of the `content_types` patterns with
+    the encoding the client accepts (`Accept-Encoding`), picking the first of `encodings` among the
+    ones with the highest quality. `levels` overrides the compression level of the encodings.
+
+    Bodies sent at once are compressed at once, unless smaller than `minimum_size` bytes since
+    compressing them barely saves anything. Streaming responses (several body messages) are
+    compressed chunk by chunk, each one flushed so clients keep receiving them as they are produced.
+    Responses already encoded, or marked `Cache-Control: no-transform`, are left untouched.
+
+    Raises:
+        ImproperlyConfigured: If any encoding is unknown or its library is not installed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        encodings: Sequence[str] = ("gzip",),
+        minimum_size: int = 1024,
+        content_types: Sequence[str] = COMPRESSIBLE_CONTENT_TYPES,
+        levels: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        self.app = app
+        self.codecs = [get_codec(encoding, (levels or {}).get(encoding)) for encoding in encodings]
+        self.minimum_size = minimum_size
+        self.content_types = content_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.codecs:
+            await self.app(scope, receive, send)
+            return
+
+        codec = self.negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        responder = CompressionResponder(self, codec, send)
+        await self.app(scope, receive, responder.send)
+
+    def negotiate(self, accept_encoding: str) -> Optional[Codec]:
+        accepted = parse_accept_encoding(accept_encoding)
+        best_codec, best_quality = None, 0.0
+        for codec in self.codecs:
+            quality = accepted.get(codec.encoding, accepted.get("*", 0.0))
+            if quality > best_quality:
+                best_codec, best_quality = codec, quality
+        return best_codec
+
+    def is_compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+            return False
+        content_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+        return any(fnmatch(content_type, pattern) for pattern in self.content_types)
+
+
+class CompressionResponder:
+    """Compresses the response of a single request on behalf of `CompressionMiddleware`."""
+
+    def __init__(self, middleware: CompressionMiddleware, codec: Optional[Codec], send: Send) -> None:
+        self.middleware = middleware
+        self.codec = codec
+        self._send = send
+        self.pending: Optional[tuple[Message, Codec]] = None
+        self.compressor: Optional[Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self._send(message)
+        elif message["type"] == "http.response.start":
+            await self.start(message)
+        elif self.compressor is not None:
+            body = self.compressor.compress(message.get("body", b""))
+            more_body = message.get("more_body", False)
+            if not more_body:
+                body += self.compressor.finish()
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+        elif self.pending is not None:
+            await self.first_body(message, *self.pending)
+
+    async def start(self, message: Message) -> None:
+        headers = MutableHeaders(scope=message)
+        if message["status"] in (204, 304) or not self.middleware.is_compressible(headers):
+            self.passthrough = True
+            await self._send(message)
+            return
+
+        # NOTE: Whatever the outcome, the representation depends on the `Accept-Encoding` header
+        headers.add_vary_header("Accept-Encoding")
+        content_length = headers.get("content-length")
+        is_small = content_length is not None and int(content_length) < self.middleware.minimum_size
+        if self.codec is None or is_small:
+            self.passthrough = True
+            await self._send(message)
+            return
+
+        # NOTE: Held until the first body chunk tells whether the response is streamed and its size
+        self.pending = (message, self.codec)
+
+    async def first_body(self, message: Message, start_message: Message, codec: Codec) -> None:
+        headers = MutableHeaders(scope=start_message)
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not more_body and len(body) < self.middleware.minimum_size:
+            self.passthrough = True
+            await self._send(start_message)
+            await self._send(message)
+            return
+
+        headers["Content-Encoding"] = codec.encoding
+        # NOTE: Strong ETags state byte-for-byte equality, no longer true once encoded
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+        if more_body:
+            del headers["Content-Length"]
+            self.compressor = codec.compressor()
+            body = self.compressor.compress(body)
+        else:
+            body = codec.compress(body)
+            headers["Content-Length"] = str(len(body))
+
+        await self._send(start_message)
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
@@ -1,9 +1,12 @@
-from .core import LimitOffsetPagination, PageNumberPagination
-from .schemas import LimitOffsetSchema, PageNumberSchema
+from .core import CountStrategy, CursorPagination, LimitOffsetPagination, PageNumberPagination
+from .schemas import CursorSchema, LimitOffsetSchema, PageNumberSchema
 
 __all__ = [
+    "CountStrategy",
     "PageNumberPagination",
     "LimitOffsetPagination",
+    "CursorPagination",
     "PageNumberSchema",
     "LimitOffsetSchema",
+    "CursorSchema",
 ]
@@ -1,8 +1,34 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from enum import Enum
 from math import ceil
-from typing import Any, Optional, Protocol
+from typing import Any, Hashable, Mapping, Optional, Protocol, Sequence, Type, TypeVar, Union
 
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    Engine,
+    Select,
+    and_,
+    asc,
+    desc,
+    func,
+    inspect,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Query
 
+from utils.cache import TTLCache
+from utils.exceptions.client import BadRequestException
+
+QueryType = TypeVar("QueryType", bound=Union[Query[DeclarativeBase], Select[tuple[DeclarativeBase]]])
+
 
 class PageNumberSchemaProtocol(Protocol):  # pragma: no cover
     page: Optional[int]
@@ -14,70 +40,422 @@ class LimitOffsetSchemaProtocol(Protocol):  # pragma: no cover
     offset: Optional[int]
 
 
+class CursorSchemaProtocol(Protocol):  # pragma: no cover
+    cursor: Optional[str]
+    page_size: Optional[int]
+
+
+class CountStrategy(str, Enum):
+    """
+    How paginators figure out the total amount of rows matching the query.
+
+    - `exact`: Runs a `COUNT(*)` over the whole (unpaginated) query.
+    - `skip`: No count at all. One extra row is fetched to tell whether there is a next page.
+    - `estimated`: Reads the planner row estimate (PostgreSQL only, otherwise `exact`).
+    - `cached`: `exact` count cached per normalized query (filters included) for a TTL.
+    """
+
+    EXACT = "exact"
+    SKIP = "skip"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+
+
+# NOTE: Shared across paginators (and requests) so `CountStrategy.CACHED` counts outlive a single request
+count_cache: TTLCache[int] = TTLCache(maxsize=1024, ttl=60)
+
+
 class BasePagination:
+    count: Optional[int] = None
+    has_next: Optional[bool] = None
+
+    def __init__(
+        self,
+        *,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        count_cache: TTLCache[int] = count_cache,
+    ) -> None:
+        self.count_strategy = count_strategy
+        self.count_cache = count_cache
+
     def paginate_queryset(self, query: Query[DeclarativeBase]) -> Query[DeclarativeBase]:  # pragma: no cover
         raise NotImplementedError("paginate_queryset() must be implemented.")
 
+    async def apaginate_queryset(  # pragma: no cover
+        self, query: Select[tuple[DeclarativeBase]], *, session: AsyncSession
+    ) -> Select[tuple[DeclarativeBase]]:
+        raise NotImplementedError("apaginate_queryset() must be implemented.")
+
+    def paginate_results(self, results: list[Any]) -> list[Any]:
+        """Hook to post-process the fetched rows of the paginated query."""
+        return results
+
+    def count_queryset(self, query: Query[DeclarativeBase]) -> Optional[int]:
+        """Counts the rows of the (unpaginated) query following `count_strategy`."""
+        if self.count_strategy is CountStrategy.SKIP:
+            return None
+
+        if self.count_strategy is CountStrategy.ESTIMATED:
+            explain = get_explain_statement(query.statement, query.session.get_bind())
+            if explain is not None:
+                return parse_explain_rows(query.session.connection().exec_driver_sql(explain).scalar())
+
+        if self.count_strategy is CountStrategy.CACHED:
+            key = get_count_cache_key(query.statement)
+            count = self.count_cache.get(key)
+            if count is None:
+                count = query.count()
+                self.count_cache.set(key, count)
+            return count
+
+        return query.count()
+
+    async def acount_queryset(
+        self, query: Select[tuple[DeclarativeBase]], *, session: AsyncSession
+    ) -> Optional[int]:
+        """Async counterpart of `count_queryset()`."""
+        if self.count_strategy is CountStrategy.SKIP:
+            return None
+
+        if self.count_strategy is CountStrategy.ESTIMATED:
+            explain = get_explain_statement(query, session.get_bind())
+            if explain is not None:
+                connection = await session.connection()
+                return parse_explain_rows((await connection.exec_driver_sql(explain)).scalar())
+
+        if self.count_strategy is CountStrategy.CACHED:
+            key = get_count_cache_key(query)
+            count = self.count_cache.get(key)
+            if count is None:
+                count = await self.acount(query, session=session)
+                self.count_cache.set(key, count)
+            return count
+
+        return await self.acount(query, session=session)
+
+    @staticmethod
+    async def acount(query: Select[tuple[DeclarativeBase]], *, session: AsyncSession) -> int:
+        """Async counterpart of `Query.count()` for `Select` statements."""
+        count = await session.scalar(select(func.count()).select_from(query.subquery()))
+        return count or 0
+
+    def get_limit(self, limit: int) -> int:
+        """Fetches one extra row to tell whether there is a next page when the count is skipped."""
+        return limit + 1 if self.count_strategy is CountStrategy.SKIP else limit
+
+    def trim_results(self, results: list[Any], limit: int) -> list[Any]:
+        if self.count_strategy is CountStrategy.SKIP:
+            self.has_next = len(results) > limit
+            return results[:limit]
+        return results
+
     def get_paginated_response_data(self, results: list[dict[str, Any]]) -> dict[str, Any]:
         data: dict[str, Any] = {"data": results}
         if pagination := self.get_pagination_properties():
             data["pagination"] = pagination
         return data
 
-    def get_pagination_properties(self) -> dict[str, Optional[int]]:  # pragma: no cover
+    def get_pagination_properties(self) -> dict[str, Any]:  # pragma: no cover
         raise NotImplementedError("get_pagination_properties() must be implemented.")
 
+    def get_cache_key(self) -> Hashable:  # pragma: no cover
+        """Normalized pagination parameters, e.g. to cache the results of the paginated query."""
+        raise NotImplementedError("get_cache_key() must be implemented.")
+
+    def get_cache_state(self) -> dict[str, Any]:
+        """State gathered while paginating, restored by `set_cache_state()` along the cached results."""
+        return {"count": self.count, "has_next": self.has_next}
+
+    def set_cache_state(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
 
 class PageNumberPagination(BasePagination):
-    count: int
     page: Optional[int]
     page_size: Optional[int]
 
-    def __init__(self, schema: PageNumberSchemaProtocol) -> None:
+    def __init__(self, schema: PageNumberSchemaProtocol, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
         self.page = schema.page
         self.page_size = schema.page_size
 
     def paginate_queryset(self, query: Query[DeclarativeBase]) -> Query[DeclarativeBase]:
         if self.page and self.page_size:
-            offset = (self.page - 1) * self.page_size
-            query = query.limit(self.page_size).offset(offset)
+            self.count = self.count_queryset(query)
+            query = self._paginate(query, self.page, self.page_size)
+        return query
 
-        self.count = query.count()
+    async def apaginate_queryset(
+        self, query: Select[tuple[DeclarativeBase]], *, session: AsyncSession
+    ) -> Select[tuple[DeclarativeBase]]:
+        if self.page and self.page_size:
+            self.count = await self.acount_queryset(query, session=session)
+            query = self._paginate(query, self.page, self.page_size)
         return query
 
-    def get_pagination_properties(self) -> dict[str, Optional[int]]:
+    def get_cache_key(self) -> Hashable:
+        return ("page", self.count_strategy.value, self.page, self.page_size)
+
+    def _paginate(self, query: QueryType, page: int, page_size: int) -> QueryType:
+        offset = (page - 1) * page_size
+        return query.limit(self.get_limit(page_size)).offset(offset)  # type: ignore[return-value]
+
+    def paginate_results(self, results: list[Any]) -> list[Any]:
+        if self.page and self.page_size:
+            return self.trim_results(results, self.page_size)
+        return results
+
+    def get_pagination_properties(self) -> dict[str, Any]:
         # TODO: Consider adding `links` property/object to follow JSON API references.
         if self.page is None or self.page_size is None:
             return {}
 
-        total_pages = int(ceil(self.count / float(self.page_size)))
+        total_pages = int(ceil(self.count / float(self.page_size))) if self.count is not None else None
+        has_next = self.page < total_pages if total_pages is not None else self.has_next
         pagination_properties: dict[str, Optional[int]] = {
             "count": self.count,
             "page": self.page,
             "page_size": self.page_size,
             "previous_page": self.page - 1 if self.page > 1 else None,
             "total_pages": total_pages if total_pages else None,
-            "next_page": self.page + 1 if self.page < total_pages else None,
+            "next_page": self.page + 1 if has_next else None,
         }
         return {prop: val for prop, val in pagination_properties.items() if val}
 
 
 class LimitOffsetPagination(BasePagination):
-    count: int
     offset: Optional[int]
     limit: Optional[int]
 
-    def __init__(self, schema: LimitOffsetSchemaProtocol) -> None:
+    def __init__(self, schema: LimitOffsetSchemaProtocol, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
         self.offset = schema.offset
         self.limit = schema.limit
 
     def paginate_queryset(self, query: Query[DeclarativeBase]) -> Query[DeclarativeBase]:
-        query = query.offset(self.offset).limit(self.limit)
-        self.count = query.count()
-        return query
+        if self.offset is None and self.limit is None:
+            return query
+        self.count = self.count_queryset(query)
+        return self._paginate(query)
+
+    async def apaginate_queryset(
+        self, query: Select[tuple[DeclarativeBase]], *, session: AsyncSession
+    ) -> Select[tuple[DeclarativeBase]]:
+        if self.offset is None and self.limit is None:
+            return query
+        self.count = await self.acount_queryset(query, session=session)
+        return self._paginate(query)
+
+    def get_cache_key(self) -> Hashable:
+        return ("limit_offset", self.count_strategy.value, self.limit, self.offset)
+
+    def _paginate(self, query: QueryType) -> QueryType:
+        limit = self.get_limit(self.limit) if self.limit is not None else None
+        return query.offset(self.offset).limit(limit)  # type: ignore[return-value]
+
+    def paginate_results(self, results: list[Any]) -> list[Any]:
+        if self.limit is not None:
+            return self.trim_results(results, self.limit)
+        return results
 
-    def get_pagination_properties(self) -> dict[str, Optional[int]]:
+    def get_pagination_properties(self) -> dict[str, Any]:
         # TODO: Consider adding `links` property/object to follow JSON API references.
         if self.offset is None and self.limit is None:
             return {}
+        if self.count_strategy is CountStrategy.SKIP:
+            return {"limit": self.limit, "offset": self.offset, "has_next": self.has_next}
         return {"count": self.count, "limit": self.limit, "offset": self.offset}
+
+
+class CursorPagination(BasePagination):
+    """
+    Keyset (a.k.a. seek) pagination.
+
+    Rather than skipping `OFFSET` rows, every page is fetched with a `WHERE` clause seeking
+    past the last row of the previous page, hence fetching page 5000 costs the same as page 1
+    as long as the ordering is backed by an index.
+
+    The ordering columns are the provided `ordering` fields of the model (e.g. the validated
+    `BaseFilterManager.ordering`), descending when prefixed by `-`, the model primary key being
+    appended as tiebreaker. They replace the query `ORDER BY`, and are expected to be non-nullable.
+
+    Cursors are opaque url-safe strings containing the ordering values of the boundary row,
+    and whether they point forward or backward.
+    """
+
+    page_size: Optional[int]
+    cursor: Optional[str]
+    next_cursor: Optional[str]
+    previous_cursor: Optional[str]
+
+    def __init__(
+        self,
+        schema: CursorSchemaProtocol,
+        *,
+        model: Type[DeclarativeBase],
+        ordering: Optional[Sequence[str]] = None,
+    ) -> None:
+        super().__init__(count_strategy=CountStrategy.SKIP)
+        self.model = model
+        self.ordering = ordering
+        self.cursor = schema.cursor
+        self.page_size = schema.page_size
+        self.next_cursor = None
+        self.previous_cursor = None
+        self._keys: list[str] = []
+        self._values: Optional[list[Any]] = None
+        self._reverse = False
+        if self.cursor is not None:
+            self._values, self._reverse = self.decode_cursor(self.cursor)
+
+    def paginate_queryset(self, query: Query[DeclarativeBase]) -> Query[DeclarativeBase]:
+        return self._paginate(query)
+
+    async def apaginate_queryset(
+        self, query: Select[tuple[DeclarativeBase]], *, session: AsyncSession
+    ) -> Select[tuple[DeclarativeBase]]:
+        return self._paginate(query)
+
+    def paginate_results(self, results: list[Any]) -> list[Any]:
+        if self.page_size is None:
+            return results
+
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if self._reverse:
+            results.reverse()
+
+        has_next = self._reverse or has_more
+        has_previous = has_more if self._reverse else self._values is not None
+        if results and has_next:
+            self.next_cursor = self.encode_cursor(self._get_row_values(results[-1]), reverse=False)
+        if results and has_previous:
+            self.previous_cursor = self.encode_cursor(self._get_row_values(results[0]), reverse=True)
+        return results
+
+    def get_cache_key(self) -> Hashable:
+        return ("cursor", self.cursor, self.page_size)
+
+    def get_cache_state(self) -> dict[str, Any]:
+        return {"next_cursor": self.next_cursor, "previous_cursor": self.previous_cursor}
+
+    def get_pagination_properties(self) -> dict[str, Any]:
+        if self.page_size is None:
+            return {}
+        pagination_properties = {
+            "page_size": self.page_size,
+            "next": self.next_cursor,
+            "previous": self.previous_cursor,
+        }
+        return {prop: val for prop, val in pagination_properties.items() if val}
+
+    def _paginate(self, query: QueryType) -> QueryType:
+        if self.page_size is None:
+            return query
+
+        orderings = self._get_orderings()
+        self._keys = [column.key for column, _ in orderings]  # type: ignore[misc]
+
+        if self._values is not None:
+            if len(self._values) != len(orderings):
+                raise BadRequestException(detail="Cursor does not match the requested ordering")
+            seek_condition = self._get_seek_condition(orderings, self._values)
+            query = query.filter(seek_condition)  # type: ignore[assignment]
+
+        order_by = [desc(col) if is_desc != self._reverse else asc(col) for col, is_desc in orderings]
+        query = query.order_by(None).order_by(*order_by)  # type: ignore[assignment]
+        # NOTE: One extra row tells whether there is a page beyond this one
+        return query.limit(self.page_size + 1)  # type: ignore[return-value]
+
+    def _get_orderings(self) -> list[tuple[Any, bool]]:
+        orderings = [
+            (getattr(self.model, field.lstrip("+-")), field.startswith("-")) for field in self.ordering or []
+        ]
+        mapper = inspect(self.model)
+        for primary_key in mapper.primary_key:
+            key = mapper.get_property_by_column(primary_key).key
+            if not any(column.key == key for column, _ in orderings):
+                orderings.append((getattr(self.model, key), orderings[-1][1] if orderings else False))
+        return orderings
+
+    def _get_seek_condition(
+        self, orderings: list[tuple[ColumnElement[Any], bool]], values: list[Any]
+    ) -> ColumnElement[bool]:
+        values = [self._coerce_value(column, value) for (column, _), value in zip(orderings, values)]
+        directions = {is_desc != self._reverse for _, is_desc in orderings}
+        if len(directions) == 1:
+            columns = tuple_(*[column for column, _ in orderings])
+            return columns < tuple_(*values) if directions.pop() else columns > tuple_(*values)
+
+        # NOTE: Expanded form of the row-value comparison `(a, b) > (:a, :b)`, which cannot
+        # express mixed ASC/DESC orderings
+        conditions: list[ColumnElement[bool]] = []
+        for index, (column, is_desc) in enumerate(orderings):
+            seek = column < values[index] if is_desc != self._reverse else column > values[index]
+            equals = [col == val for (col, _), val in zip(orderings[:index], values)]
+            conditions.append(and_(*equals, seek))
+
+        # NOTE: Redundant range on the leading column so the planner can seek through its index
+        leading_column, is_desc = orderings[0]
+        bound = leading_column <= values[0] if is_desc != self._reverse else leading_column >= values[0]
+        return and_(bound, or_(*conditions))
+
+    @staticmethod
+    def _coerce_value(column: ColumnElement[Any], value: Any) -> Any:
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:  # pragma: no cover
+            return value
+        if isinstance(value, str) and python_type in (datetime, date):
+            return python_type.fromisoformat(value)
+        return value
+
+    def _get_row_values(self, row: Any) -> list[Any]:
+        if isinstance(row, Mapping):
+            return [row[key] for key in self._keys]
+        return [getattr(row, key) for key in self._keys]
+
+    @staticmethod
+    def encode_cursor(values: list[Any], *, reverse: bool) -> str:
+        payload = json.dumps({"v": values, "r": reverse}, default=_json_default, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[list[Any], bool]:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return list(payload["v"]), bool(payload["r"])
+        except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+            raise BadRequestException(detail="Invalid cursor") from exc
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not cursor serializable")
+
+
+def get_count_cache_key(query: Select[tuple[DeclarativeBase]]) -> tuple[str, str]:
+    """Normalized cache key of a query: its SQL along with its (sorted) bound values."""
+    compiled = query.compile()
+    return str(compiled), repr(sorted(compiled.params.items()))
+
+
+def get_explain_statement(
+    query: Select[tuple[DeclarativeBase]], bind: Union[Engine, Connection]
+) -> Optional[str]:
+    """`EXPLAIN` statement to read the planner row estimate from, if supported by the dialect."""
+    if bind.dialect.name != "postgresql":
+        return None
+    try:
+        compiled = query.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True})
+    except CompileError:
+        return None
+    return f"EXPLAIN (FORMAT JSON) {compiled}"
+
+
+def parse_explain_rows(plan: Any) -> int:
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
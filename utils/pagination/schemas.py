@@ -1,38 +1,78 @@
 from typing import Any, Optional
 
 from fastapi import param_functions
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
 MAX_PAGE_SIZE = 100
 
 
 class PageNumberSchema(BaseModel):
-    page: Optional[int] = param_functions.Query(None, gt=0, description="Page current location", alias="p")
+    # NOTE: Query params are received by their short alias, while code builds the schemas by field name
+    model_config = ConfigDict(populate_by_name=True)
+
+    page: Optional[int] = param_functions.Query(
+        None, gt=0, description="Page current location", alias="p", validation_alias="p"
+    )
     page_size: Optional[int] = param_functions.Query(
-        None, gt=0, le=MAX_PAGE_SIZE, description="Page size fetched elements", alias="s"
+        None,
+        gt=0,
+        le=MAX_PAGE_SIZE,
+        description="Page size fetched elements",
+        alias="s",
+        validation_alias="s",
     )
 
     @model_validator(mode="before")
     @classmethod
     def check_both_fields_set(cls, values: dict[str, Any]) -> dict[str, Any]:
-        page = values.get("page")
-        page_size = values.get("page_size")
+        page = values.get("page", values.get("p"))
+        page_size = values.get("page_size", values.get("s"))
         if (page is None and page_size) or (page_size is None and page):
             raise ValueError("Attributes `page` and `page_size` should be either declared or omitted.")
         return values
 
 
 class LimitOffsetSchema(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
     limit: Optional[int] = param_functions.Query(
-        None, gt=0, le=MAX_PAGE_SIZE, description="Limit selection", alias="l"
+        None, gt=0, le=MAX_PAGE_SIZE, description="Limit selection", alias="l", validation_alias="l"
+    )
+    offset: Optional[int] = param_functions.Query(
+        None, gt=0, description="Offset selection", alias="o", validation_alias="o"
     )
-    offset: Optional[int] = param_functions.Query(None, gt=0, description="Offset selection", alias="o")
 
     @model_validator(mode="before")
     @classmethod
     def check_both_fields_set(cls, values: dict[str, Any]) -> dict[str, Any]:
-        limit = values.get("limit")
-        offset = values.get("offset")
+        limit = values.get("limit", values.get("l"))
+        offset = values.get("offset", values.get("o"))
         if (limit is None and offset) or (offset is None and limit):
             raise ValueError("Attributes `limit` and `offset` should be either declared or omitted.")
         return values
+
+
+class CursorSchema(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    cursor: Optional[str] = param_functions.Query(
+        None,
+        description="Opaque cursor pointing to the next/previous page",
+        alias="c",
+        validation_alias="c",
+    )
+    page_size: Optional[int] = param_functions.Query(
+        None,
+        gt=0,
+        le=MAX_PAGE_SIZE,
+        description="Page size fetched elements",
+        alias="s",
+        validation_alias="s",
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def check_page_size_set(cls, values: dict[str, Any]) -> dict[str, Any]:
+        if values.get("cursor", values.get("c")) and values.get("page_size", values.get("s")) is None:
+            raise ValueError("Attribute `page_size` should be declared along with `cursor`.")
+        return values
@@ -1,8 +1,23 @@
-from .core import BaseErrorResponse, DatabaseErrorResponse, NotFoundErrorResponse, TimeoutErrorResponse
+from .core import (
+    BaseErrorResponse,
+    CSVStreamingResponse,
+    DatabaseErrorResponse,
+    NDJSONStreamingResponse,
+    NotFoundErrorResponse,
+    ORJSONResponse,
+    RowsJSONResponse,
+    RowsStreamingResponse,
+    TimeoutErrorResponse,
+)
 
 __all__ = [
     "BaseErrorResponse",
+    "CSVStreamingResponse",
     "DatabaseErrorResponse",
+    "NDJSONStreamingResponse",
     "NotFoundErrorResponse",
+    "ORJSONResponse",
+    "RowsJSONResponse",
+    "RowsStreamingResponse",
     "TimeoutErrorResponse",
 ]
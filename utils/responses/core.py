@@ -5,10 +5,33 @@ This module provides custom responses for applications.
 It allows for more specific error handling and detailed error responses.
 """
 
-from typing import Any, Optional
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Mapping
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Optional, Union
+from uuid import UUID
 
+import orjson
+from starlette.concurrency import iterate_in_threadpool
+from starlette.responses import StreamingResponse
 
-class BaseErrorResponse(JSONResponse):
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered by `orjson`, meant to be the application's `default_response_class`.
+
+    Besides the types natively supported by `orjson` (e.g., datetimes, UUIDs, enums), it renders
+    mappings such as `RowMapping`s and decimals.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class BaseErrorResponse(ORJSONResponse):
     """
     Base class for custom HTTP responses in FastAPI/Starlette applications.
     """
@@ -59,3 +82,92 @@ class DatabaseErrorResponse(BaseErrorResponse):
 
     status_code = 500
     detail = "Could not connect or perform the operation to the database"
+
+
+class RowsJSONResponse(ORJSONResponse):
+    """
+    Renders read-only rows (e.g., the `RowMapping`s returned by `list_mappings`) straight away.
+
+    Returning it from a route skips FastAPI's `jsonable_encoder`, whose value by value walk
+    dominates the cost of serializing large listings.
+    """
+
+
+class RowsStreamingResponse(StreamingResponse):
+    """
+    Base class streaming rows (e.g., the ones yielded by `stream_mappings`) in chunks of about
+    `buffer_size` bytes, so neither the rows nor the rendered body are ever held in memory at once.
+
+    Sync iterables are consumed within the threadpool, as fetching them may block.
+    Subclasses define how every row is written into the buffer.
+    """
+
+    def __init__(
+        self,
+        rows: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        *,
+        buffer_size: int = 64 * 1024,
+        **kwargs: Any,
+    ) -> None:
+        if not isinstance(rows, AsyncIterable):
+            rows = iterate_in_threadpool(iter(rows))
+        self.buffer_size = buffer_size
+        super().__init__(self.iter_chunks(rows), **kwargs)
+
+    async def iter_chunks(self, rows: AsyncIterable[Mapping[str, Any]]) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        async for row in rows:
+            self.write_row(buffer, row)
+            if buffer.tell() >= self.buffer_size:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    def write_row(self, buffer: io.StringIO, row: Mapping[str, Any]) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+
+class NDJSONStreamingResponse(RowsStreamingResponse):
+    """
+    Streams rows as newline delimited JSON, one object per line.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def write_row(self, buffer: io.StringIO, row: Mapping[str, Any]) -> None:
+        buffer.write(orjson.dumps(row, default=_json_default).decode("utf-8"))
+        buffer.write("\n")
+
+
+class CSVStreamingResponse(RowsStreamingResponse):
+    """
+    Streams rows as CSV, the header being the keys of the first row.
+    """
+
+    media_type = "text/csv"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._writer: Any = None
+        super().__init__(*args, **kwargs)
+
+    def write_row(self, buffer: io.StringIO, row: Mapping[str, Any]) -> None:
+        if self._writer is None:
+            self._writer = csv.writer(buffer)
+            self._writer.writerow(row.keys())
+        self._writer.writerow(row.values())
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
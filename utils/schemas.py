@@ -0,0 +1,23 @@
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+
+class ReadSchema(BaseModel):
+    """
+    Base class for response models built from SQLAlchemy instances.
+
+    Setting it as the `response_model` of a route lets pydantic-core validate and serialize the
+    returned instances, rather than `jsonable_encoder` reflecting over their attributes.
+    Only the attributes already loaded into the instance are read, so columns left out by a
+    sparse fieldset are neither lazy loaded nor serialized (with `response_model_exclude_unset=True`).
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def loaded_attributes(cls, data: Any) -> Any:
+        if hasattr(data, "_sa_instance_state"):
+            return data.__dict__
+        return data
@@ -1,14 +1,34 @@
-from typing import Any, Generic, Optional, Protocol, TypeVar
+from __future__ import annotations
 
+import hashlib
+import uuid
+from typing import Any, AsyncIterator, Generic, Iterator, Optional, Protocol, Type, TypeVar
+
+from sqlalchemy import RowMapping, inspect
 from sqlalchemy.orm import DeclarativeBase
 
-from .database.repository import FilterManagerProtocol, PaginationManagerProtocol
+from .cache import CacheBackend
+from .database.async_repository import (
+    AsyncFieldsManagerProtocol,
+    AsyncFilterManagerProtocol,
+    AsyncPaginationManagerProtocol,
+)
+from .database.repository import FieldsManagerProtocol, FilterManagerProtocol, PaginationManagerProtocol
 
 RepositoryType = TypeVar("RepositoryType", bound="RepositoryProtocol")
+AsyncRepositoryType = TypeVar("AsyncRepositoryType", bound="AsyncRepositoryProtocol")
 
 
 class RepositoryProtocol(Protocol):  # pragma: no cover
-    def retrieve_by_id(self, *, id: int) -> DeclarativeBase:
+    def get_model(self) -> Type[DeclarativeBase]:
+        pass
+
+    def get_scope(self) -> dict[str, Any]:
+        pass
+
+    def retrieve_by_id(
+        self, *, id: int, fields_manager: Optional[FieldsManagerProtocol] = None
+    ) -> DeclarativeBase:
         pass
 
     def retrieve(self, **filters: Any) -> DeclarativeBase:
@@ -19,10 +39,31 @@ class RepositoryProtocol(Protocol):  # pragma: no cover
         *,
         filter_manager: Optional[FilterManagerProtocol] = None,
         pagination_manager: Optional[PaginationManagerProtocol] = None,
+        fields_manager: Optional[FieldsManagerProtocol] = None,
         **filters: Any,
     ) -> list[DeclarativeBase]:
         pass
 
+    def list_mappings(
+        self,
+        *,
+        filter_manager: Optional[FilterManagerProtocol] = None,
+        pagination_manager: Optional[PaginationManagerProtocol] = None,
+        fields_manager: Optional[FieldsManagerProtocol] = None,
+        **filters: Any,
+    ) -> list[RowMapping]:
+        pass
+
+    def stream_mappings(
+        self,
+        *,
+        filter_manager: Optional[FilterManagerProtocol] = None,
+        fields_manager: Optional[FieldsManagerProtocol] = None,
+        chunk_size: int = 1000,
+        **filters: Any,
+    ) -> Iterator[RowMapping]:
+        pass
+
     def create(self, *, entity: dict[str, Any]) -> DeclarativeBase:
         pass
 
@@ -32,13 +73,234 @@ class RepositoryProtocol(Protocol):  # pragma: no cover
     def destroy(self, *, id: int) -> None:
         pass
 
+    def bulk_create(self, *, entities: list[dict[str, Any]]) -> list[DeclarativeBase]:
+        pass
+
+    def bulk_update(self, *, entities: list[dict[str, Any]]) -> list[int]:
+        pass
+
+    def bulk_destroy(self, *, ids: list[int]) -> list[int]:
+        pass
+
+    def perform_commit(self) -> None:
+        pass
+
+
+class AsyncRepositoryProtocol(Protocol):  # pragma: no cover
+    def get_model(self) -> Type[DeclarativeBase]:
+        pass
+
+    def get_scope(self) -> dict[str, Any]:
+        pass
+
+    async def retrieve_by_id(
+        self, *, id: int, fields_manager: Optional[AsyncFieldsManagerProtocol] = None
+    ) -> DeclarativeBase:
+        pass
+
+    async def retrieve(self, **filters: Any) -> DeclarativeBase:
+        pass
+
+    async def list(
+        self,
+        *,
+        filter_manager: Optional[AsyncFilterManagerProtocol] = None,
+        pagination_manager: Optional[AsyncPaginationManagerProtocol] = None,
+        fields_manager: Optional[AsyncFieldsManagerProtocol] = None,
+        **filters: Any,
+    ) -> list[DeclarativeBase]:
+        pass
+
+    async def list_mappings(
+        self,
+        *,
+        filter_manager: Optional[AsyncFilterManagerProtocol] = None,
+        pagination_manager: Optional[AsyncPaginationManagerProtocol] = None,
+        fields_manager: Optional[AsyncFieldsManagerProtocol] = None,
+        **filters: Any,
+    ) -> list[RowMapping]:
+        pass
+
+    def stream_mappings(
+        self,
+        *,
+        filter_manager: Optional[AsyncFilterManagerProtocol] = None,
+        fields_manager: Optional[AsyncFieldsManagerProtocol] = None,
+        chunk_size: int = 1000,
+        **filters: Any,
+    ) -> AsyncIterator[RowMapping]:
+        pass
+
+    async def create(self, *, entity: dict[str, Any]) -> DeclarativeBase:
+        pass
+
+    async def update(self, *, id: int, entity: dict[str, Any]) -> DeclarativeBase:
+        pass
+
+    async def destroy(self, *, id: int) -> None:
+        pass
+
+    async def bulk_create(self, *, entities: list[dict[str, Any]]) -> list[DeclarativeBase]:
+        pass
+
+    async def bulk_update(self, *, entities: list[dict[str, Any]]) -> list[int]:
+        pass
+
+    async def bulk_destroy(self, *, ids: list[int]) -> list[int]:
+        pass
+
+    async def perform_commit(self) -> None:
+        pass
+
+
+class ServiceCache:
+    """
+    Caches the reads of services (`get_by_id`, `list` and `list_mappings`) into a `CacheBackend`,
+    keyed by model + id, or by model + the normalized filters, ordering, pagination and fields.
+
+    Every key embeds a version token of its model, replaced by `invalidate()` on every write, so all
+    the entries of the model become unreachable at once and age out of the backend. Lost tokens
+    (evicted or expired) are replaced too, hence stale entries are never served. Sharing the backend
+    (e.g., Redis) shares the invalidations across processes.
+
+    Entries are plain column values: ORM instances are rebuilt detached from any session,
+    and pagination managers get back the state gathered while paginating (e.g., `count`).
+    Reads whose managers cannot be normalized (no `get_cache_key()`) are not cached.
+    """
+
+    def __init__(
+        self, backend: CacheBackend, *, ttl: Optional[float] = None, prefix: str = "service"
+    ) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_version(self, model: Type[DeclarativeBase]) -> str:
+        key = f"{self.prefix}:{model.__tablename__}:version"
+        version: Optional[str] = self.backend.get(key)
+        if version is None:
+            version = uuid.uuid4().hex
+            self.backend.set(key, version)
+        return version
+
+    def invalidate(self, model: Type[DeclarativeBase]) -> None:
+        self.invalidations += 1
+        self.backend.set(f"{self.prefix}:{model.__tablename__}:version", uuid.uuid4().hex)
+
+    def get_key(
+        self, model: Type[DeclarativeBase], operation: str, *managers: Any, **filters: Any
+    ) -> Optional[str]:
+        """
+        Returns:
+            Optional[str]: The key of the read, `None` when any of its managers cannot be normalized.
+        """
+        parts: list[Any] = [sorted((key, repr(value)) for key, value in filters.items())]
+        for manager in managers:
+            if manager is not None and not hasattr(manager, "get_cache_key"):
+                return None
+            parts.append(manager.get_cache_key() if manager is not None else None)
+
+        digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+        return f"{self.prefix}:{model.__tablename__}:{self.get_version(model)}:{operation}:{digest}"
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.backend.set(key, value, ttl=self.ttl)
+
+    @staticmethod
+    def dump_instance(instance: DeclarativeBase) -> dict[str, Any]:
+        state = inspect(instance)
+        return {key: state.dict[key] for key in state.mapper.column_attrs.keys() if key in state.dict}
+
+    @staticmethod
+    def load_instance(model: Type[DeclarativeBase], data: dict[str, Any]) -> DeclarativeBase:
+        instance = inspect(model).class_manager.new_instance()
+        # NOTE: As when loaded from a row, values within `__dict__` are the loaded (unmodified) ones
+        instance.__dict__.update(data)
+        return instance
+
+    def get_instance(self, key: Optional[str], model: Type[DeclarativeBase]) -> Optional[DeclarativeBase]:
+        data = self.get(key) if key is not None else None
+        return self.load_instance(model, data) if data is not None else None
+
+    def set_instance(self, key: Optional[str], instance: DeclarativeBase) -> None:
+        if key is not None:
+            self.set(key, self.dump_instance(instance))
+
+    def get_results(
+        self,
+        key: Optional[str],
+        model: Type[DeclarativeBase],
+        pagination_manager: Any,
+        *,
+        mappings: bool = False,
+    ) -> Optional[list[Any]]:
+        entry = self.get(key) if key is not None else None
+        if entry is None:
+            return None
+
+        rows, state = entry
+        if pagination_manager is not None:
+            pagination_manager.set_cache_state(state)
+        # NOTE: Copies, so callers cannot alter the cached rows
+        return [dict(row) if mappings else self.load_instance(model, row) for row in rows]
+
+    def set_results(
+        self, key: Optional[str], results: list[Any], pagination_manager: Any, *, mappings: bool = False
+    ) -> None:
+        if key is None:
+            return
+        rows = [dict(row) if mappings else self.dump_instance(row) for row in results]
+        state = pagination_manager.get_cache_state() if pagination_manager is not None else None
+        self.set(key, (rows, state))
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "backend": self.backend.get_stats(),
+        }
+
 
 class BaseService(Generic[RepositoryType]):
-    def __init__(self, *, repository: RepositoryType):
+    """
+    Business logic on top of a repository.
+
+    When a `ServiceCache` is provided, `get_by_id`, `list` and `list_mappings` are served from it,
+    and every write made through the service invalidates the cached reads of the repository model.
+
+    Writes are committed by the service (bulk ones as a whole), and only then invalidate the cache:
+    invalidated earlier, concurrent reads could cache uncommitted rows, or rows later rolled back.
+    """
+
+    def __init__(self, *, repository: RepositoryType, cache: Optional[ServiceCache] = None):
         self.repository = repository
+        self.cache = cache
 
-    def get_by_id(self, *, id: int) -> DeclarativeBase:
-        return self.repository.retrieve_by_id(id=id)
+    def get_by_id(
+        self, *, id: int, fields_manager: Optional[FieldsManagerProtocol] = None
+    ) -> DeclarativeBase:
+        if self.cache is None:
+            return self.repository.retrieve_by_id(id=id, fields_manager=fields_manager)
+
+        model = self.repository.get_model()
+        key = self.get_scoped_key(model, "id", fields_manager, id=id)
+        instance = self.cache.get_instance(key, model)
+        if instance is None:
+            instance = self.repository.retrieve_by_id(id=id, fields_manager=fields_manager)
+            self.cache.set_instance(key, instance)
+        return instance
 
     def get(self, **filters: Any) -> DeclarativeBase:
         return self.repository.retrieve(**filters)
@@ -47,17 +309,267 @@ class BaseService(Generic[RepositoryType]):
         self,
         filter_manager: Optional[FilterManagerProtocol] = None,
         pagination_manager: Optional[PaginationManagerProtocol] = None,
+        fields_manager: Optional[FieldsManagerProtocol] = None,
         **filters: Any,
     ) -> list[DeclarativeBase]:
-        return self.repository.list(
-            filter_manager=filter_manager, pagination_manager=pagination_manager, **filters
+        if self.cache is None:
+            return self.repository.list(
+                filter_manager=filter_manager,
+                pagination_manager=pagination_manager,
+                fields_manager=fields_manager,
+                **filters,
+            )
+
+        model = self.repository.get_model()
+        key = self.get_scoped_key(
+            model, "list", filter_manager, pagination_manager, fields_manager, **filters
+        )
+        results = self.cache.get_results(key, model, pagination_manager)
+        if results is None:
+            results = self.repository.list(
+                filter_manager=filter_manager,
+                pagination_manager=pagination_manager,
+                fields_manager=fields_manager,
+                **filters,
+            )
+            self.cache.set_results(key, results, pagination_manager)
+        return results
+
+    def list_mappings(
+        self,
+        filter_manager: Optional[FilterManagerProtocol] = None,
+        pagination_manager: Optional[PaginationManagerProtocol] = None,
+        fields_manager: Optional[FieldsManagerProtocol] = None,
+        **filters: Any,
+    ) -> list[RowMapping]:
+        if self.cache is None:
+            return self.repository.list_mappings(
+                filter_manager=filter_manager,
+                pagination_manager=pagination_manager,
+                fields_manager=fields_manager,
+                **filters,
+            )
+
+        model = self.repository.get_model()
+        key = self.get_scoped_key(
+            model, "list_mappings", filter_manager, pagination_manager, fields_manager, **filters
+        )
+        results = self.cache.get_results(key, model, pagination_manager, mappings=True)
+        if results is None:
+            results = self.repository.list_mappings(
+                filter_manager=filter_manager,
+                pagination_manager=pagination_manager,
+                fields_manager=fields_manager,
+                **filters,
+            )
+            self.cache.set_results(key, results, pagination_manager, mappings=True)
+        return results
+
+    def stream_mappings(
+        self,
+        filter_manager: Optional[FilterManagerProtocol] = None,
+        fields_manager: Optional[FieldsManagerProtocol] = None,
+        chunk_size: int = 1000,
+        **filters: Any,
+    ) -> Iterator[RowMapping]:
+        return self.repository.stream_mappings(
+            filter_manager=filter_manager, fields_manager=fields_manager, chunk_size=chunk_size, **filters
         )
 
     def create(self, *, entity: dict[str, Any]) -> DeclarativeBase:
-        return self.repository.create(entity=entity)
+        instance = self.repository.create(entity=entity)
+        self.repository.perform_commit()
+        self.invalidate_cache()
+        return instance
 
     def update(self, *, id: int, entity: dict[str, Any]) -> DeclarativeBase:
-        return self.repository.update(id=id, entity=entity)
+        instance = self.repository.update(id=id, entity=entity)
+        self.repository.perform_commit()
+        self.invalidate_cache()
+        return instance
 
     def destroy(self, *, id: int) -> None:
-        return self.repository.destroy(id=id)
+        self.repository.destroy(id=id)
+        self.repository.perform_commit()
+        self.invalidate_cache()
+
+    def bulk_create(self, *, entities: list[dict[str, Any]]) -> list[DeclarativeBase]:
+        instances = self.repository.bulk_create(entities=entities)
+        self.repository.perform_commit()
+        self.invalidate_cache()
+        return instances
+
+    def bulk_update(self, *, entities: list[dict[str, Any]]) -> list[int]:
+        updated_ids = self.repository.bulk_update(entities=entities)
+        self.repository.perform_commit()
+        self.invalidate_cache()
+        return updated_ids
+
+    def bulk_destroy(self, *, ids: list[int]) -> list[int]:
+        deleted_ids = self.repository.bulk_destroy(ids=ids)
+        self.repository.perform_commit()
+        self.invalidate_cache()
+        return deleted_ids
+
+    def get_scoped_key(
+        self, model: Type[DeclarativeBase], operation: str, *managers: Any, **filters: Any
+    ) -> Optional[str]:
+        # NOTE: Scoped repositories (e.g., by owner) read different rows for the very same arguments
+        return self.cache.get_key(  # type: ignore[union-attr]
+            model, operation, *managers, **{**filters, **self.repository.get_scope()}
+        )
+
+    def invalidate_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(self.repository.get_model())
+
+
+class AsyncBaseService(Generic[AsyncRepositoryType]):
+    """
+    Business logic on top of a repository.
+
+    When a `ServiceCache` is provided, `get_by_id`, `list` and `list_mappings` are served from it,
+    and every write made through the service invalidates the cached reads of the repository model.
+
+    Writes are committed by the service (bulk ones as a whole), and only then invalidate the cache:
+    invalidated earlier, concurrent reads could cache uncommitted rows, or rows later rolled back.
+    """
+
+    def __init__(self, *, repository: AsyncRepositoryType, cache: Optional[ServiceCache] = None):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_by_id(
+        self, *, id: int, fields_manager: Optional[AsyncFieldsManagerProtocol] = None
+    ) -> DeclarativeBase:
+        if self.cache is None:
+            return await self.repository.retrieve_by_id(id=id, fields_manager=fields_manager)
+
+        model = self.repository.get_model()
+        key = self.get_scoped_key(model, "id", fields_manager, id=id)
+        instance = self.cache.get_instance(key, model)
+        if instance is None:
+            instance = await self.repository.retrieve_by_id(id=id, fields_manager=fields_manager)
+            self.cache.set_instance(key, instance)
+        return instance
+
+    async def get(self, **filters: Any) -> DeclarativeBase:
+        return await self.repository.retrieve(**filters)
+
+    async def list(
+        self,
+        filter_manager: Optional[AsyncFilterManagerProtocol] = None,
+        pagination_manager: Optional[AsyncPaginationManagerProtocol] = None,
+        fields_manager: Optional[AsyncFieldsManagerProtocol] = None,
+        **filters: Any,
+    ) -> list[DeclarativeBase]:
+        if self.cache is None:
+            return await self.repository.list(
+                filter_manager=filter_manager,
+                pagination_manager=pagination_manager,
+                fields_manager=fields_manager,
+                **filters,
+            )
+
+        model = self.repository.get_model()
+        key = self.get_scoped_key(
+            model, "list", filter_manager, pagination_manager, fields_manager, **filters
+        )
+        results = self.cache.get_results(key, model, pagination_manager)
+        if results is None:
+            results = await self.repository.list(
+                filter_manager=filter_manager,
+                pagination_manager=pagination_manager,
+                fields_manager=fields_manager,
+                **filters,
+            )
+            self.cache.set_results(key, results, pagination_manager)
+        return results
+
+    async def list_mappings(
+        self,
+        filter_manager: Optional[AsyncFilterManagerProtocol] = None,
+        pagination_manager: Optional[AsyncPaginationManagerProtocol] = None,
+        fields_manager: Optional[AsyncFieldsManagerProtocol] = None,
+        **filters: Any,
+    ) -> list[RowMapping]:
+        if self.cache is None:
+            return await self.repository.list_mappings(
+                filter_manager=filter_manager,
+                pagination_manager=pagination_manager,
+                fields_manager=fields_manager,
+                **filters,
+            )
+
+        model = self.repository.get_model()
+        key = self.get_scoped_key(
+            model, "list_mappings", filter_manager, pagination_manager, fields_manager, **filters
+        )
+        results = self.cache.get_results(key, model, pagination_manager, mappings=True)
+        if results is None:
+            results = await self.repository.list_mappings(
+                filter_manager=filter_manager,
+                pagination_manager=pagination_manager,
+                fields_manager=fields_manager,
+                **filters,
+            )
+            self.cache.set_results(key, results, pagination_manager, mappings=True)
+        return results
+
+    def stream_mappings(
+        self,
+        filter_manager: Optional[AsyncFilterManagerProtocol] = None,
+        fields_manager: Optional[AsyncFieldsManagerProtocol] = None,
+        chunk_size: int = 1000,
+        **filters: Any,
+    ) -> AsyncIterator[RowMapping]:
+        return self.repository.stream_mappings(
+            filter_manager=filter_manager, fields_manager=fields_manager, chunk_size=chunk_size, **filters
+        )
+
+    async def create(self, *, entity: dict[str, Any]) -> DeclarativeBase:
+        instance = await self.repository.create(entity=entity)
+        await self.repository.perform_commit()
+        self.invalidate_cache()
+        return instance
+
+    async def update(self, *, id: int, entity: dict[str, Any]) -> DeclarativeBase:
+        instance = await self.repository.update(id=id, entity=entity)
+        await self.repository.perform_commit()
+        self.invalidate_cache()
+        return instance
+
+    async def destroy(self, *, id: int) -> None:
+        await self.repository.destroy(id=id)
+        await self.repository.perform_commit()
+        self.invalidate_cache()
+
+    async def bulk_create(self, *, entities: list[dict[str, Any]]) -> list[DeclarativeBase]:
+        instances = await self.repository.bulk_create(entities=entities)
+        await self.repository.perform_commit()
+        self.invalidate_cache()
+        return instances
+
+    async def bulk_update(self, *, entities: list[dict[str, Any]]) -> list[int]:
+        updated_ids = await self.repository.bulk_update(entities=entities)
+        await self.repository.perform_commit()
+        self.invalidate_cache()
+        return updated_ids
+
+    async def bulk_destroy(self, *, ids: list[int]) -> list[int]:
+        deleted_ids = await self.repository.bulk_destroy(ids=ids)
+        await self.repository.perform_commit()
+        self.invalidate_cache()
+        return deleted_ids
+
+    def get_scoped_key(
+        self, model: Type[DeclarativeBase], operation: str, *managers: Any, **filters: Any
+    ) -> Optional[str]:
+        # NOTE: Scoped repositories (e.g., by owner) read different rows for the very same arguments
+        return self.cache.get_key(  # type: ignore[union-attr]
+            model, operation, *managers, **{**filters, **self.repository.get_scope()}
+        )
+
+    def invalidate_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(self.repository.get_model())